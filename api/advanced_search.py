@@ -6,7 +6,7 @@ from http.server import BaseHTTPRequestHandler
 import json
 import requests
 from urllib.parse import urlparse, parse_qs
-from datetime import datetime, timedelta
+import time
 import re
 
 # ZIP to state mapping (partial - would use full database in production)
@@ -154,12 +154,12 @@ CACHE_DURATION = 3600
 def get_cached_or_fetch(cache_key, fetch_func):
     """Simple caching mechanism"""
     if cache_key in cache:
-        cached_data, timestamp = cache[cache_key]
-        if datetime.now() - timestamp < timedelta(seconds=CACHE_DURATION):
+        cached_data, expires_at = cache[cache_key]
+        if time.monotonic() < expires_at:
             return cached_data
     
     data = fetch_func()
-    cache[cache_key] = (data, datetime.now())
+    cache[cache_key] = (data, time.monotonic() + CACHE_DURATION)
     return data
 
 class handler(BaseHTTPRequestHandler):
@@ -7,7 +7,7 @@ from http.server import BaseHTTPRequestHandler
 import json
 import requests
 from urllib.parse import urlparse, parse_qs
-from datetime import datetime, timedelta
+import time
 import csv
 import io
 
@@ -21,12 +21,12 @@ CENSUS_GEOCODER_URL = "https://geocoding.geo.census.gov/geocoder/geographies/add
 def get_cached_or_fetch(cache_key, fetch_func):
     """Simple caching mechanism"""
     if cache_key in cache:
-        cached_data, timestamp = cache[cache_key]
-        if datetime.now() - timestamp < timedelta(seconds=CACHE_DURATION):
+        cached_data, expires_at = cache[cache_key]
+        if time.monotonic() < expires_at:
             return cached_data
     
     data = fetch_func()
-    cache[cache_key] = (data, datetime.now())
+    cache[cache_key] = (data, time.monotonic() + CACHE_DURATION)
     return data
 
 def get_county_from_zip(zip_code):
@@ -7,7 +7,7 @@ from http.server import BaseHTTPRequestHandler
 import json
 import requests
 from urllib.parse import urlparse, parse_qs
-from datetime import datetime, timedelta
+import time
 import sys
 import os
 
@@ -24,19 +24,32 @@ except ImportError:
     def get_cities_in_county(county, state):
         return []
 
+# Shared HTTP session: keeps connections to ProPublica and Zippopotam alive
+# between requests (one pool per host) and asks for compressed payloads
+session = requests.Session()
+session.headers.update({'Accept-Encoding': 'gzip, deflate'})
+
 # Simple cache
 cache = {}
 CACHE_DURATION = 3600
+NEGATIVE_CACHE_DURATION = 60  # Empty/failed lookups, so outages don't cause retry storms
+
+def is_empty_result(data):
+    """True for a failed or empty upstream lookup"""
+    if not data:
+        return True
+    return isinstance(data, dict) and 'organizations' in data and not data['organizations']
 
-def get_cached_or_fetch(cache_key, fetch_func):
-    """Simple caching mechanism"""
+def get_cached_or_fetch(cache_key, fetch_func, negative_ttl=NEGATIVE_CACHE_DURATION):
+    """Simple caching mechanism, with a shorter TTL for empty results"""
     if cache_key in cache:
-        cached_data, timestamp = cache[cache_key]
-        if datetime.now() - timestamp < timedelta(seconds=CACHE_DURATION):
+        cached_data, expires_at = cache[cache_key]
+        if time.monotonic() < expires_at:
             return cached_data
     
     data = fetch_func()
-    cache[cache_key] = (data, datetime.now())
+    ttl = negative_ttl if is_empty_result(data) else CACHE_DURATION
+    cache[cache_key] = (data, time.monotonic() + ttl)
     return data
 
 class handler(BaseHTTPRequestHandler):
@@ -102,7 +115,7 @@ class handler(BaseHTTPRequestHandler):
             params = {'q': keyword}
             
             try:
-                response = requests.get(url, params=params, timeout=10)
+                response = session.get(url, params=params, timeout=10)
                 response.raise_for_status()
                 return response.json()
             except:
@@ -110,16 +123,36 @@ class handler(BaseHTTPRequestHandler):
         
         data = get_cached_or_fetch(cache_key, fetch_results)
         
-        # Filter and categorize results
+        # Filter and categorize results. The comparison values are
+        # normalized once per search rather than once per organization.
         exact_city_results = []
         same_county_results = []
         same_state_results = []
+        city_lower = city.lower() if city else None
+        nearby_lower = frozenset(c.lower() for c in nearby_cities)
+        buckets = (
+            (exact_city_results, f'Same City ({city})', 100),
+            (same_county_results, f'Same County ({county})', 80),
+            (same_state_results, f'Same State ({state})', 50),
+        )
         
         for org in data.get('organizations', []):
             org_city = org.get('city', '')
             org_state = org.get('state', '')
+            org_city_lower = org_city.lower()
+            
+            # Exact city, then same county (any nearby city), then same state
+            if org_city_lower == city_lower:
+                bucket = 0
+            elif org_city_lower in nearby_lower:
+                bucket = 1
+            elif org_state == state:
+                bucket = 2
+            else:
+                continue
             
-            org_data = {
+            results, distance, match_quality = buckets[bucket]
+            results.append({
                 'ein': str(org['ein']),
                 'name': org['name'],
                 'city': org_city,
@@ -128,24 +161,10 @@ class handler(BaseHTTPRequestHandler):
                 'score': org.get('score', 0),
                 'subsection_code': org.get('subsectn_code'),
                 'classification_codes': org.get('classification_codes', []),
-                'ruling_date': org.get('ruling_date')
-            }
-            
-            # Check for exact city match
-            if city and city.lower() == org_city.lower():
-                org_data['distance'] = f'Same City ({city})'
-                org_data['match_quality'] = 100
-                exact_city_results.append(org_data)
-            # Check if in same county (any nearby city)
-            elif org_city in nearby_cities:
-                org_data['distance'] = f'Same County ({county})'
-                org_data['match_quality'] = 80
-                same_county_results.append(org_data)
-            # Check if same state
-            elif org_state == state:
-                org_data['distance'] = f'Same State ({state})'
-                org_data['match_quality'] = 50
-                same_state_results.append(org_data)
+                'ruling_date': org.get('ruling_date'),
+                'distance': distance,
+                'match_quality': match_quality
+            })
         
         # Sort each group by ProPublica's relevance score
         exact_city_results.sort(key=lambda x: x.get('score', 0), reverse=True)
@@ -186,7 +205,7 @@ class handler(BaseHTTPRequestHandler):
         
         def fetch_zip():
             try:
-                response = requests.get(f"http://api.zippopotam.us/us/{zip_code}", timeout=5)
+                response = session.get(f"http://api.zippopotam.us/us/{zip_code}", timeout=5)
                 if response.status_code == 200:
                     data = response.json()
                     if data.get('places'):
@@ -200,7 +219,7 @@ class handler(BaseHTTPRequestHandler):
                 pass
             return None
         
-        zip_info = get_cached_or_fetch(cache_key, fetch_zip)
+        zip_info = get_cached_or_fetch(cache_key, fetch_zip, negative_ttl=300)
         
         if zip_info:
             # Search with city and state
@@ -211,7 +230,7 @@ class handler(BaseHTTPRequestHandler):
                 params = {'q': f"{keyword} {zip_info['city']} {zip_info['state_abbr']}"}
                 
                 try:
-                    response = requests.get(url, params=params, timeout=10)
+                    response = session.get(url, params=params, timeout=10)
                     response.raise_for_status()
                     return response.json()
                 except:
@@ -269,7 +288,7 @@ class handler(BaseHTTPRequestHandler):
         params = {'q': keyword}
         
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = session.get(url, params=params, timeout=10)
             response.raise_for_status()
             data = response.json()
             
@@ -2,14 +2,138 @@
 """
 Simple Flask app that uses REAL ProPublica data
 Run this to see actual nonprofits!
+
+For production, serve it with gunicorn via wsgi.py:
+    gunicorn -k gevent -w 4 --worker-connections 1000 -b 0.0.0.0:5000 wsgi:application
 """
 
-from flask import Flask, render_template_string, request, jsonify
+from flask import Flask, Response, request
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import gzip
+from dataclasses import dataclass, asdict
+from typing import Optional
+import hashlib
+import threading
+import time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 app = Flask(__name__)
 
+PROPUBLICA_API = "https://projects.propublica.org/nonprofits/api/v2"
+UPSTREAM_TIMEOUT = (3, 10)  # (connect, read) seconds
+
+# One pooled keep-alive session so repeat calls skip the TCP/TLS handshake
+session = requests.Session()
+session.headers.update({'Accept-Encoding': 'gzip, deflate'})
+session.mount('https://', HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+))
+
+# In-process response cache shared by the request threads
+cache = {}
+cache_lock = threading.Lock()
+SEARCH_CACHE_DURATION = 300
+DETAILS_CACHE_DURATION = 1800
+MAX_CACHE_SIZE = 4096
+
+MIN_QUERY_LENGTH = 3
+
+# Response compression
+COMPRESS_MIN_SIZE = 256  # bytes; smaller bodies aren't worth the CPU
+COMPRESS_LEVEL = 6
+
+
+def fetch_propublica(path, params=None):
+    """GET a ProPublica API resource and return the decoded JSON"""
+    response = session.get(f"{PROPUBLICA_API}/{path}", params=params, timeout=UPSTREAM_TIMEOUT)
+    response.raise_for_status()
+    if orjson:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def json_response(payload, status=200):
+    """Serialize a JSON response body, using orjson when it is installed"""
+    body = orjson.dumps(payload) if orjson else json.dumps(payload)
+    return Response(body, status=status, mimetype='application/json')
+
+
+@dataclass(frozen=True)
+class OrgDetails:
+    """Details response for one organization, derived once per fetch"""
+    name: str
+    mission: Optional[str]
+    revenue: Optional[float]
+    expenses: Optional[float]
+    assets: Optional[float]
+    program_expense_percent: Optional[float]
+    latest_filing_year: Optional[int]
+    
+    @classmethod
+    def from_org(cls, org):
+        """Build from a ProPublica organization record"""
+        filings = org.get('filings_with_data')
+        latest_filing = filings[0] if filings else {}
+        
+        # Calculate program expense percentage
+        expenses = latest_filing.get('totfuncexpns')
+        program_expense_percent = None
+        if expenses and expenses > 0:
+            program_expense_percent = (latest_filing.get('progsvcs', 0) / expenses) * 100
+        
+        return cls(
+            name=org.get('name', ''),
+            mission=org.get('mission'),
+            revenue=latest_filing.get('totrevenue'),
+            expenses=expenses,
+            assets=latest_filing.get('totassetsend'),
+            program_expense_percent=program_expense_percent,
+            latest_filing_year=latest_filing.get('tax_prd_yr')
+        )
+
+
+@app.after_request
+def compress_response(response):
+    """Gzip JSON responses for clients that accept it"""
+    response.vary.add('Accept-Encoding')
+    if (response.mimetype != 'application/json'
+            or response.direct_passthrough
+            or 'Content-Encoding' in response.headers
+            or 'gzip' not in request.accept_encodings):
+        return response
+    
+    body = response.get_data()
+    if len(body) < COMPRESS_MIN_SIZE:
+        return response
+    
+    response.set_data(gzip.compress(body, COMPRESS_LEVEL))
+    response.headers['Content-Encoding'] = 'gzip'
+    return response
+
+
+def get_cached_or_fetch(cache_key, fetch_func, ttl):
+    """Simple caching mechanism; failed fetches raise and are not cached"""
+    with cache_lock:
+        entry = cache.get(cache_key)
+    if entry and time.monotonic() < entry[1]:
+        return entry[0]
+    
+    data = fetch_func()
+    with cache_lock:
+        if cache_key not in cache and len(cache) >= MAX_CACHE_SIZE:
+            cache.pop(next(iter(cache)))  # Evict the oldest entry
+        cache[cache_key] = (data, time.monotonic() + ttl)
+    return data
+
 # HTML template with embedded JavaScript
 HTML_TEMPLATE = """
 <!DOCTYPE html>
@@ -193,27 +317,46 @@ HTML_TEMPLATE = """
 </html>
 """
 
+# The page has no template variables, so encode and compress it once
+HTML_BYTES = HTML_TEMPLATE.encode('utf-8')
+HTML_GZIP = gzip.compress(HTML_BYTES, 9)
+HTML_ETAG = hashlib.sha1(HTML_BYTES).hexdigest()
+
 @app.route('/')
 def index():
-    return render_template_string(HTML_TEMPLATE)
+    if 'gzip' in request.accept_encodings:
+        body, etag = HTML_GZIP, f"{HTML_ETAG}-gzip"
+    else:
+        body, etag = HTML_BYTES, HTML_ETAG
+    
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        response = Response(body, mimetype='text/html')
+        if body is HTML_GZIP:
+            response.headers['Content-Encoding'] = 'gzip'
+    response.set_etag(etag)
+    response.vary.add('Accept-Encoding')
+    return response
 
 @app.route('/api/search', methods=['POST'])
 def search():
     """Search nonprofits using ProPublica API"""
-    data = request.json
-    query = data.get('query', '')
-    state = data.get('state', '')
+    data = request.get_json(silent=True) or {}
+    # Normalize so "Red Cross" and "red  cross " share a cache entry
+    query = ' '.join(str(data.get('query') or '').split()).lower()
+    state = str(data.get('state') or '').strip().upper()
+    
+    # Too-short queries become expensive wildcard searches upstream
+    if len(query) < MIN_QUERY_LENGTH:
+        return json_response([])
     
-    # Build ProPublica API URL
-    url = "https://projects.propublica.org/nonprofits/api/v2/search.json"
     params = {'q': query}
     if state:
         params['state'] = state
     
-    try:
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        api_data = response.json()
+    def fetch():
+        api_data = fetch_propublica('search.json', params)
         
         # Format results
         results = []
@@ -226,12 +369,15 @@ def search():
                 'ntee_code': org.get('ntee_code'),
                 'score': org.get('score', 0)
             })
-        
-        return jsonify(results)
+        return results
+    
+    try:
+        cache_key = f"search:{query}:{state}"
+        return json_response(get_cached_or_fetch(cache_key, fetch, SEARCH_CACHE_DURATION))
     
     except Exception as e:
         print(f"Search error: {e}")
-        return jsonify([])
+        return json_response([])
 
 @app.route('/api/details/<ein>')
 def get_details(ein):
@@ -239,47 +385,19 @@ def get_details(ein):
     # Clean EIN
     ein_clean = ein.replace('-', '')
     
-    url = f"https://projects.propublica.org/nonprofits/api/v2/organizations/{ein_clean}.json"
+    def fetch():
+        data = fetch_propublica(f"organizations/{ein_clean}.json")
+        return OrgDetails.from_org(data.get('organization', {}))
     
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
-        
-        org = data.get('organization', {})
-        
-        # Get latest filing
-        latest_filing = None
-        if 'filings_with_data' in org and org['filings_with_data']:
-            latest_filing = org['filings_with_data'][0]
-        
-        # Extract financial data
-        result = {
-            'name': org.get('name', ''),
-            'mission': org.get('mission'),
-            'revenue': None,
-            'expenses': None,
-            'assets': None,
-            'program_expense_percent': None,
-            'latest_filing_year': None
-        }
-        
-        if latest_filing:
-            result['revenue'] = latest_filing.get('totrevenue')
-            result['expenses'] = latest_filing.get('totfuncexpns')
-            result['assets'] = latest_filing.get('totassetsend')
-            result['latest_filing_year'] = latest_filing.get('tax_prd_yr')
-            
-            # Calculate program expense percentage
-            if latest_filing.get('totfuncexpns') and latest_filing.get('totfuncexpns') > 0:
-                program_exp = latest_filing.get('progsvcs', 0)
-                result['program_expense_percent'] = (program_exp / latest_filing['totfuncexpns']) * 100
-        
-        return jsonify(result)
+        details = get_cached_or_fetch(f"details:{ein_clean}", fetch, DETAILS_CACHE_DURATION)
+        response = json_response(asdict(details))
+        response.headers['Cache-Control'] = f'public, max-age={DETAILS_CACHE_DURATION}'
+        return response
     
     except Exception as e:
         print(f"Details error for {ein}: {e}")
-        return jsonify({'error': 'Not found'}), 404
+        return json_response({'error': 'Not found'}, 404)
 
 if __name__ == '__main__':
     print("\n" + "="*60)
@@ -294,6 +412,8 @@ if __name__ == '__main__':
     print("  • Homeless Shelter")
     print("  • Animal Rescue")
     print("\nPress Ctrl+C to stop the server")
+    print("(For production use gunicorn with wsgi:application)")
     print("="*60 + "\n")
     
-    app.run(debug=True, port=5000)
\ No newline at end of file
+    from werkzeug.serving import run_simple
+    run_simple('127.0.0.1', 5000, app, use_reloader=False, threaded=True)
\ No newline at end of file
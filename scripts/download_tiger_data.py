@@ -5,31 +5,64 @@ Creates a comprehensive database of geographic relationships
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import zipfile
 import csv
+import gzip
 import json
 import os
+import shelve
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # Census Bureau TIGER data URLs
 TIGER_BASE_URL = "https://www2.census.gov/geo/docs/maps-data/data/rel2020"
 ZCTA_TO_COUNTY_URL = f"{TIGER_BASE_URL}/zcta520_county20_natl.txt"
 
+# Columns we need from the relationship file, with fallback positions
+TIGER_COLUMNS = (('ZCTA5_20', 0), ('STATE_20', 1), ('COUNTY_20', 2), ('NAMELSAD_20', 5))
+
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+# Concurrent Zippopotam lookups while enhancing city data
+ZIPPOPOTAM_WORKERS = 10
+ZIPPOPOTAM_CACHE = Path("../data/tiger/zippopotam_cache")
+
+# Keep-alive session sized so every lookup worker can hold a connection
+zippo_session = requests.Session()
+zippo_session.mount('http://', HTTPAdapter(pool_maxsize=ZIPPOPOTAM_WORKERS))
+
 def download_tiger_data():
     """Download TIGER ZCTA to County relationship file"""
     print("Downloading TIGER Census data...")
     
     try:
-        response = requests.get(ZCTA_TO_COUNTY_URL, timeout=30)
-        response.raise_for_status()
-        
-        # Save raw data
         data_dir = Path("../data/tiger")
         data_dir.mkdir(parents=True, exist_ok=True)
-        
         raw_file = data_dir / "zcta_county_rel.txt"
-        with open(raw_file, 'w') as f:
-            f.write(response.text)
+        
+        # Stream to disk so the file never has to fit in memory
+        with requests.get(ZCTA_TO_COUNTY_URL, stream=True, timeout=30) as response:
+            response.raise_for_status()
+            with open(raw_file, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
         
         print(f"Downloaded TIGER data to {raw_file}")
         return raw_file
@@ -42,45 +75,11 @@ def parse_tiger_data(file_path):
     """Parse TIGER relationship file into usable format"""
     print("Parsing TIGER data...")
     
-    zip_to_county = {}
-    county_to_zips = {}
-    
     try:
-        with open(file_path, 'r') as f:
-            # First line contains headers
-            headers = f.readline().strip().split('|')
-            
-            # Find column indices
-            zcta_idx = headers.index('ZCTA5_20') if 'ZCTA5_20' in headers else 0
-            state_idx = headers.index('STATE_20') if 'STATE_20' in headers else 1
-            county_idx = headers.index('COUNTY_20') if 'COUNTY_20' in headers else 2
-            county_name_idx = headers.index('NAMELSAD_20') if 'NAMELSAD_20' in headers else 5
-            
-            for line in f:
-                parts = line.strip().split('|')
-                if len(parts) > max(zcta_idx, state_idx, county_idx):
-                    zip_code = parts[zcta_idx]
-                    state_fips = parts[state_idx]
-                    county_fips = parts[county_idx]
-                    county_name = parts[county_name_idx] if county_name_idx < len(parts) else ''
-                    
-                    # Create mapping
-                    if zip_code:
-                        zip_to_county[zip_code] = {
-                            'state_fips': state_fips,
-                            'county_fips': county_fips,
-                            'county_name': county_name.replace(' County', ''),
-                            'full_county_name': county_name
-                        }
-                        
-                        # Reverse mapping
-                        county_key = f"{state_fips}_{county_fips}"
-                        if county_key not in county_to_zips:
-                            county_to_zips[county_key] = {
-                                'name': county_name,
-                                'zips': []
-                            }
-                        county_to_zips[county_key]['zips'].append(zip_code)
+        if pd is not None:
+            zip_to_county, county_to_zips = parse_tiger_data_pandas(file_path)
+        else:
+            zip_to_county, county_to_zips = parse_tiger_data_python(file_path)
         
         print(f"Parsed {len(zip_to_county)} ZIP codes")
         return zip_to_county, county_to_zips
@@ -89,6 +88,107 @@ def parse_tiger_data(file_path):
         print(f"Error parsing TIGER data: {e}")
         return {}, {}
 
+def get_column_indices(headers):
+    """Find column indices, falling back to the documented positions"""
+    return [headers.index(name) if name in headers else default
+            for name, default in TIGER_COLUMNS]
+
+def parse_tiger_data_pandas(file_path):
+    """Parse the relationship file with pandas' C parser"""
+    df = pd.read_csv(file_path, sep='|', dtype=str, keep_default_na=False)
+    zcta_idx, state_idx, county_idx, county_name_idx = get_column_indices(list(df.columns))
+    
+    df = pd.DataFrame({
+        'zip': df.iloc[:, zcta_idx],
+        'state_fips': df.iloc[:, state_idx],
+        'county_fips': df.iloc[:, county_idx],
+        'full_county_name': df.iloc[:, county_name_idx] if county_name_idx < df.shape[1] else '',
+    }).fillna('')
+    df = df[df['zip'] != '']
+    if df.empty:
+        return {}, {}
+    df['county_name'] = df['full_county_name'].str.replace(' County', '', regex=False)
+    
+    # ZCTAs spanning several counties keep their last county, as before
+    forward = df.drop_duplicates('zip', keep='last')
+    zip_to_county = {
+        zip_code: {
+            'state_fips': state_fips,
+            'county_fips': county_fips,
+            'county_name': county_name,
+            'full_county_name': full_county_name
+        }
+        for zip_code, state_fips, county_fips, county_name, full_county_name in zip(
+            forward['zip'].tolist(),
+            forward['state_fips'].tolist(),
+            forward['county_fips'].tolist(),
+            forward['county_name'].tolist(),
+            forward['full_county_name'].tolist()
+        )
+    }
+    
+    # Reverse mapping, grouped CSR-style: integer-code each county, stable
+    # sort the rows by code, then slice the ZIP column at the group offsets
+    codes, county_keys = pd.factorize(df['state_fips'] + '_' + df['county_fips'], sort=False)
+    order = np.argsort(codes, kind='stable')
+    offsets = np.cumsum(np.bincount(codes, minlength=len(county_keys)))[:-1]
+    zip_groups = np.split(df['zip'].to_numpy()[order], offsets)
+    first_rows = order[np.concatenate(([0], offsets))]
+    county_names = df['full_county_name'].to_numpy()[first_rows]
+    county_to_zips = {
+        county_key: {'name': name, 'zips': zips.tolist()}
+        for county_key, name, zips in zip(county_keys, county_names, zip_groups)
+    }
+    
+    return zip_to_county, county_to_zips
+
+def parse_tiger_data_python(file_path):
+    """Pure-Python parser used when pandas is not installed"""
+    zip_to_county = {}
+    county_to_zips = {}
+    
+    with open(file_path, 'r', newline='') as f:
+        # csv's C tokenizer splits the rows; first row contains headers
+        reader = csv.reader(f, delimiter='|', quoting=csv.QUOTE_NONE)
+        headers = next(reader)
+        
+        # Find column indices; extract all four fields in one C-level call
+        # for full rows, and only special-case rows missing the name column
+        indices = get_column_indices(headers)
+        get_fields = itemgetter(*indices)
+        get_key_fields = itemgetter(*indices[:3])
+        full_row_len = max(indices) + 1
+        key_row_len = max(indices[:3]) + 1
+        
+        for parts in reader:
+            if len(parts) >= full_row_len:
+                zip_code, state_fips, county_fips, county_name = get_fields(parts)
+            elif len(parts) >= key_row_len:
+                zip_code, state_fips, county_fips = get_key_fields(parts)
+                county_name = ''
+            else:
+                continue
+            
+            # Create mapping
+            if zip_code:
+                zip_to_county[zip_code] = {
+                    'state_fips': state_fips,
+                    'county_fips': county_fips,
+                    'county_name': county_name.replace(' County', ''),
+                    'full_county_name': county_name
+                }
+                
+                # Reverse mapping
+                county_key = f"{state_fips}_{county_fips}"
+                if county_key not in county_to_zips:
+                    county_to_zips[county_key] = {
+                        'name': county_name,
+                        'zips': []
+                    }
+                county_to_zips[county_key]['zips'].append(zip_code)
+    
+    return zip_to_county, county_to_zips
+
 def get_state_abbreviations():
     """FIPS state codes to abbreviations"""
     return {
@@ -105,6 +205,18 @@ def get_state_abbreviations():
         '56': 'WY'
     }
 
+def fetch_zippopotam_place(zip_code):
+    """Look up the first Zippopotam place for a ZIP code, or None"""
+    try:
+        response = zippo_session.get(f"http://api.zippopotam.us/us/{zip_code}", timeout=5)
+        if response.status_code == 200:
+            data = response.json()
+            if data.get('places'):
+                return data['places'][0]
+    except:
+        pass
+    return None
+
 def enhance_with_city_data(zip_to_county):
     """Add city names using Zippopotam API for major ZIPs"""
     print("Enhancing with city data (sample)...")
@@ -118,74 +230,154 @@ def enhance_with_city_data(zip_to_county):
         '33701', '33755', '33770',  # Pinellas County, FL
         '78701', '94102', '02101', '98101', '85001'  # More major cities
     ]
+    wanted_zips = [z for z in sample_zips if z in zip_to_county]
+    
+    # Places found on earlier runs are reused from the on-disk cache
+    with shelve.open(str(ZIPPOPOTAM_CACHE)) as place_cache:
+        places = {z: place_cache[z] for z in wanted_zips if z in place_cache}
+        zips_to_fetch = [z for z in wanted_zips if z not in places]
+        
+        # Lookups are independent, so overlap their network round trips
+        with ThreadPoolExecutor(max_workers=ZIPPOPOTAM_WORKERS) as executor:
+            fetched = executor.map(fetch_zippopotam_place, zips_to_fetch)
+            for zip_code, place in zip(zips_to_fetch, fetched):
+                if place:
+                    place_cache[zip_code] = place
+                    places[zip_code] = place
     
-    for zip_code in sample_zips:
-        if zip_code in zip_to_county:
-            try:
-                response = requests.get(f"http://api.zippopotam.us/us/{zip_code}", timeout=5)
-                if response.status_code == 200:
-                    data = response.json()
-                    if data.get('places'):
-                        place = data['places'][0]
-                        
-                        county_info = zip_to_county[zip_code]
-                        state_fips = county_info['state_fips']
-                        
-                        enhanced[zip_code] = {
-                            'city': place['place name'],
-                            'state': place['state'],
-                            'state_abbr': state_abbrevs.get(state_fips, ''),
-                            'county': county_info['county_name'],
-                            'county_fips': f"{state_fips}{county_info['county_fips']}",
-                            'lat': place.get('latitude'),
-                            'lon': place.get('longitude')
-                        }
-                        print(f"  {zip_code}: {place['place name']}, {county_info['county_name']}")
-            except:
-                pass
+    for zip_code in wanted_zips:
+        place = places.get(zip_code)
+        if not place:
+            continue
+        
+        county_info = zip_to_county[zip_code]
+        state_fips = county_info['state_fips']
+        
+        enhanced[zip_code] = {
+            'city': place['place name'],
+            'state': place['state'],
+            'state_abbr': state_abbrevs.get(state_fips, ''),
+            'county': county_info['county_name'],
+            'county_fips': f"{state_fips}{county_info['county_fips']}",
+            'lat': place.get('latitude'),
+            'lon': place.get('longitude')
+        }
+        print(f"  {zip_code}: {place['place name']}, {county_info['county_name']}")
     
     return enhanced
 
+def write_json_gz(path, obj):
+    """Write compact gzip-compressed JSON"""
+    if orjson:
+        payload = orjson.dumps(obj)
+    else:
+        payload = json.dumps(obj, separators=(',', ':')).encode('utf-8')
+    
+    with gzip.open(path, 'wb', compresslevel=6) as f:
+        f.write(payload)
+
+def write_zip_records(path, zip_to_county):
+    """Write the ZIP to county map as a ZIP-sorted fixed-width record array"""
+    zips = sorted(zip_to_county)
+    names = [zip_to_county[z]['county_name'].encode('utf-8') for z in zips]
+    record_dtype = np.dtype([
+        ('zip', 'S5'),
+        ('state_fips', 'S2'),
+        ('county_fips', 'S3'),
+        ('county_name', f"S{max(map(len, names), default=1)}")
+    ])
+    records = np.array([
+        (z.encode('ascii'), zip_to_county[z]['state_fips'].encode('ascii'),
+         zip_to_county[z]['county_fips'].encode('ascii'), name)
+        for z, name in zip(zips, names)
+    ], dtype=record_dtype)
+    # Uncompressed .npy so readers can memory-map it
+    np.save(path, records)
+
 def save_data(zip_to_county, county_to_zips, enhanced_data):
-    """Save processed data to JSON files"""
+    """Save processed data to compressed JSON files"""
     data_dir = Path("../data/tiger")
     
     # Save full ZIP to county mapping
-    with open(data_dir / "zip_to_county.json", 'w') as f:
-        json.dump(zip_to_county, f, indent=2)
+    write_json_gz(data_dir / "zip_to_county.json.gz", zip_to_county)
+    
+    # Sorted record copy that readers memory-map for per-ZIP lookups
+    if np is not None:
+        write_zip_records(data_dir / "zip_records.npy", zip_to_county)
     
     # Save county to ZIPs mapping
-    with open(data_dir / "county_to_zips.json", 'w') as f:
-        json.dump(county_to_zips, f, indent=2)
+    write_json_gz(data_dir / "county_to_zips.json.gz", county_to_zips)
     
     # Save enhanced sample data
-    with open(data_dir / "enhanced_zip_data.json", 'w') as f:
-        json.dump(enhanced_data, f, indent=2)
+    write_json_gz(data_dir / "enhanced_zip_data.json.gz", enhanced_data)
     
     # Create a Python module for easy import
     with open(data_dir / "__init__.py", 'w') as f:
         f.write("""# TIGER Census Data Module
-import json
+# Maps are parsed on first use and then kept for the life of the process
+import gzip
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
+
 data_dir = Path(__file__).parent
 
+def _load(filename):
+    with gzip.open(data_dir / filename, 'rb') as f:
+        return loads(f.read())
+
+@lru_cache(maxsize=1)
 def load_zip_to_county():
-    with open(data_dir / 'zip_to_county.json', 'r') as f:
-        return json.load(f)
+    return _load('zip_to_county.json.gz')
 
+@lru_cache(maxsize=1)
 def load_county_to_zips():
-    with open(data_dir / 'county_to_zips.json', 'r') as f:
-        return json.load(f)
+    return _load('county_to_zips.json.gz')
 
+@lru_cache(maxsize=1)
 def load_enhanced_data():
-    with open(data_dir / 'enhanced_zip_data.json', 'r') as f:
-        return json.load(f)
+    return _load('enhanced_zip_data.json.gz')
+
+@lru_cache(maxsize=1)
+def load_zip_records():
+    # Memory-mapped ZIP-sorted records, shared via the page cache across
+    # processes; None if numpy or the file is unavailable
+    try:
+        import numpy as np
+        return np.load(data_dir / 'zip_records.npy', mmap_mode='r')
+    except (ImportError, OSError):
+        return None
+
+def lookup_zip(zip_code):
+    # (state_fips, county_fips, county_name) for a ZIP, or None
+    records = load_zip_records()
+    if records is None:
+        info = load_zip_to_county().get(zip_code)
+        return (info['state_fips'], info['county_fips'], info['county_name']) if info else None
+    
+    key = zip_code.encode('ascii')
+    i = int(records['zip'].searchsorted(key))
+    if i == len(records) or records['zip'][i] != key:
+        return None
+    record = records[i]
+    return (record['state_fips'].decode('ascii'), record['county_fips'].decode('ascii'),
+            record['county_name'].decode('utf-8'))
+
+_LAZY_CONSTANTS = {
+    'ZIP_TO_COUNTY': load_zip_to_county,
+    'COUNTY_TO_ZIPS': load_county_to_zips,
+    'ENHANCED_DATA': load_enhanced_data,
+}
 
-# Load data on import
-ZIP_TO_COUNTY = load_zip_to_county()
-COUNTY_TO_ZIPS = load_county_to_zips()
-ENHANCED_DATA = load_enhanced_data()
+def __getattr__(name):
+    # Keep the old module constants working without loading on import
+    if name in _LAZY_CONSTANTS:
+        return _LAZY_CONSTANTS[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 """)
     
     print(f"Saved processed data to {data_dir}")
@@ -3,15 +3,87 @@ from typing import Dict, List, Tuple, Optional
 import yaml
 from pathlib import Path
 import logging
+import os
 from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
 import re
+import hashlib
+import sqlite3
+import threading
+from collections import Counter, OrderedDict
+from functools import partial
 
-from src.models.nonprofit import Nonprofit, MissionAlignment
+try:
+    import torch
+except ImportError:  # installed with sentence-transformers; guarded for CPU-only setups
+    torch = None
+
+try:
+    import ahocorasick
+except ImportError:  # optional; keyword matching falls back to substring checks
+    ahocorasick = None
+
+from src.models.nonprofit import Nonprofit, MissionAlignment, FinancialData
 
 
 logger = logging.getLogger(__name__)
 
+EMBEDDING_MODEL = 'all-MiniLM-L6-v2'
+
+# ONNX Runtime variants of the model shipped in its hub repo: INT8 dynamically
+# quantized for CPU, FP16-optimized (O4) for CUDA
+ONNX_MODEL_FILES = {
+    'onnx-int8': ('onnx/model_qint8_avx512_vnni.onnx', 'CPUExecutionProvider'),
+    'onnx-fp16': ('onnx/model_O4.onnx', 'CUDAExecutionProvider'),
+}
+
+
+class EmbeddingStore:
+    """
+    SQLite-backed embedding cache that persists across runs
+    Rows are keyed by (model id, dimension, content hash), so switching the
+    model or backend never serves vectors from another encoder
+    """
+    
+    # Stay under SQLite's bound-parameter limit in IN (...) lookups
+    LOOKUP_CHUNK = 500
+    
+    def __init__(self, path: str, model_id: str, dim: int):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.model_id = model_id
+        self.dim = dim
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "model TEXT NOT NULL, dim INTEGER NOT NULL, key BLOB NOT NULL, "
+                "vec BLOB NOT NULL, PRIMARY KEY (model, dim, key))"
+            )
+    
+    def get_many(self, keys: List[bytes]) -> Dict[bytes, np.ndarray]:
+        """Stored float32 vectors for whichever keys are present"""
+        found = {}
+        with self._lock:
+            for start in range(0, len(keys), self.LOOKUP_CHUNK):
+                chunk = keys[start:start + self.LOOKUP_CHUNK]
+                rows = self._conn.execute(
+                    "SELECT key, vec FROM embeddings WHERE model = ? AND dim = ? "
+                    f"AND key IN ({', '.join('?' * len(chunk))})",
+                    (self.model_id, self.dim, *chunk)
+                )
+                for key, vec in rows:
+                    found[bytes(key)] = np.frombuffer(vec, dtype=np.float32)
+        return found
+    
+    def put_many(self, vectors: Dict[bytes, np.ndarray]):
+        """Store (or replace) vectors by key"""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?, ?)",
+                [(self.model_id, self.dim, key, np.asarray(vec, dtype=np.float32).tobytes())
+                 for key, vec in vectors.items()]
+            )
+
 
 class MissionAlignmentAnalyzer:
     """
@@ -19,73 +91,350 @@ class MissionAlignmentAnalyzer:
     Uses NLP and semantic similarity for sophisticated matching
     """
     
-    def __init__(self, config_path: str = "./config/red_cross_mission.yaml"):
+    def __init__(self, config_path: str = "./config/red_cross_mission.yaml",
+                 backend: Optional[str] = None, device: Optional[str] = None):
         self.config = self._load_config(config_path)
-        self.model = SentenceTransformer('all-MiniLM-L6-v2')
+        self._bind_config()
+        
+        # Run the encoder (and batch similarity) on the GPU when there is one
+        if device is None:
+            device = 'cuda' if torch is not None and torch.cuda.is_available() else 'cpu'
+        self.device = device
+        self.model = self._load_model(backend or os.getenv('EMBEDDING_BACKEND', 'torch'))
+        self.embedding_dim = self.model.get_sentence_embedding_dimension()
+        
+        # LRU of text embeddings keyed by content hash, so re-scoring the
+        # same nonprofit skips the forward pass
+        self._embedding_cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self.embedding_cache_size = 4096
+        # The analyzer is shared by the API's worker threads
+        self._embedding_cache_lock = threading.Lock()
+        
+        # On-disk copy of the same cache, so cold starts skip it too
+        # (EMBEDDING_CACHE_PATH='' disables it)
+        self._embedding_store = self._open_embedding_store(
+            os.getenv('EMBEDDING_CACHE_PATH', './data/embedding_cache.sqlite')
+        )
         
         # Pre-compute embeddings for Red Cross mission elements
         self._precompute_embeddings()
+        self._build_keyword_automata()
     
     def _load_config(self, config_path: str) -> Dict:
         """Load Red Cross mission configuration"""
         with open(config_path, 'r') as f:
             return yaml.safe_load(f)
     
+    def _bind_config(self):
+        """Bind config values used per nonprofit to attributes, avoiding nested dict lookups"""
+        keywords = self.config['mission_keywords']
+        self._primary_keywords = tuple(keywords['primary'])
+        self._secondary_keywords = tuple(keywords['secondary'])
+        self._tertiary_keywords = tuple(keywords['tertiary'])
+        self._max_keyword_score = len(self._primary_keywords) * 1.0
+        
+        # Lowercased keyword -> (keyword, tier weight), in config order
+        self._keyword_weights = {}
+        tiers = ((self._primary_keywords, 1.0), (self._secondary_keywords, 0.7),
+                 (self._tertiary_keywords, 0.4))
+        for tier_keywords, weight in tiers:
+            for keyword in tier_keywords:
+                self._keyword_weights.setdefault(keyword.lower(), (keyword, weight))
+        
+        # Weights in the column order of the per-nonprofit score components:
+        # semantic, service overlap, geographic, capacity, partnership
+        weights = self.config['scoring_weights']
+        self._score_weights = np.array([
+            weights[key] for key in (
+                'mission_alignment', 'service_overlap', 'geographic_coverage',
+                'organizational_capacity', 'partnership_history'
+            )
+        ])
+    
+    def _load_model(self, backend: str) -> SentenceTransformer:
+        """
+        Load the sentence encoder
+        'torch' is the default FP32 model; 'onnx-int8' (CPU) and 'onnx-fp16'
+        (GPU) run the exported ONNX graphs, falling back to torch if the
+        onnx extras are not installed
+        """
+        if backend in ONNX_MODEL_FILES:
+            file_name, provider = ONNX_MODEL_FILES[backend]
+            try:
+                model = SentenceTransformer(
+                    EMBEDDING_MODEL,
+                    device=self.device,
+                    backend='onnx',
+                    model_kwargs={'file_name': file_name, 'provider': provider}
+                )
+                self.model_id = f"{EMBEDDING_MODEL}:{backend}"
+                return model
+            except Exception as e:
+                logger.warning(f"ONNX backend '{backend}' unavailable, using torch: {e}")
+        elif backend != 'torch':
+            logger.warning(f"Unknown embedding backend '{backend}', using torch")
+        
+        self.model_id = EMBEDDING_MODEL
+        return SentenceTransformer(EMBEDDING_MODEL, device=self.device)
+    
+    def _open_embedding_store(self, path: str) -> Optional[EmbeddingStore]:
+        """Open the persistent embedding cache; None if disabled or unusable"""
+        if not path:
+            return None
+        try:
+            return EmbeddingStore(path, self.model_id, self.embedding_dim)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Embedding cache at {path} unavailable: {e}")
+            return None
+    
     def _precompute_embeddings(self):
         """Pre-compute embeddings for Red Cross mission keywords"""
         # Combine all keywords
-        all_keywords = (
-            self.config['mission_keywords']['primary'] +
-            self.config['mission_keywords']['secondary'] +
-            self.config['mission_keywords']['tertiary']
+        all_keywords = list(
+            self._primary_keywords +
+            self._secondary_keywords +
+            self._tertiary_keywords
         )
         
-        # Create embeddings
-        self.keyword_embeddings = self.model.encode(all_keywords)
+        # Create embeddings, stored L2-normalized so cosine similarity
+        # against them is a single matrix-vector product
+        self.keyword_embeddings = self._l2_normalize(self._encode_batch(all_keywords, 64)[0])
         self.keywords = all_keywords
         
-        # Create service category embeddings
-        service_descriptions = []
-        for category, details in self.config['service_categories'].items():
-            service_descriptions.append(f"{category}: {', '.join(details['subcategories'])}")
+        # Device-resident copy for batch similarity on GPU
+        self._keyword_embeddings_t = None
+        if torch is not None and self.device.startswith('cuda'):
+            self._keyword_embeddings_t = torch.from_numpy(self.keyword_embeddings).to(self.device)
         
-        self.service_embeddings = self.model.encode(service_descriptions)
         self.service_categories = list(self.config['service_categories'].keys())
     
+    def _build_keyword_automata(self):
+        """
+        Build Aho-Corasick automata for mission keywords and service subcategories
+        so each nonprofit text is scanned once instead of once per keyword
+        """
+        # Subcategory phrases as they appear in text, and category weights
+        self._subcategory_phrases = {
+            category: tuple(sub.replace('_', ' ').lower() for sub in details['subcategories'])
+            for category, details in self.config['service_categories'].items()
+        }
+        self._category_weights = {
+            category: details['weight']
+            for category, details in self.config['service_categories'].items()
+        }
+        
+        # UTF-8 forms for the substring fallback, which searches bytes: a
+        # lowercased text with any non-ASCII character is a 2- or 4-byte-wide
+        # str, while its UTF-8 encoding stays 1 byte per ASCII character
+        self._keyword_weights_utf8 = tuple(
+            (keyword_lower.encode('utf-8'), keyword, weight)
+            for keyword_lower, (keyword, weight) in self._keyword_weights.items()
+        )
+        self._subcategory_phrases_utf8 = {
+            category: tuple(phrase.encode('utf-8') for phrase in phrases)
+            for category, phrases in self._subcategory_phrases.items()
+        }
+        
+        self._keyword_automaton = None
+        self._subcategory_automaton = None
+        if ahocorasick is None:
+            return
+        
+        # keyword -> [(position, keyword, weight)], position keeps config order
+        keyword_entries = {
+            keyword_lower: [(position, keyword, weight)]
+            for position, (keyword_lower, (keyword, weight))
+            in enumerate(self._keyword_weights.items())
+        }
+        self._keyword_automaton = self._make_automaton(keyword_entries)
+        
+        # subcategory phrase -> [(category, subcategory index)]
+        subcategory_entries = {}
+        for category, phrases in self._subcategory_phrases.items():
+            for index, phrase in enumerate(phrases):
+                subcategory_entries.setdefault(phrase, []).append((category, index))
+        self._subcategory_automaton = self._make_automaton(subcategory_entries)
+    
+    @staticmethod
+    def _make_automaton(entries: Dict[str, list]):
+        """Aho-Corasick automaton mapping each word to a tuple of payloads"""
+        if not entries:
+            return None
+        automaton = ahocorasick.Automaton()
+        for word, payloads in entries.items():
+            automaton.add_word(word, tuple(payloads))
+        automaton.make_automaton()
+        return automaton
+    
+    def _encode_float32(self, texts: List[str], **kwargs) -> np.ndarray:
+        """Encode texts into a C-contiguous float32 matrix"""
+        return np.ascontiguousarray(
+            self.model.encode(texts, convert_to_numpy=True, **kwargs), dtype=np.float32
+        )
+    
+    @staticmethod
+    def _l2_normalize(vectors: np.ndarray) -> np.ndarray:
+        """Scale vectors (rows) to unit length"""
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
+    
     def analyze_alignment(self, nonprofit: Nonprofit) -> MissionAlignment:
         """
         Comprehensive mission alignment analysis
         """
-        # Combine all text about the nonprofit
-        nonprofit_text = self._compile_nonprofit_text(nonprofit)
+        return self.analyze_alignment_batch([nonprofit])[0]
+    
+    def analyze_alignment_batch(self, nonprofits: List[Nonprofit],
+                                batch_size: int = 64) -> List[MissionAlignment]:
+        """
+        Mission alignment for many nonprofits at once
+        Encodes all nonprofit texts in one batched forward pass, rather than
+        a model call per nonprofit
+        """
+        nonprofit_texts = [self._compile_nonprofit_text(n) for n in nonprofits]
+        
+        text_matrix, text_present = self._encode_batch(nonprofit_texts, batch_size)
+        
+        # Similarity to the mission keywords for every nonprofit in one product
+        semantic_scores = self._semantic_similarity_batch(text_matrix, text_present)
+        
+        components = np.empty((len(nonprofits), len(self._score_weights)))
+        components[:, 0] = semantic_scores
+        details = []
+        for i, (nonprofit, text) in enumerate(zip(nonprofits, nonprofit_texts)):
+            # Lowercase each text once; every keyword check works on this copy
+            row, detail = self._alignment_components(nonprofit, text.lower())
+            components[i, 1:] = row
+            details.append(detail)
+        
+        # Weighted overall scores in one product, clamped once for the whole batch
+        scores = components @ self._score_weights
+        np.clip(scores, 0.0, 1.0, out=scores)
+        
+        return [
+            self._build_alignment(nonprofit, float(score), float(semantic_score), *detail)
+            for nonprofit, score, semantic_score, detail
+            in zip(nonprofits, scores, semantic_scores, details)
+        ]
+    
+    def _encode_batch(self, texts: List[str], batch_size: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Encode texts into one preallocated float32 (N, dim) block
+        Returns the block and a mask of which rows are filled (empty texts
+        are not encoded). Cached texts are served from the LRU, the rest are
+        encoded in a single call. The LRU is backed by the on-disk store.
+        """
+        cache = self._embedding_cache
+        out = np.empty((len(texts), self.embedding_dim), dtype=np.float32)
+        present = np.zeros(len(texts), dtype=bool)
+        misses = {}  # cache key -> indices of texts with that content
+        
+        keys = [self._embedding_key(text) if text else None for text in texts]
+        with self._embedding_cache_lock:
+            for i, key in enumerate(keys):
+                if key is None:
+                    continue
+                cached = cache.get(key)
+                if cached is not None:
+                    cache.move_to_end(key)
+                    out[i] = cached
+                    present[i] = True
+                else:
+                    misses.setdefault(key, []).append(i)
+        
+        if misses and self._embedding_store is not None:
+            try:
+                stored = self._embedding_store.get_many(list(misses))
+            except sqlite3.Error as e:
+                logger.warning(f"Embedding cache read failed: {e}")
+                stored = {}
+            for key, embedding in stored.items():
+                indices = misses.pop(key)
+                out[indices] = embedding
+                present[indices] = True
+            self._cache_embeddings(stored)
+        
+        if misses:
+            # encode() sorts by length internally, so padding waste is minimal
+            encoded = self._encode_float32(
+                [texts[indices[0]] for indices in misses.values()],
+                batch_size=batch_size,
+                show_progress_bar=False
+            )
+            new_embeddings = {}
+            for (key, indices), embedding in zip(misses.items(), encoded):
+                out[indices] = embedding
+                present[indices] = True
+                new_embeddings[key] = embedding.copy()  # don't pin the encoded block
+            self._cache_embeddings(new_embeddings)
+            
+            if self._embedding_store is not None:
+                try:
+                    self._embedding_store.put_many(new_embeddings)
+                except sqlite3.Error as e:
+                    logger.warning(f"Embedding cache write failed: {e}")
+        
+        return out, present
+    
+    def _cache_embeddings(self, embeddings: Dict[bytes, np.ndarray]):
+        """Add embeddings to the LRU, evicting the least recently used past its size"""
+        cache = self._embedding_cache
+        with self._embedding_cache_lock:
+            cache.update(embeddings)
+            for key in embeddings:
+                cache.move_to_end(key)
+            while len(cache) > self.embedding_cache_size:
+                cache.popitem(last=False)
+    
+    @staticmethod
+    def _embedding_key(text: str) -> bytes:
+        """Short content hash used as the embedding cache key"""
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+    
+    def _alignment_components(self, nonprofit: Nonprofit, text_lower: str) -> Tuple[tuple, tuple]:
+        """
+        Unweighted score components for one nonprofit (all but semantic
+        similarity, which is computed for the whole batch), plus the details
+        needed to build its MissionAlignment
+        """
+        # Without pyahocorasick both substring scans share one UTF-8 encoding
+        text_utf8 = text_lower.encode('utf-8') if ahocorasick is None else None
+        keyword_score, matched_keywords = self._keyword_matching(text_lower, text_utf8)
+        service_overlap = self._service_category_overlap(text_lower, text_utf8)
+        latest_financials = nonprofit.get_latest_financials()
         
-        # Calculate various alignment scores
-        keyword_score, matched_keywords = self._keyword_matching(nonprofit_text)
-        semantic_score = self._semantic_similarity(nonprofit_text)
-        service_overlap = self._service_category_overlap(nonprofit)
-        program_alignment = self._program_alignment(nonprofit)
+        # Plain mean: np.mean's array setup costs more than a handful of floats
+        overlap_values = service_overlap.values()
+        service_score = sum(overlap_values) / len(overlap_values) if overlap_values else 0.0
         
-        # Calculate weighted overall score
-        weights = self.config['scoring_weights']
-        overall_score = (
-            weights['mission_alignment'] * semantic_score +
-            weights['service_overlap'] * np.mean(list(service_overlap.values())) +
-            weights['geographic_coverage'] * self._geographic_alignment(nonprofit) +
-            weights['organizational_capacity'] * self._capacity_score(nonprofit) +
-            weights['partnership_history'] * self._partnership_potential(nonprofit)
+        row = (
+            service_score,
+            self._geographic_alignment(nonprofit),
+            self._capacity_score(nonprofit, latest_financials),
+            self._partnership_potential(nonprofit, latest_financials)
         )
-        
-        # Generate explanation
-        explanation = self._generate_explanation(
-            nonprofit, keyword_score, semantic_score, 
-            service_overlap, matched_keywords
+        return row, (keyword_score, matched_keywords, service_overlap, latest_financials)
+    
+    def _build_alignment(self, nonprofit: Nonprofit, score: float, semantic_score: float,
+                         keyword_score: float, matched_keywords: List[str],
+                         service_overlap: Dict[str, float],
+                         latest_financials: Optional[FinancialData]) -> MissionAlignment:
+        """Assemble a MissionAlignment from its (already clamped) overall score"""
+        # Explanation is rendered on first read, so callers that only rank on
+        # score (and never show most results) skip the string formatting. The
+        # renderer is a staticmethod, so the partial holds plain values and the
+        # result pickles and deep-copies without the analyzer
+        explanation = partial(
+            MissionAlignmentAnalyzer._generate_explanation,
+            score, keyword_score, semantic_score, 
+            service_overlap, matched_keywords, latest_financials
         )
         
         # Calculate confidence based on data completeness
         confidence = self._calculate_confidence(nonprofit)
         
         return MissionAlignment(
-            score=min(1.0, overall_score),
+            score=score,
             matched_keywords=matched_keywords,
             service_overlap=service_overlap,
             explanation=explanation,
@@ -106,105 +455,109 @@ class MissionAlignmentAnalyzer:
         
         return ' '.join(filter(None, text_parts))
     
-    def _keyword_matching(self, text: str) -> Tuple[float, List[str]]:
-        """Match keywords with weighted scoring"""
-        text_lower = text.lower()
+    def _keyword_matching(self, text_lower: str,
+                          text_utf8: Optional[bytes] = None) -> Tuple[float, List[str]]:
+        """Match keywords with weighted scoring (text must already be lowercased)"""
         matched_keywords = []
         score = 0.0
         
-        # Check primary keywords (highest weight)
-        for keyword in self.config['mission_keywords']['primary']:
-            if keyword.lower() in text_lower:
+        if self._keyword_automaton is not None:
+            # One pass over the text; each keyword counts once, in config order
+            hits = {}
+            for _, payloads in self._keyword_automaton.iter(text_lower):
+                for position, keyword, weight in payloads:
+                    hits[position] = (keyword, weight)
+            for position in sorted(hits):
+                keyword, weight = hits[position]
                 matched_keywords.append(keyword)
-                score += 1.0
-        
-        # Check secondary keywords
-        for keyword in self.config['mission_keywords']['secondary']:
-            if keyword.lower() in text_lower:
-                matched_keywords.append(keyword)
-                score += 0.7
-        
-        # Check tertiary keywords
-        for keyword in self.config['mission_keywords']['tertiary']:
-            if keyword.lower() in text_lower:
-                matched_keywords.append(keyword)
-                score += 0.4
+                score += weight
+        else:
+            if text_utf8 is None:
+                text_utf8 = text_lower.encode('utf-8')
+            score = self._keyword_matching_scan(text_utf8, matched_keywords)
         
         # Normalize score
-        max_possible = len(self.config['mission_keywords']['primary']) * 1.0
+        max_possible = self._max_keyword_score
         normalized_score = min(1.0, score / max_possible) if max_possible > 0 else 0
         
         return normalized_score, matched_keywords
     
-    def _semantic_similarity(self, text: str) -> float:
-        """Calculate semantic similarity using sentence embeddings"""
-        if not text:
-            return 0.0
+    def _keyword_matching_scan(self, text_utf8: bytes, matched_keywords: List[str]) -> float:
+        """Per-keyword substring fallback when pyahocorasick is unavailable"""
+        score = 0.0
         
-        # Encode nonprofit text
-        text_embedding = self.model.encode([text])
+        # Single pass over all tiers; weights are primary 1.0, secondary 0.7, tertiary 0.4
+        for keyword_utf8, keyword, weight in self._keyword_weights_utf8:
+            if keyword_utf8 in text_utf8:
+                matched_keywords.append(keyword)
+                score += weight
         
-        # Calculate similarity with Red Cross mission keywords
-        keyword_similarities = cosine_similarity(text_embedding, self.keyword_embeddings)
+        return score
+    
+    def _semantic_similarity_batch(self, text_matrix: np.ndarray,
+                                   present: np.ndarray) -> np.ndarray:
+        """
+        Semantic similarity of each nonprofit text to the mission keywords
+        Rows without text score 0.0
+        """
+        scores = np.zeros(len(text_matrix), dtype=np.float32)
+        top_k = min(5, len(self.keywords))
+        if not top_k or not present.any():
+            return scores
         
-        # Take top 5 similarities and average them
-        top_similarities = np.sort(keyword_similarities[0])[-5:]
-        avg_similarity = np.mean(top_similarities)
+        embeddings = self._l2_normalize(text_matrix[present])
         
-        # Scale to 0-1 range (similarities are usually 0.2-0.8)
-        scaled_score = (avg_similarity - 0.2) / 0.6
+        # Cosine similarity with Red Cross mission keywords; average the top 5
+        if self._keyword_embeddings_t is not None:
+            similarities = torch.from_numpy(embeddings).to(self.device) @ self._keyword_embeddings_t.T
+            avg_similarity = similarities.topk(top_k, dim=1).values.mean(dim=1).cpu().numpy()
+        else:
+            similarities = embeddings @ self.keyword_embeddings.T
+            avg_similarity = np.partition(similarities, -top_k, axis=1)[:, -top_k:].mean(axis=1)
         
-        return max(0.0, min(1.0, scaled_score))
+        # Scale to 0-1 range (similarities are usually 0.2-0.8)
+        scores[present] = np.clip((avg_similarity - 0.2) / 0.6, 0.0, 1.0)
+        return scores
     
-    def _service_category_overlap(self, nonprofit: Nonprofit) -> Dict[str, float]:
-        """Analyze overlap in service categories"""
+    def _service_category_overlap(self, text_lower: str,
+                                  text_utf8: Optional[bytes] = None) -> Dict[str, float]:
+        """Analyze overlap in service categories (from the lowercased nonprofit text)"""
         overlap = {}
-        nonprofit_text = self._compile_nonprofit_text(nonprofit).lower()
         
-        for category, details in self.config['service_categories'].items():
-            score = 0.0
-            matches = 0
-            
-            # Check subcategories
-            for subcategory in details['subcategories']:
-                if subcategory.replace('_', ' ') in nonprofit_text:
-                    matches += 1
-            
-            if len(details['subcategories']) > 0:
-                score = matches / len(details['subcategories'])
+        # Count distinct matched subcategories per category
+        if self._subcategory_automaton is not None:
+            found = set()
+            for _, payloads in self._subcategory_automaton.iter(text_lower):
+                found.update(payloads)
+            counts = Counter(category for category, _ in found)
+        else:
+            if text_utf8 is None:
+                text_utf8 = text_lower.encode('utf-8')
+            counts = {
+                category: sum(1 for phrase in phrases if phrase in text_utf8)
+                for category, phrases in self._subcategory_phrases_utf8.items()
+            }
+        
+        for category, phrases in self._subcategory_phrases.items():
+            score = counts.get(category, 0) / len(phrases) if phrases else 0.0
             
             # Apply category weight
-            overlap[category] = score * details['weight']
+            overlap[category] = score * self._category_weights[category]
         
         return overlap
     
-    def _program_alignment(self, nonprofit: Nonprofit) -> float:
-        """Analyze how well programs align with Red Cross activities"""
-        if not nonprofit.programs:
-            return 0.5  # Neutral score if no program data
-        
-        # Encode programs
-        program_text = ' '.join(nonprofit.programs)
-        program_embedding = self.model.encode([program_text])
-        
-        # Compare with service category embeddings
-        similarities = cosine_similarity(program_embedding, self.service_embeddings)
-        
-        # Return maximum similarity
-        return float(np.max(similarities))
-    
     def _geographic_alignment(self, nonprofit: Nonprofit) -> float:
         """Score geographic coverage alignment"""
         # This would check if the nonprofit operates in areas where Red Cross needs partners
         # For now, return a default score
         return 0.7
     
-    def _capacity_score(self, nonprofit: Nonprofit) -> float:
+    def _capacity_score(self, nonprofit: Nonprofit,
+                        latest_financials: Optional[FinancialData]) -> float:
         """Evaluate organizational capacity"""
         score = 0.5  # Base score
         
         # Check financial stability
-        latest_financials = nonprofit.get_latest_financials()
         if latest_financials:
             # Revenue size bonus
             if latest_financials.total_revenue > 1000000:
@@ -225,11 +578,12 @@ class MissionAlignmentAnalyzer:
         
         return min(1.0, score)
     
-    def _partnership_potential(self, nonprofit: Nonprofit) -> float:
+    def _partnership_potential(self, nonprofit: Nonprofit,
+                               latest_financials: Optional[FinancialData]) -> float:
         """Evaluate potential for successful partnership"""
         # This would check past partnerships, collaborative indicators, etc.
         # For now, use stability score as proxy
-        return nonprofit.calculate_stability_score()
+        return nonprofit.calculate_stability_score(latest_financials)
     
     def _calculate_confidence(self, nonprofit: Nonprofit) -> float:
         """Calculate confidence in the alignment score"""
@@ -251,14 +605,15 @@ class MissionAlignmentAnalyzer:
         
         return min(1.0, confidence)
     
-    def _generate_explanation(self, nonprofit: Nonprofit, keyword_score: float,
-                            semantic_score: float, service_overlap: Dict[str, float],
-                            matched_keywords: List[str]) -> str:
+    @staticmethod
+    def _generate_explanation(overall_score: float, keyword_score: float,
+                              semantic_score: float, service_overlap: Dict[str, float],
+                              matched_keywords: List[str],
+                              latest_financials: Optional[FinancialData]) -> str:
         """Generate human-readable explanation of the alignment score"""
         explanation_parts = []
         
         # Overall assessment
-        overall_score = nonprofit.mission_alignment.score if nonprofit.mission_alignment else 0
         if overall_score > 0.8:
             explanation_parts.append(f"Strong alignment with Red Cross mission ({overall_score:.1%})")
         elif overall_score > 0.6:
@@ -287,7 +642,6 @@ class MissionAlignmentAnalyzer:
             explanation_parts.append("Mission statement shows moderate thematic alignment")
         
         # Financial insight
-        latest_financials = nonprofit.get_latest_financials()
         if latest_financials and latest_financials.program_expense_ratio > 0.75:
             explanation_parts.append(
                 f"Efficient operations ({latest_financials.program_expense_ratio:.0%} to programs)"
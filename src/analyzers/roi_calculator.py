@@ -1,13 +1,23 @@
 import numpy as np
 from typing import Dict, List, Optional, Tuple
 import logging
+import threading
 from dataclasses import dataclass
+from functools import partial
 
 from src.models.nonprofit import Nonprofit, PartnershipROI, FinancialData
 
 
 logger = logging.getLogger(__name__)
 
+# Resource sharing and cost savings components are fixed-length vectors;
+# these give the component order (and the keys used when reporting them)
+RESOURCE_FIELDS = ('facilities', 'volunteers', 'equipment', 'expertise')
+FACILITIES, VOLUNTEERS, EQUIPMENT, EXPERTISE = range(len(RESOURCE_FIELDS))
+
+SAVINGS_FIELDS = ('procurement', 'marketing', 'administration', 'training', 'technology')
+PROCUREMENT, MARKETING, ADMINISTRATION, TRAINING, TECHNOLOGY = range(len(SAVINGS_FIELDS))
+
 
 @dataclass
 class ROIMetrics:
@@ -45,6 +55,17 @@ class PartnershipROICalculator:
             'sustainability': 0.10,
             'risk_mitigation': 0.10
         }
+        
+        # Per-thread component vectors reused by every calculate_roi call
+        self._scratch = threading.local()
+    
+    def _scratch_buffers(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Resource sharing and cost savings vectors for the current thread"""
+        scratch = self._scratch
+        if not hasattr(scratch, 'resource'):
+            scratch.resource = np.zeros(len(RESOURCE_FIELDS))
+            scratch.savings = np.zeros(len(SAVINGS_FIELDS))
+        return scratch.resource, scratch.savings
     
     def calculate_roi(self, nonprofit: Nonprofit, 
                      partnership_type: str = "standard") -> PartnershipROI:
@@ -56,54 +77,178 @@ class PartnershipROICalculator:
         if not latest_financials:
             return self._default_roi()
         
-        # Calculate various value components
-        resource_value = self._calculate_resource_sharing_value(nonprofit, latest_financials)
-        cost_savings = self._calculate_cost_savings(nonprofit, latest_financials)
-        reach_value = self._calculate_reach_expansion_value(nonprofit)
-        capability_value = self._calculate_capability_enhancement(nonprofit)
-        risk_value = self._calculate_risk_mitigation_value(nonprofit)
+        # Calculate various value components; the component vectors are
+        # scratch buffers, so only scalars and copies leave this method
+        resource_buf, savings_buf = self._scratch_buffers()
+        resource_value = self._calculate_resource_sharing_value(nonprofit, latest_financials, out=resource_buf)
+        cost_savings = self._calculate_cost_savings(nonprofit, latest_financials, out=savings_buf)
+        reach_value = self._calculate_reach_expansion_value(nonprofit, latest_financials)
+        capability_value = self._calculate_capability_enhancement(nonprofit, latest_financials)
+        risk_value = self._calculate_risk_mitigation_value(nonprofit, latest_financials)
         
         # Calculate total value
+        resource_total = float(resource_value.sum())
+        savings_total = float(cost_savings.sum())
         total_value = (
-            resource_value['total'] +
-            cost_savings['total'] +
+            resource_total +
+            savings_total +
             reach_value['total'] +
             capability_value +
             risk_value
         )
         
         # Estimate investment required
-        investment = self._estimate_investment_required(nonprofit, partnership_type)
+        investment = self._estimate_investment_required(nonprofit, partnership_type, latest_financials)
         
         # Calculate ROI metrics
         roi_ratio = (total_value - investment) / investment if investment > 0 else 0
         impact_multiplier = 1 + (roi_ratio * 0.5)  # Conservative multiplier
         
-        # Create detailed explanation
-        explanation = self._generate_roi_explanation(
-            resource_value, cost_savings, reach_value,
+        # Create detailed explanation (rendered on first read; a staticmethod,
+        # so the result pickles without the calculator)
+        explanation = partial(
+            PartnershipROICalculator._generate_roi_explanation,
+            resource_total, savings_total, float(resource_value[VOLUNTEERS]), reach_value,
             capability_value, risk_value, investment, roi_ratio
         )
         
         return PartnershipROI(
             estimated_value=total_value,
-            resource_sharing_potential=resource_value,
+            resource_sharing_potential=self._components_dict(RESOURCE_FIELDS, resource_value),
             impact_multiplier=impact_multiplier,
-            cost_savings=cost_savings['total'],
+            cost_savings=savings_total,
             reach_expansion=reach_value['new_beneficiaries'],
             explanation=explanation
         )
     
+    def calculate_roi_batch(self, nonprofits: List[Nonprofit],
+                            partnership_type: str = "standard") -> List[PartnershipROI]:
+        """
+        Calculate ROI for many nonprofits at once
+        Financial fields are stacked into arrays so every value formula runs
+        elementwise over the whole list; only the (lazily rendered)
+        explanations are per nonprofit.
+        Results match calculate_roi for each nonprofit.
+        """
+        results: List[Optional[PartnershipROI]] = [None] * len(nonprofits)
+        
+        # Gather per-nonprofit scalars; nonprofits without financials get the default
+        rows = []
+        fields = []
+        for i, nonprofit in enumerate(nonprofits):
+            financials = nonprofit.get_latest_financials()
+            if not financials:
+                results[i] = self._default_roi()
+                continue
+            rows.append(i)
+            fields.append((
+                financials.total_revenue,
+                financials.total_expenses,
+                financials.total_assets,
+                financials.program_expenses,
+                financials.fundraising_expenses,
+                financials.administrative_expenses,
+                financials.program_expense_ratio,
+                nonprofit.total_followers,
+                len(nonprofit.programs),
+                len(nonprofit.leadership),
+                nonprofit.calculate_stability_score(financials),
+                nonprofit.status == nonprofit.status.ACTIVE
+            ))
+        
+        if not rows:
+            return results
+        
+        (revenue, expenses, assets, program_exp, fundraising_exp, admin_exp,
+         program_ratio, followers, program_count, leader_count,
+         stability, active) = np.array(fields, dtype=np.float64).T
+        
+        # Resource sharing (RESOURCE_FIELDS columns)
+        resource_value = np.zeros((len(rows), len(RESOURCE_FIELDS)))
+        resource_value[:, FACILITIES] = np.where(assets > 500000, assets * 0.1 * 0.02 * 12, 0.0)
+        resource_value[:, VOLUNTEERS] = followers * 0.01 * 20 * self.VOLUNTEER_HOUR_VALUE
+        resource_value[:, EQUIPMENT] = np.where(program_exp > 0, program_exp * 0.05, 0.0)
+        resource_value[:, EXPERTISE] = program_count * 5000
+        
+        # Cost savings (SAVINGS_FIELDS columns)
+        cost_savings = np.zeros((len(rows), len(SAVINGS_FIELDS)))
+        cost_savings[:, PROCUREMENT] = expenses * 0.04
+        cost_savings[:, MARKETING] = np.where(fundraising_exp > 0, fundraising_exp * 0.15, 0.0)
+        cost_savings[:, ADMINISTRATION] = np.where(admin_exp > 0, admin_exp * 0.10, 0.0)
+        cost_savings[:, TRAINING] = 10000 * (revenue / 1000000)
+        cost_savings[:, TECHNOLOGY] = 5000 + (revenue * 0.001)
+        
+        # Reach expansion
+        new_beneficiaries = np.where(program_exp > 0, np.floor((program_exp / 150) * 0.3), 0.0)
+        beneficiary_value = new_beneficiaries * self.BENEFICIARY_SERVICE_VALUE
+        new_donors = new_beneficiaries * 0.05
+        geographic_expansion = beneficiary_value * 0.1
+        reach_total = beneficiary_value + new_donors * self.DONOR_LIFETIME_VALUE + geographic_expansion
+        
+        # Capability enhancement and risk mitigation
+        capability_value = (
+            program_count * 8000 +
+            np.select([program_ratio > 0.75, program_ratio > 0.65], [20000, 10000], 0) +
+            leader_count * 2000
+        )
+        risk_value = (
+            program_exp * 0.02 +
+            np.select([stability > 0.7, stability > 0.5], [15000, 8000], 0) +
+            active * 5000
+        )
+        
+        # Investment (always positive: base setup plus fixed technology/coordination costs)
+        base_costs = {'standard': 25000, 'strategic': 50000, 'merger': 100000}
+        investment = (
+            base_costs.get(partnership_type, 25000) +
+            20000 * np.minimum(1.0, revenue / 5000000) +
+            program_count * 1000 +
+            10000 + 15000
+        )
+        
+        resource_total = resource_value.sum(axis=1)
+        savings_total = cost_savings.sum(axis=1)
+        total_value = resource_total + savings_total + reach_total + capability_value + risk_value
+        roi_ratio = (total_value - investment) / investment
+        impact_multiplier = 1 + (roi_ratio * 0.5)
+        
+        for j, i in enumerate(rows):
+            reach_value = {
+                'new_beneficiaries': int(new_beneficiaries[j]),
+                'new_donors': float(new_donors[j]),
+                'geographic_expansion': float(geographic_expansion[j]),
+                'total': float(reach_total[j])
+            }
+            explanation = partial(
+                PartnershipROICalculator._generate_roi_explanation,
+                float(resource_total[j]), float(savings_total[j]),
+                float(resource_value[j, VOLUNTEERS]), reach_value,
+                float(capability_value[j]), float(risk_value[j]),
+                float(investment[j]), float(roi_ratio[j])
+            )
+            results[i] = PartnershipROI(
+                estimated_value=float(total_value[j]),
+                resource_sharing_potential=self._components_dict(RESOURCE_FIELDS, resource_value[j]),
+                impact_multiplier=float(impact_multiplier[j]),
+                cost_savings=float(savings_total[j]),
+                reach_expansion=reach_value['new_beneficiaries'],
+                explanation=explanation
+            )
+        
+        return results
+    
     def _calculate_resource_sharing_value(self, nonprofit: Nonprofit, 
-                                         financials: FinancialData) -> Dict:
-        """Calculate value from resource sharing opportunities"""
-        value = {
-            'facilities': 0,
-            'volunteers': 0,
-            'equipment': 0,
-            'expertise': 0,
-            'total': 0
-        }
+                                         financials: FinancialData,
+                                         out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Calculate value from resource sharing opportunities (RESOURCE_FIELDS order)
+        Fills and returns `out` when given instead of allocating
+        """
+        if out is None:
+            value = np.zeros(len(RESOURCE_FIELDS))
+        else:
+            value = out
+            value.fill(0.0)
         
         # Estimate based on organization size
         org_size_factor = min(1.0, financials.total_revenue / 1000000)
@@ -113,64 +258,69 @@ class PartnershipROICalculator:
             # Assume 10% of assets are facilities that could be shared
             facility_value = financials.total_assets * 0.1
             # Monthly sharing value
-            value['facilities'] = facility_value * 0.02 * 12  # 2% monthly * 12 months
+            value[FACILITIES] = facility_value * 0.02 * 12  # 2% monthly * 12 months
         
         # Volunteer sharing
         # Estimate volunteer base from social media following
         if nonprofit.social_media:
-            total_followers = sum(sm.followers for sm in nonprofit.social_media)
+            total_followers = nonprofit.total_followers
             estimated_volunteers = total_followers * 0.01  # 1% conversion
             volunteer_hours = estimated_volunteers * 20  # 20 hours/year each
-            value['volunteers'] = volunteer_hours * self.VOLUNTEER_HOUR_VALUE
+            value[VOLUNTEERS] = volunteer_hours * self.VOLUNTEER_HOUR_VALUE
         
         # Equipment and supplies
         # Estimate from program expenses
         if financials.program_expenses > 0:
-            value['equipment'] = financials.program_expenses * 0.05  # 5% could be shared
+            value[EQUIPMENT] = financials.program_expenses * 0.05  # 5% could be shared
         
         # Expertise and training
         if nonprofit.programs:
             # Value expertise based on number of programs
-            value['expertise'] = len(nonprofit.programs) * 5000  # $5k value per program expertise
-        
-        value['total'] = sum(v for k, v in value.items() if k != 'total')
+            value[EXPERTISE] = len(nonprofit.programs) * 5000  # $5k value per program expertise
         
         return value
     
     def _calculate_cost_savings(self, nonprofit: Nonprofit, 
-                              financials: FinancialData) -> Dict:
-        """Calculate potential cost savings from partnership"""
-        savings = {
-            'procurement': 0,
-            'marketing': 0,
-            'administration': 0,
-            'training': 0,
-            'technology': 0,
-            'total': 0
-        }
+                              financials: FinancialData,
+                              out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Calculate potential cost savings from partnership (SAVINGS_FIELDS order)
+        Fills and returns `out` when given instead of allocating
+        """
+        if out is None:
+            savings = np.zeros(len(SAVINGS_FIELDS))
+        else:
+            savings = out
+            savings.fill(0.0)
         
         # Joint procurement savings (3-5% of expenses)
-        savings['procurement'] = financials.total_expenses * 0.04
+        savings[PROCUREMENT] = financials.total_expenses * 0.04
         
         # Shared marketing and outreach
         if financials.fundraising_expenses > 0:
-            savings['marketing'] = financials.fundraising_expenses * 0.15
+            savings[MARKETING] = financials.fundraising_expenses * 0.15
         
         # Administrative efficiency
         if financials.administrative_expenses > 0:
-            savings['administration'] = financials.administrative_expenses * 0.10
+            savings[ADMINISTRATION] = financials.administrative_expenses * 0.10
         
         # Shared training programs
-        savings['training'] = 10000 * (financials.total_revenue / 1000000)  # Scale with size
+        savings[TRAINING] = 10000 * (financials.total_revenue / 1000000)  # Scale with size
         
         # Technology and systems sharing
-        savings['technology'] = 5000 + (financials.total_revenue * 0.001)
-        
-        savings['total'] = sum(v for k, v in savings.items() if k != 'total')
+        savings[TECHNOLOGY] = 5000 + (financials.total_revenue * 0.001)
         
         return savings
     
-    def _calculate_reach_expansion_value(self, nonprofit: Nonprofit) -> Dict:
+    @staticmethod
+    def _components_dict(fields: Tuple[str, ...], values: np.ndarray) -> Dict[str, float]:
+        """Label a component vector by field name, plus its 'total'"""
+        components = dict(zip(fields, values.tolist()))
+        components['total'] = float(values.sum())
+        return components
+    
+    def _calculate_reach_expansion_value(self, nonprofit: Nonprofit,
+                                        latest_financials: Optional[FinancialData]) -> Dict:
         """Calculate value from expanded reach and impact"""
         reach = {
             'new_beneficiaries': 0,
@@ -180,7 +330,6 @@ class PartnershipROICalculator:
         }
         
         # Estimate current reach from financials
-        latest_financials = nonprofit.get_latest_financials()
         if latest_financials and latest_financials.program_expenses > 0:
             # Rough estimate: $150 per beneficiary served
             current_beneficiaries = latest_financials.program_expenses / 150
@@ -202,7 +351,8 @@ class PartnershipROICalculator:
         
         return reach
     
-    def _calculate_capability_enhancement(self, nonprofit: Nonprofit) -> float:
+    def _calculate_capability_enhancement(self, nonprofit: Nonprofit,
+                                          latest_financials: Optional[FinancialData]) -> float:
         """Calculate value from enhanced capabilities"""
         value = 0
         
@@ -212,7 +362,6 @@ class PartnershipROICalculator:
             value += len(nonprofit.programs) * 8000
         
         # Technology and innovation transfer
-        latest_financials = nonprofit.get_latest_financials()
         if latest_financials:
             # Organizations with higher efficiency bring more capability
             if latest_financials.program_expense_ratio > 0.75:
@@ -227,18 +376,18 @@ class PartnershipROICalculator:
         
         return value
     
-    def _calculate_risk_mitigation_value(self, nonprofit: Nonprofit) -> float:
+    def _calculate_risk_mitigation_value(self, nonprofit: Nonprofit,
+                                         latest_financials: Optional[FinancialData]) -> float:
         """Calculate value from risk mitigation"""
         value = 0
         
         # Service continuity (backup during disasters)
-        latest_financials = nonprofit.get_latest_financials()
         if latest_financials:
             # Value of having backup capacity
             value += latest_financials.program_expenses * 0.02
         
         # Diversification value
-        stability_score = nonprofit.calculate_stability_score()
+        stability_score = nonprofit.calculate_stability_score(latest_financials)
         if stability_score > 0.7:
             value += 15000  # Stable partners reduce risk
         elif stability_score > 0.5:
@@ -251,7 +400,8 @@ class PartnershipROICalculator:
         return value
     
     def _estimate_investment_required(self, nonprofit: Nonprofit, 
-                                     partnership_type: str) -> float:
+                                     partnership_type: str,
+                                     latest_financials: Optional[FinancialData]) -> float:
         """Estimate investment required for partnership"""
         investment = 0
         
@@ -264,7 +414,6 @@ class PartnershipROICalculator:
         investment += base_costs.get(partnership_type, 25000)
         
         # Integration costs based on size
-        latest_financials = nonprofit.get_latest_financials()
         if latest_financials:
             # Larger organizations require more integration
             size_factor = min(1.0, latest_financials.total_revenue / 5000000)
@@ -282,10 +431,12 @@ class PartnershipROICalculator:
         
         return investment
     
-    def _generate_roi_explanation(self, resource_value: Dict, cost_savings: Dict,
-                                 reach_value: Dict, capability_value: float,
-                                 risk_value: float, investment: float,
-                                 roi_ratio: float) -> str:
+    @staticmethod
+    def _generate_roi_explanation(resource_total: float, savings_total: float,
+                                  volunteer_value: float,
+                                  reach_value: Dict, capability_value: float,
+                                  risk_value: float, investment: float,
+                                  roi_ratio: float) -> str:
         """Generate human-readable ROI explanation"""
         explanation_parts = []
         
@@ -302,11 +453,11 @@ class PartnershipROICalculator:
         # Top value drivers
         value_drivers = []
         
-        if resource_value['total'] > 50000:
-            value_drivers.append(f"Resource sharing: ${resource_value['total']:,.0f}")
+        if resource_total > 50000:
+            value_drivers.append(f"Resource sharing: ${resource_total:,.0f}")
         
-        if cost_savings['total'] > 30000:
-            value_drivers.append(f"Cost savings: ${cost_savings['total']:,.0f}")
+        if savings_total > 30000:
+            value_drivers.append(f"Cost savings: ${savings_total:,.0f}")
         
         if reach_value['new_beneficiaries'] > 100:
             value_drivers.append(f"Reach expansion: {reach_value['new_beneficiaries']:,} new beneficiaries")
@@ -319,7 +470,7 @@ class PartnershipROICalculator:
         
         # Payback period
         if roi_ratio > 0:
-            annual_value = resource_value['total'] + cost_savings['total']
+            annual_value = resource_total + savings_total
             if annual_value > 0:
                 payback_months = int((investment / annual_value) * 12)
                 explanation_parts.append(f"Payback period: {payback_months} months")
@@ -333,7 +484,7 @@ class PartnershipROICalculator:
         if risk_value > 15000:
             strategic.append("strong risk mitigation")
         
-        if resource_value['volunteers'] > 20000:
+        if volunteer_value > 20000:
             strategic.append("substantial volunteer network")
         
         if strategic:
@@ -359,34 +510,38 @@ class PartnershipROICalculator:
             return self._default_metrics()
         
         # Calculate all components
-        resource_value = self._calculate_resource_sharing_value(nonprofit, latest_financials)
-        cost_savings = self._calculate_cost_savings(nonprofit, latest_financials)
-        reach_value = self._calculate_reach_expansion_value(nonprofit)
-        capability_value = self._calculate_capability_enhancement(nonprofit)
-        risk_value = self._calculate_risk_mitigation_value(nonprofit)
+        resource_buf, savings_buf = self._scratch_buffers()
+        resource_value = self._calculate_resource_sharing_value(nonprofit, latest_financials, out=resource_buf)
+        cost_savings = self._calculate_cost_savings(nonprofit, latest_financials, out=savings_buf)
+        reach_value = self._calculate_reach_expansion_value(nonprofit, latest_financials)
+        capability_value = self._calculate_capability_enhancement(nonprofit, latest_financials)
+        risk_value = self._calculate_risk_mitigation_value(nonprofit, latest_financials)
+        
+        resource_total = float(resource_value.sum())
+        savings_total = float(cost_savings.sum())
         
         # Direct vs indirect savings
-        direct_savings = cost_savings['procurement'] + cost_savings['administration']
-        indirect_savings = cost_savings['total'] - direct_savings
+        direct_savings = float(cost_savings[PROCUREMENT] + cost_savings[ADMINISTRATION])
+        indirect_savings = savings_total - direct_savings
         
         # Total value and investment
         total_value = (
-            resource_value['total'] + cost_savings['total'] +
+            resource_total + savings_total +
             reach_value['total'] + capability_value + risk_value
         )
-        investment = self._estimate_investment_required(nonprofit, "standard")
+        investment = self._estimate_investment_required(nonprofit, "standard", latest_financials)
         
         # ROI calculation
         roi_ratio = (total_value - investment) / investment if investment > 0 else 0
         
         # Payback period
-        annual_return = resource_value['total'] + cost_savings['total']
+        annual_return = resource_total + savings_total
         payback_months = int((investment / annual_return) * 12) if annual_return > 0 else 999
         
         return ROIMetrics(
             direct_cost_savings=direct_savings,
             indirect_cost_savings=indirect_savings,
-            resource_sharing_value=resource_value['total'],
+            resource_sharing_value=resource_total,
             reach_expansion_value=reach_value['total'],
             capability_enhancement_value=capability_value,
             risk_mitigation_value=risk_value,
@@ -1,6 +1,9 @@
-from fastapi import FastAPI, HTTPException, Query, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Query, BackgroundTasks, Depends
 from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.encoders import jsonable_encoder
+from fastapi.concurrency import run_in_threadpool
+from anyio import to_thread
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, Field
 import logging
@@ -8,8 +11,38 @@ from datetime import datetime
 import json
 import io
 import csv
+import asyncio
+import os
+import threading
+import multiprocessing
+import numpy
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from collections import OrderedDict
+from dataclasses import astuple
 
-from src.core.ranking_engine import NonprofitRankingEngine, RankingCriteria
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # response caching is disabled without redis
+    aioredis = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import re2 as regex_engine  # linear-time DFA matching
+except ImportError:
+    import re as regex_engine
+
+try:
+    import orjson  # noqa: F401  (required by ORJSONResponse)
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+except ImportError:
+    DefaultResponse = JSONResponse
+
+from src.core.ranking_engine import NonprofitRankingEngine, RankingCriteria, rank_in_process
 from src.collectors.irs_collector import IRS990Collector
 from src.collectors.web_scraper import NonprofitWebScraper
 from src.collectors.social_media import SocialMediaCollector
@@ -24,9 +57,13 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="Red Cross Nonprofit Partner Finder",
     description="AI-powered system for identifying and ranking nonprofit partners aligned with Red Cross mission",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=DefaultResponse
 )
 
+# Validate hot-path responses against their Pydantic models (slower; for development)
+VALIDATE_RESPONSES = bool(os.getenv('FASTAPI_VALIDATE_RESPONSES'))
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -42,10 +79,135 @@ web_scraper = NonprofitWebScraper()
 social_collector = SocialMediaCollector()
 ranking_engine = NonprofitRankingEngine()
 
+# Shared response cache (only when REDIS_URL is set and redis is installed)
+SEARCH_CACHE_TTL = 3600
+DETAIL_CACHE_TTL = 3600
+redis_client = aioredis.from_url(os.environ['REDIS_URL']) if aioredis and os.getenv('REDIS_URL') else None
+
+# Worker threads for blocking work (ranking, scraping); anyio defaults to 40
+THREADPOOL_SIZE = 100
+
+# Nonprofits enriched at once by background tasks (limits load on scraped/social sites)
+ENRICHMENT_CONCURRENCY = 8
+enrichment_semaphore = asyncio.Semaphore(ENRICHMENT_CONCURRENCY)
+
+
+# Processes for ranking (CPU-bound; a thread would hold the GIL); 0 ranks in-process.
+# Off by default: __main__ already runs one uvicorn worker per CPU, and every
+# ranking process loads its own copy of the sentence model, so a pool per worker
+# would hold cpu_count squared models. Enable for a single-worker deployment.
+RANKING_PROCESSES = int(os.getenv('RANKING_PROCESSES', '0'))
+ranking_executor: Optional[ProcessPoolExecutor] = None
+
+
+@app.on_event("startup")
+async def configure_threadpool():
+    """Raise the threadpool limit used for blocking ranking and enrichment work"""
+    to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+
+
+@app.on_event("startup")
+async def start_ranking_executor():
+    """Start the ranking worker processes (spawned: the model and torch don't survive fork)"""
+    global ranking_executor
+    if RANKING_PROCESSES > 0:
+        ranking_executor = ProcessPoolExecutor(
+            max_workers=RANKING_PROCESSES,
+            mp_context=multiprocessing.get_context('spawn')
+        )
+
+
+@app.on_event("shutdown")
+async def close_collectors():
+    """Release the collector's pooled HTTP connections"""
+    await irs_collector.aclose()
+    if redis_client is not None:
+        await redis_client.close()
+    if ranking_executor is not None:
+        ranking_executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _pack(value: Any) -> bytes:
+    if msgpack is not None:
+        return msgpack.packb(value, use_bin_type=True)
+    return json.dumps(value).encode()
+
+
+def _unpack(raw: bytes) -> Any:
+    if msgpack is not None:
+        return msgpack.unpackb(raw, raw=False)
+    return json.loads(raw)
+
+
+async def cache_get(key: str) -> Optional[Any]:
+    """Cached response for key, or None on a miss (or when caching is off)"""
+    if redis_client is None:
+        return None
+    try:
+        raw = await redis_client.get(key)
+    except Exception as e:
+        logger.warning(f"Cache read failed for {key}: {e}")
+        return None
+    return _unpack(raw) if raw is not None else None
+
+
+async def cache_set(key: str, value: Any, ttl: int):
+    if redis_client is None:
+        return
+    try:
+        await redis_client.setex(key, ttl, _pack(jsonable_encoder(value)))
+    except Exception as e:
+        logger.warning(f"Cache write failed for {key}: {e}")
+
+
+async def cache_delete(*keys: str):
+    if redis_client is None or not keys:
+        return
+    try:
+        await redis_client.delete(*keys)
+    except Exception as e:
+        logger.warning(f"Cache invalidation failed: {e}")
+
+
+def fast_response(content: Any):
+    """
+    Plain dict/list content serialized straight by the default response class,
+    skipping response-model validation and FastAPI's encoder pass
+    """
+    if VALIDATE_RESPONSES:
+        return content
+    return DefaultResponse(content=content)
+
+
+# Input formats, checked before any ProPublica call
+EIN_PATTERN = r'^\d{2}-?\d{7}$'
+ZIP_PATTERN = r'^\d{5}$'
+EIN_RE = regex_engine.compile(EIN_PATTERN)
+
+
+def normalize_ein(ein: str) -> str:
+    """EIN without the hyphen; 400 if it is not 9 digits (optionally NN-NNNNNNN)"""
+    if not EIN_RE.match(ein):
+        raise HTTPException(status_code=400, detail=f"Invalid EIN: {ein}")
+    return ein.replace('-', '')
+
+
+def valid_ein(ein: str) -> str:
+    """Path-parameter dependency for /{ein} routes"""
+    return normalize_ein(ein)
+
+
+def search_cache_key(request: "NonprofitSearchRequest") -> str:
+    return f"search:{request.zip_code}:{request.radius_miles}:{request.min_revenue}:{request.max_results}"
+
+
+def nonprofit_cache_key(ein: str) -> str:
+    return f"nonprofit:{ein}"
+
 
 # Pydantic models for API
 class NonprofitSearchRequest(BaseModel):
-    zip_code: str = Field(..., description="ZIP code to search")
+    zip_code: str = Field(..., regex=ZIP_PATTERN, description="ZIP code to search")
     radius_miles: int = Field(25, description="Search radius in miles")
     min_revenue: Optional[float] = Field(None, description="Minimum annual revenue")
     max_results: int = Field(20, description="Maximum number of results")
@@ -99,7 +261,11 @@ async def root():
     }
 
 
-@app.post("/search", response_model=List[NonprofitResponse])
+@app.post(
+    "/search",
+    response_model=List[NonprofitResponse] if VALIDATE_RESPONSES else None,
+    responses={200: {"model": List[NonprofitResponse]}}
+)
 async def search_nonprofits(
     request: NonprofitSearchRequest,
     background_tasks: BackgroundTasks
@@ -110,8 +276,13 @@ async def search_nonprofits(
     try:
         logger.info(f"Searching nonprofits in ZIP {request.zip_code}")
         
+        cache_key = search_cache_key(request)
+        cached = await cache_get(cache_key)
+        if cached is not None:
+            return fast_response(cached)
+        
         # Search for nonprofits using IRS data
-        search_results = irs_collector.search_by_zip(
+        search_results = await irs_collector.asearch_by_zip(
             request.zip_code, 
             request.radius_miles
         )
@@ -119,10 +290,13 @@ async def search_nonprofits(
         if not search_results:
             raise HTTPException(status_code=404, detail="No nonprofits found in this area")
         
-        # Collect detailed data for each nonprofit
+        # Collect detailed data for each nonprofit concurrently
+        details = await irs_collector.aget_nonprofit_details_bulk(
+            [result['ein'] for result in search_results[:request.max_results]]
+        )
+        
         nonprofits = []
-        for result in search_results[:request.max_results]:
-            nonprofit = irs_collector.get_nonprofit_details(result['ein'])
+        for nonprofit in details.values():
             if nonprofit:
                 # Skip if below minimum revenue threshold
                 if request.min_revenue:
@@ -132,28 +306,29 @@ async def search_nonprofits(
                 
                 nonprofits.append(nonprofit)
         
-        # Rank nonprofits
-        ranked_nonprofits = ranking_engine.rank_nonprofits(nonprofits)
+        # Rank nonprofits (CPU-bound; keep it off the event loop)
+        ranked_nonprofits = await run_in_threadpool(rank_cached, nonprofits)
         
         # Background task to collect additional data
-        background_tasks.add_task(enrich_nonprofit_data, ranked_nonprofits)
+        background_tasks.add_task(enrich_nonprofit_data, ranked_nonprofits, cache_key)
         
-        # Format response
+        # Format response (fields of NonprofitResponse)
         response = []
         for np in ranked_nonprofits:
-            response.append(NonprofitResponse(
-                ein=np.ein,
-                name=np.name,
-                rank=np.ranking,
-                overall_score=np.overall_score,
-                mission_alignment_score=np.mission_alignment.score if np.mission_alignment else None,
-                roi_potential=np.partnership_roi.estimated_value if np.partnership_roi else None,
-                website=np.website,
-                mission_statement=np.mission_statement[:200] + "..." if np.mission_statement and len(np.mission_statement) > 200 else np.mission_statement,
-                explanation=ranking_engine.explain_ranking(np)
-            ))
+            response.append({
+                "ein": np.ein,
+                "name": np.name,
+                "rank": np.ranking,
+                "overall_score": np.overall_score,
+                "mission_alignment_score": np.mission_alignment.score if np.mission_alignment else None,
+                "roi_potential": np.partnership_roi.estimated_value if np.partnership_roi else None,
+                "website": np.website,
+                "mission_statement": np.mission_preview,
+                "explanation": ranking_engine.explain_ranking(np)
+            })
         
-        return response
+        await cache_set(cache_key, response, SEARCH_CACHE_TTL)
+        return fast_response(response)
         
     except Exception as e:
         logger.error(f"Search error: {e}")
@@ -161,21 +336,22 @@ async def search_nonprofits(
 
 
 @app.get("/nonprofit/{ein}", response_model=DetailedNonprofitResponse)
-async def get_nonprofit_details(ein: str):
+async def get_nonprofit_details(ein: str = Depends(valid_ein)):
     """
     Get detailed information about a specific nonprofit
     """
     try:
+        cached = await cache_get(nonprofit_cache_key(ein))
+        if cached is not None:
+            return cached
+        
         # Get nonprofit data
-        nonprofit = irs_collector.get_nonprofit_details(ein)
+        nonprofit = await irs_collector.aget_nonprofit_details(ein)
         if not nonprofit:
             raise HTTPException(status_code=404, detail="Nonprofit not found")
         
         # Perform analysis
-        nonprofit.mission_alignment = ranking_engine.mission_analyzer.analyze_alignment(nonprofit)
-        nonprofit.partnership_roi = ranking_engine.roi_calculator.calculate_roi(nonprofit)
-        nonprofit.overall_score = ranking_engine._calculate_overall_score(nonprofit)
-        nonprofit.ranking = 1  # Single nonprofit
+        await run_in_threadpool(score_nonprofit, nonprofit)
         
         # Format financial summary
         financial_summary = None
@@ -190,7 +366,7 @@ async def get_nonprofit_details(ein: str):
             }
         
         # Format response
-        return DetailedNonprofitResponse(
+        response = DetailedNonprofitResponse(
             ein=nonprofit.ein,
             name=nonprofit.name,
             rank=nonprofit.ranking,
@@ -219,6 +395,9 @@ async def get_nonprofit_details(ein: str):
             explanation=ranking_engine.explain_ranking(nonprofit)
         )
         
+        await cache_set(nonprofit_cache_key(ein), response, DETAIL_CACHE_TTL)
+        return response
+        
     except HTTPException:
         raise
     except Exception as e:
@@ -227,13 +406,13 @@ async def get_nonprofit_details(ein: str):
 
 
 @app.post("/analyze/{ein}")
-async def analyze_nonprofit(ein: str, background_tasks: BackgroundTasks):
+async def analyze_nonprofit(background_tasks: BackgroundTasks, ein: str = Depends(valid_ein)):
     """
     Perform deep analysis including web scraping and social media
     """
     try:
         # Get basic nonprofit data
-        nonprofit = irs_collector.get_nonprofit_details(ein)
+        nonprofit = await irs_collector.aget_nonprofit_details(ein)
         if not nonprofit:
             raise HTTPException(status_code=404, detail="Nonprofit not found")
         
@@ -260,6 +439,8 @@ async def rank_nonprofits(
     """
     Rank a custom list of nonprofits
     """
+    eins = [normalize_ein(ein) for ein in eins]
+    
     try:
         # Update ranking criteria if provided
         if criteria:
@@ -272,17 +453,14 @@ async def rank_nonprofits(
             )
         
         # Collect nonprofit data
-        nonprofits = []
-        for ein in eins:
-            nonprofit = irs_collector.get_nonprofit_details(ein)
-            if nonprofit:
-                nonprofits.append(nonprofit)
+        details = await irs_collector.aget_nonprofit_details_bulk(eins)
+        nonprofits = [nonprofit for nonprofit in details.values() if nonprofit]
         
         if not nonprofits:
             raise HTTPException(status_code=404, detail="No valid nonprofits found")
         
         # Rank nonprofits
-        ranked_nonprofits = ranking_engine.rank_nonprofits(nonprofits)
+        ranked_nonprofits = await run_in_threadpool(rank_cached, nonprofits)
         
         # Format response
         response = []
@@ -296,7 +474,7 @@ async def rank_nonprofits(
                 "roi_potential": np.partnership_roi.estimated_value if np.partnership_roi else None
             })
         
-        return response
+        return fast_response(response)
         
     except Exception as e:
         logger.error(f"Ranking error: {e}")
@@ -308,16 +486,20 @@ async def compare_nonprofits(ein1: str, ein2: str):
     """
     Compare two nonprofits side by side
     """
+    ein1, ein2 = normalize_ein(ein1), normalize_ein(ein2)
+    
     try:
         # Get both nonprofits
-        nonprofit1 = irs_collector.get_nonprofit_details(ein1)
-        nonprofit2 = irs_collector.get_nonprofit_details(ein2)
+        nonprofit1, nonprofit2 = await asyncio.gather(
+            irs_collector.aget_nonprofit_details(ein1),
+            irs_collector.aget_nonprofit_details(ein2)
+        )
         
         if not nonprofit1 or not nonprofit2:
             raise HTTPException(status_code=404, detail="One or both nonprofits not found")
         
         # Analyze both
-        nonprofits = ranking_engine.rank_nonprofits([nonprofit1, nonprofit2])
+        nonprofits = await run_in_threadpool(rank_cached, [nonprofit1, nonprofit2])
         
         # Generate comparison
         comparison = ranking_engine.compare_nonprofits(nonprofits[0], nonprofits[1])
@@ -331,7 +513,7 @@ async def compare_nonprofits(ein1: str, ein2: str):
 
 @app.get("/export")
 async def export_results(
-    zip_code: str,
+    zip_code: str = Query(..., regex=ZIP_PATTERN),
     format: str = Query("csv", regex="^(csv|json)$")
 ):
     """
@@ -339,47 +521,19 @@ async def export_results(
     """
     try:
         # Search and rank nonprofits
-        search_results = irs_collector.search_by_zip(zip_code, 25)
-        nonprofits = []
+        search_results = await irs_collector.asearch_by_zip(zip_code, 25)
         
-        for result in search_results[:50]:  # Limit to 50 for export
-            nonprofit = irs_collector.get_nonprofit_details(result['ein'])
-            if nonprofit:
-                nonprofits.append(nonprofit)
+        details = await irs_collector.aget_nonprofit_details_bulk(
+            [result['ein'] for result in search_results[:50]]  # Limit to 50 for export
+        )
+        nonprofits = [nonprofit for nonprofit in details.values() if nonprofit]
         
-        ranked_nonprofits = ranking_engine.rank_nonprofits(nonprofits)
+        ranked_nonprofits = await run_in_threadpool(rank_cached, nonprofits)
         
         if format == "csv":
-            # Generate CSV
-            output = io.StringIO()
-            writer = csv.writer(output)
-            
-            # Header
-            writer.writerow([
-                "Rank", "EIN", "Name", "Overall Score", "Mission Alignment",
-                "ROI Potential", "Annual Revenue", "Program Efficiency",
-                "Website", "Mission Statement"
-            ])
-            
-            # Data rows
-            for np in ranked_nonprofits:
-                latest_financials = np.get_latest_financials()
-                writer.writerow([
-                    np.ranking,
-                    np.ein,
-                    np.name,
-                    f"{np.overall_score:.2f}",
-                    f"{np.mission_alignment.score:.2f}" if np.mission_alignment else "",
-                    f"{np.partnership_roi.estimated_value:.0f}" if np.partnership_roi else "",
-                    f"{latest_financials.total_revenue:.0f}" if latest_financials else "",
-                    f"{latest_financials.program_expense_ratio:.2f}" if latest_financials else "",
-                    np.website or "",
-                    np.mission_statement[:200] if np.mission_statement else ""
-                ])
-            
-            output.seek(0)
+            # Stream CSV rows as they are formatted
             return StreamingResponse(
-                io.BytesIO(output.getvalue().encode()),
+                iter_csv_rows(ranked_nonprofits),
                 media_type="text/csv",
                 headers={"Content-Disposition": f"attachment; filename=nonprofits_{zip_code}.csv"}
             )
@@ -409,38 +563,163 @@ async def export_results(
                     "mission": np.mission_statement
                 })
             
-            return JSONResponse(content=data)
+            return DefaultResponse(content=data)
         
     except Exception as e:
         logger.error(f"Export error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+EXPORT_CSV_HEADER = [
+    "Rank", "EIN", "Name", "Overall Score", "Mission Alignment",
+    "ROI Potential", "Annual Revenue", "Program Efficiency",
+    "Website", "Mission Statement"
+]
+
+
+def iter_csv_rows(ranked_nonprofits: List[Nonprofit]):
+    """Yield the export CSV one encoded row at a time (header first)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    
+    def flush() -> bytes:
+        line = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+        return line.encode()
+    
+    writer.writerow(EXPORT_CSV_HEADER)
+    yield flush()
+    
+    for np in ranked_nonprofits:
+        latest_financials = np.get_latest_financials()
+        writer.writerow([
+            np.ranking,
+            np.ein,
+            np.name,
+            f"{np.overall_score:.2f}",
+            f"{np.mission_alignment.score:.2f}" if np.mission_alignment else "",
+            f"{np.partnership_roi.estimated_value:.0f}" if np.partnership_roi else "",
+            f"{latest_financials.total_revenue:.0f}" if latest_financials else "",
+            f"{latest_financials.program_expense_ratio:.2f}" if latest_financials else "",
+            np.website or "",
+            np.mission_statement[:200] if np.mission_statement else ""
+        ])
+        yield flush()
+
+
+# (sorted EINs, criteria weights, collector data version) -> [(ein, score, alignment, roi)] in rank order
+RANKING_CACHE_SIZE = 2048
+_ranking_cache = OrderedDict()
+_ranking_cache_lock = threading.Lock()
+
+
+def rank_cached(nonprofits: List[Nonprofit]) -> List[Nonprofit]:
+    """
+    rank_nonprofits_parallel, memoized on the set of EINs and the ranking
+    criteria; a hit copies the stored scores onto the freshly fetched objects
+    """
+    key = (
+        tuple(sorted(nonprofit.ein for nonprofit in nonprofits)),
+        astuple(ranking_engine.criteria),
+        irs_collector.data_version
+    )
+    with _ranking_cache_lock:
+        cached = _ranking_cache.get(key)
+        if cached is not None:
+            _ranking_cache.move_to_end(key)
+    
+    if cached is None:
+        ranked = rank_nonprofits_parallel(nonprofits)
+        with _ranking_cache_lock:
+            _ranking_cache[key] = [
+                (n.ein, n.overall_score, n.mission_alignment, n.partnership_roi) for n in ranked
+            ]
+            while len(_ranking_cache) > RANKING_CACHE_SIZE:
+                _ranking_cache.popitem(last=False)
+        return ranked
+    
+    by_ein = {nonprofit.ein: nonprofit for nonprofit in nonprofits}
+    ranked = []
+    for rank, (ein, overall_score, alignment, roi) in enumerate(cached, 1):
+        nonprofit = by_ein[ein]
+        nonprofit.overall_score = overall_score
+        nonprofit.mission_alignment = alignment
+        nonprofit.partnership_roi = roi
+        nonprofit.ranking = rank
+        ranked.append(nonprofit)
+    return ranked
+
+
+def rank_nonprofits_parallel(nonprofits: List[Nonprofit]) -> List[Nonprofit]:
+    """
+    Rank in a worker process so concurrent rankings use separate cores; falls
+    back to the in-process engine if the pool is disabled or broken.
+    Returns the ranked copies produced by the worker.
+    """
+    if ranking_executor is not None:
+        try:
+            return ranking_executor.submit(rank_in_process, nonprofits, ranking_engine.criteria).result()
+        except BrokenProcessPool as e:
+            logger.error(f"Ranking worker pool failed, ranking in-process: {e}")
+    return ranking_engine.rank_nonprofits(nonprofits)
+
+
+def score_nonprofit(nonprofit: Nonprofit):
+    """Analyze and score a single nonprofit (blocking; run in the threadpool)"""
+    nonprofit.mission_alignment = ranking_engine.mission_analyzer.analyze_alignment(nonprofit)
+    nonprofit.partnership_roi = ranking_engine.roi_calculator.calculate_roi(nonprofit)
+    nonprofit.overall_score = ranking_engine._calculate_overall_score(nonprofit)
+    nonprofit.ranking = 1  # Single nonprofit
+
+
 # Background tasks
-async def enrich_nonprofit_data(nonprofits: List[Nonprofit]):
+async def enrich_nonprofit_data(nonprofits: List[Nonprofit], cache_key: Optional[str] = None):
     """Background task to enrich nonprofit data with web and social media info"""
-    for nonprofit in nonprofits:
-        try:
-            # Scrape website if available
-            if nonprofit.website:
-                web_scraper.scrape_nonprofit_website(nonprofit)
-            
-            # Get social media data
-            social_accounts = social_collector.search_social_accounts(nonprofit.name)
-            if social_accounts:
-                nonprofit.social_media = social_collector.analyze_social_presence(
-                    nonprofit.name, social_accounts
-                )
-            
-            # Update data quality score
-            nonprofit.data_quality_score = calculate_data_quality(nonprofit)
-            
-        except Exception as e:
-            logger.error(f"Error enriching data for {nonprofit.name}: {e}")
+    async def enrich_one(nonprofit: Nonprofit):
+        async with enrichment_semaphore:
+            await run_in_threadpool(enrich_nonprofit, nonprofit)
+    
+    await asyncio.gather(*(enrich_one(nonprofit) for nonprofit in nonprofits))
+    
+    # Update data quality scores
+    for nonprofit, score in zip(nonprofits, calculate_data_quality_batch(nonprofits).tolist()):
+        nonprofit.data_quality_score = score
+    
+    # Cached responses no longer reflect the enriched data
+    stale_keys = [nonprofit_cache_key(nonprofit.ein) for nonprofit in nonprofits]
+    if cache_key:
+        stale_keys.append(cache_key)
+    await cache_delete(*stale_keys)
+
+
+def enrich_nonprofit(nonprofit: Nonprofit):
+    """Scrape and collect social media data for one nonprofit (blocking)"""
+    try:
+        # Scrape website if available
+        if nonprofit.website:
+            web_scraper.scrape_nonprofit_website(nonprofit)
+        
+        # Get social media data
+        social_accounts = social_collector.search_social_accounts(nonprofit.name)
+        if social_accounts:
+            nonprofit.social_media = social_collector.analyze_social_presence(
+                nonprofit.name, social_accounts
+            )
+            nonprofit.last_updated = datetime.now()
+        
+    except Exception as e:
+        logger.error(f"Error enriching data for {nonprofit.name}: {e}")
 
 
 async def deep_analyze_nonprofit(nonprofit: Nonprofit):
     """Perform deep analysis of a single nonprofit"""
+    if await run_in_threadpool(deep_analyze, nonprofit):
+        await cache_delete(nonprofit_cache_key(nonprofit.ein))
+
+
+def deep_analyze(nonprofit: Nonprofit) -> bool:
+    """Scrape, collect social media and re-score one nonprofit (blocking); True on success"""
     try:
         # Web scraping
         if nonprofit.website:
@@ -457,6 +736,7 @@ async def deep_analyze_nonprofit(nonprofit: Nonprofit):
             nonprofit.social_media = social_collector.analyze_social_presence(
                 nonprofit.name, social_accounts
             )
+            nonprofit.last_updated = datetime.now()
             logger.info(f"Analyzed social media for {nonprofit.name}")
         
         # Update analysis
@@ -465,48 +745,55 @@ async def deep_analyze_nonprofit(nonprofit: Nonprofit):
         nonprofit.data_quality_score = calculate_data_quality(nonprofit)
         
         logger.info(f"Deep analysis completed for {nonprofit.name}")
+        return True
         
     except Exception as e:
         logger.error(f"Deep analysis error for {nonprofit.name}: {e}")
+        return False
+
+
+# Completeness weights: mission, financial history, programs, website,
+# social media, leadership, address
+DATA_QUALITY_WEIGHTS = numpy.array([0.2, 0.25, 0.15, 0.1, 0.1, 0.1, 0.1])
+
+
+def data_quality_features(nonprofit: Nonprofit) -> List[float]:
+    """Completeness (0-1) of each field weighted in DATA_QUALITY_WEIGHTS"""
+    return [
+        bool(nonprofit.mission_statement),
+        min(1.0, len(nonprofit.financial_history or []) / 3),
+        min(1.0, len(nonprofit.programs or []) / 5),
+        bool(nonprofit.website),
+        min(1.0, len(nonprofit.social_media or []) / 3),
+        min(1.0, len(nonprofit.leadership or []) / 5),
+        bool(nonprofit.address and nonprofit.address.street)
+    ]
+
+
+def calculate_data_quality_batch(nonprofits: List[Nonprofit]) -> numpy.ndarray:
+    """Data quality scores for many nonprofits as one (N, 7) @ weights product"""
+    if not nonprofits:
+        return numpy.zeros(0)
+    presence = numpy.array([data_quality_features(n) for n in nonprofits], dtype=float)
+    return numpy.minimum(presence @ DATA_QUALITY_WEIGHTS, 1.0)
 
 
 def calculate_data_quality(nonprofit: Nonprofit) -> float:
     """Calculate data quality score based on completeness"""
-    score = 0.0
-    weights = {
-        'mission_statement': 0.2,
-        'financial_history': 0.25,
-        'programs': 0.15,
-        'website': 0.1,
-        'social_media': 0.1,
-        'leadership': 0.1,
-        'address': 0.1
-    }
-    
-    if nonprofit.mission_statement:
-        score += weights['mission_statement']
-    
-    if nonprofit.financial_history:
-        score += weights['financial_history'] * min(1.0, len(nonprofit.financial_history) / 3)
-    
-    if nonprofit.programs:
-        score += weights['programs'] * min(1.0, len(nonprofit.programs) / 5)
-    
-    if nonprofit.website:
-        score += weights['website']
-    
-    if nonprofit.social_media:
-        score += weights['social_media'] * min(1.0, len(nonprofit.social_media) / 3)
-    
-    if nonprofit.leadership:
-        score += weights['leadership'] * min(1.0, len(nonprofit.leadership) / 5)
-    
-    if nonprofit.address and nonprofit.address.street:
-        score += weights['address']
-    
-    return min(1.0, score)
+    return float(calculate_data_quality_batch([nonprofit])[0])
 
 
 if __name__ == "__main__":
+    import importlib.util
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    
+    # uvloop/httptools when installed; for HTTP/2 run under hypercorn instead:
+    #   hypercorn src.api.main:app --bind 0.0.0.0:8000 --worker-class uvloop
+    uvicorn.run(
+        "src.api.main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        http="httptools" if importlib.util.find_spec("httptools") else "h11",
+        workers=os.cpu_count()
+    )
\ No newline at end of file
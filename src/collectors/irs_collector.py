@@ -1,12 +1,38 @@
 import requests
 import xml.etree.ElementTree as ET
+import numpy as np
 import pandas as pd
 from typing import List, Dict, Optional, Any
 import logging
 from datetime import datetime
 import json
 import time
+import asyncio
+import copy
+import hashlib
+import os
+import random
+import threading
+from collections import OrderedDict
 from pathlib import Path
+from urllib.parse import urlencode
+import importlib.util
+
+try:
+    import httpx
+    import h2  # noqa: F401  (required for httpx's http2=True)
+except ImportError:
+    httpx = None
+
+try:
+    import aiohttp
+except ImportError:  # async methods fall back to the blocking session in a worker thread
+    aiohttp = None
+
+try:
+    import orjson
+except ImportError:  # stdlib json parses responses and the disk cache
+    orjson = None
 
 from src.models.nonprofit import (
     Nonprofit, Address, FinancialData, 
@@ -16,6 +42,63 @@ from src.models.nonprofit import (
 
 logger = logging.getLogger(__name__)
 
+def json_loads(data: bytes) -> Any:
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def json_dumps(value: Any) -> bytes:
+    return orjson.dumps(value) if orjson is not None else json.dumps(value).encode()
+
+
+# Compressed transfer for ProPublica JSON; brotli only when a decoder is installed
+# (requests/urllib3, httpx and aiohttp all decode it through the brotli packages)
+ACCEPT_ENCODING = 'gzip, deflate, br' if (
+    importlib.util.find_spec('brotli') or importlib.util.find_spec('brotlicffi')
+) else 'gzip, deflate'
+
+
+# Transport failures worth retrying on the async path
+ASYNC_RETRY_ERRORS = (asyncio.TimeoutError,)
+if httpx is not None:
+    ASYNC_RETRY_ERRORS += (httpx.TransportError,)
+if aiohttp is not None:
+    ASYNC_RETRY_ERRORS += (aiohttp.ClientConnectionError,)
+
+# IRS organization status codes -> NonprofitStatus (exact codes only)
+STATUS_BY_CODE = {
+    '01': NonprofitStatus.ACTIVE,
+    '02': NonprofitStatus.SUSPENDED,
+    '03': NonprofitStatus.INACTIVE,
+}
+
+# USPS 3-digit ZIP prefix ranges (inclusive) by state; military (AA/AE/AP)
+# and unassigned prefixes are left unmapped
+ZIP3_STATE_RANGES = [
+    (5, 5, 'NY'), (6, 7, 'PR'), (8, 8, 'VI'), (9, 9, 'PR'),
+    (10, 27, 'MA'), (28, 29, 'RI'), (30, 38, 'NH'), (39, 49, 'ME'),
+    (50, 54, 'VT'), (55, 55, 'MA'), (56, 59, 'VT'), (60, 69, 'CT'),
+    (70, 89, 'NJ'), (100, 149, 'NY'), (150, 196, 'PA'), (197, 199, 'DE'),
+    (200, 200, 'DC'), (201, 201, 'VA'), (202, 205, 'DC'), (206, 219, 'MD'),
+    (220, 246, 'VA'), (247, 268, 'WV'), (270, 289, 'NC'), (290, 299, 'SC'),
+    (300, 319, 'GA'), (320, 339, 'FL'), (341, 349, 'FL'), (350, 369, 'AL'),
+    (370, 385, 'TN'), (386, 397, 'MS'), (398, 399, 'GA'), (400, 427, 'KY'),
+    (430, 459, 'OH'), (460, 479, 'IN'), (480, 499, 'MI'), (500, 528, 'IA'),
+    (530, 549, 'WI'), (550, 567, 'MN'), (569, 569, 'DC'), (570, 577, 'SD'),
+    (580, 588, 'ND'), (590, 599, 'MT'), (600, 629, 'IL'), (630, 658, 'MO'),
+    (660, 679, 'KS'), (680, 693, 'NE'), (700, 714, 'LA'), (716, 729, 'AR'),
+    (730, 732, 'OK'), (733, 733, 'TX'), (734, 749, 'OK'), (750, 799, 'TX'),
+    (800, 816, 'CO'), (820, 831, 'WY'), (832, 838, 'ID'), (840, 847, 'UT'),
+    (850, 865, 'AZ'), (870, 884, 'NM'), (885, 885, 'TX'), (889, 898, 'NV'),
+    (900, 961, 'CA'), (967, 968, 'HI'), (969, 969, 'GU'), (970, 979, 'OR'),
+    (980, 994, 'WA'), (995, 999, 'AK'),
+]
+
+# Lookup table: ZIP3_STATE[int(zip[:3])] indexes STATES (0 = unknown)
+STATES = ('',) + tuple(sorted({state for _, _, state in ZIP3_STATE_RANGES}))
+ZIP3_STATE = np.zeros(1000, dtype=np.uint8)
+for _start, _end, _state in ZIP3_STATE_RANGES:
+    ZIP3_STATE[_start:_end + 1] = STATES.index(_state)
+
 
 class IRS990Collector:
     """
@@ -26,14 +109,312 @@ class IRS990Collector:
     BASE_URL = "https://www.irs.gov/pub/irs-soi"
     AWS_990_URL = "https://s3.amazonaws.com/irs-form-990"
     PROPUBLICA_API = "https://projects.propublica.org/nonprofits/api/v2"
+    USER_AGENT = 'NonprofitAnalyzer/1.0 (Red Cross Partner Finder)'
+    DEFAULT_HEADERS = {'User-Agent': USER_AGENT, 'Accept-Encoding': ACCEPT_ENCODING}
+    
+    # Connection cap for concurrent async requests to ProPublica
+    MAX_CONNECTIONS_PER_HOST = 64
+    
+    # HTTP/2 client pool (concurrent requests multiplex over few connections)
+    HTTP2_MAX_CONNECTIONS = 100
+    HTTP2_MAX_KEEPALIVE = 50
+    
+    # (connect, read) seconds for blocking requests; a stalled connection is
+    # retried like any other timeout
+    REQUEST_TIMEOUT = (3, 10)
+    
+    # Detail lookups in flight at once for bulk fetches
+    BULK_CONCURRENCY = 64
+    
+    # Response bodies kept in memory (revalidated with ETag/Last-Modified)
+    HTTP_CACHE_SIZE = 1024
+    
+    # Parsed Nonprofit objects are reused for this long without revalidating
+    NONPROFIT_CACHE_TTL = 86400
+    NONPROFIT_CACHE_SIZE = 4096
+    
+    # EINs whose filings-by-year index is kept (same TTL)
+    FILINGS_CACHE_SIZE = 4096
+    
+    # Client-side rate limit; slowed down (up to MIN_REQUEST_RATE) when ProPublica pushes back
+    MAX_REQUEST_RATE = 10.0  # requests per second
+    MIN_REQUEST_RATE = 0.5
+    
+    # Retries for throttled/unavailable responses, with exponential backoff + jitter
+    MAX_RETRIES = 5
+    MAX_BACKOFF = 30.0
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
     
     def __init__(self, cache_dir: str = "./data/irs_cache"):
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.http_cache_dir = self.cache_dir / "http"
+        self.http_cache_dir.mkdir(exist_ok=True)
         self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'NonprofitAnalyzer/1.0 (Red Cross Partner Finder)'
-        })
+        self.session.headers.update(self.DEFAULT_HEADERS)
+        
+        # Async client, created lazily on the running loop: httpx over HTTP/2
+        # when available, otherwise aiohttp
+        self._http2_client = None
+        self._aio_session = None
+        
+        # url -> {'etag', 'last_modified', 'body'}, backed by files in http_cache_dir
+        self._http_cache = OrderedDict()
+        self._http_cache_lock = threading.Lock()
+        
+        # ein -> (fetched_at, Nonprofit), LRU; data_version is bumped whenever a
+        # cached EIN is refetched or dropped, so results derived from it can be invalidated
+        self._nonprofit_cache = OrderedDict()
+        self._nonprofit_cache_lock = threading.Lock()
+        self.data_version = 0
+        
+        # ein -> (indexed_at, {tax year: filing}) from the latest organization record, LRU
+        self._filings_by_year = OrderedDict()
+        self._filings_lock = threading.Lock()
+        
+        # Shared by the blocking and async paths: each request reserves the next send slot
+        self._rate_lock = threading.Lock()
+        self._request_interval = 1.0 / self.MAX_REQUEST_RATE
+        self._next_request_at = 0.0
+    
+    async def _get_aio_session(self):
+        """Shared aiohttp session (one connection pool for all async requests)"""
+        if self._aio_session is None or self._aio_session.closed:
+            self._aio_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit_per_host=self.MAX_CONNECTIONS_PER_HOST),
+                headers=self.DEFAULT_HEADERS
+            )
+        return self._aio_session
+    
+    def _get_http2_client(self):
+        """Shared httpx client speaking HTTP/2 to ProPublica"""
+        if self._http2_client is None or self._http2_client.is_closed:
+            self._http2_client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=self.HTTP2_MAX_CONNECTIONS,
+                    max_keepalive_connections=self.HTTP2_MAX_KEEPALIVE
+                ),
+                headers=self.DEFAULT_HEADERS
+            )
+        return self._http2_client
+    
+    async def aclose(self):
+        """Close the async clients (call on application shutdown)"""
+        if self._http2_client is not None and not self._http2_client.is_closed:
+            await self._http2_client.aclose()
+        self._http2_client = None
+        if self._aio_session is not None and not self._aio_session.closed:
+            await self._aio_session.close()
+        self._aio_session = None
+    
+    def _get_json(self, url: str, params: Dict = None) -> Optional[Dict]:
+        """Blocking GET of a ProPublica JSON document; None unless 200 (or 304 on a cached copy)"""
+        key = self._http_cache_key(url, params)
+        entry = self._cached_response(key)
+        headers = self._conditional_headers(entry)
+        
+        for attempt in range(self.MAX_RETRIES + 1):
+            time.sleep(self._reserve_request_slot())
+            try:
+                response = self.session.get(url, params=params, headers=headers, timeout=self.REQUEST_TIMEOUT)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt == self.MAX_RETRIES:
+                    raise
+                logger.debug(f"Retrying {url} after {e}")
+                time.sleep(self._backoff_delay(attempt))
+                continue
+            
+            self._update_rate_limit(response.status_code, response.headers)
+            if response.status_code in self.RETRY_STATUSES and attempt < self.MAX_RETRIES:
+                time.sleep(self._backoff_delay(attempt, response.headers))
+                continue
+            break
+        
+        if response.status_code == 304 and entry:
+            return entry['body']
+        if response.status_code != 200:
+            return None
+        
+        body = json_loads(response.content)
+        self._store_response(key, response.headers, body)
+        return body
+    
+    async def _aget_json(self, url: str, params: Dict = None) -> Optional[Dict]:
+        """GET a ProPublica JSON document without blocking the event loop; None unless 200 (or 304)"""
+        if httpx is None and aiohttp is None:
+            return await asyncio.to_thread(self._get_json, url, params)
+        
+        key = self._http_cache_key(url, params)
+        entry = self._cached_response(key)
+        headers = self._conditional_headers(entry)
+        
+        for attempt in range(self.MAX_RETRIES + 1):
+            await asyncio.sleep(self._reserve_request_slot())
+            try:
+                status, response_headers, body = await self._afetch_json(url, params, headers)
+            except ASYNC_RETRY_ERRORS as e:
+                if attempt == self.MAX_RETRIES:
+                    raise
+                logger.debug(f"Retrying {url} after {e!r}")
+                await asyncio.sleep(self._backoff_delay(attempt))
+                continue
+            
+            self._update_rate_limit(status, response_headers)
+            if status in self.RETRY_STATUSES and attempt < self.MAX_RETRIES:
+                await asyncio.sleep(self._backoff_delay(attempt, response_headers))
+                continue
+            break
+        
+        if status == 304 and entry:
+            return entry['body']
+        if status != 200:
+            return None
+        
+        self._store_response(key, response_headers, body)
+        return body
+    
+    async def _afetch_json(self, url: str, params: Optional[Dict], headers: Dict):
+        """One async GET: (status, response headers, parsed body if 200 else None)"""
+        if httpx is not None:
+            response = await self._get_http2_client().get(url, params=params, headers=headers)
+            body = json_loads(response.content) if response.status_code == 200 else None
+            return response.status_code, response.headers, body
+        
+        session = await self._get_aio_session()
+        async with session.get(url, params=params, headers=headers) as response:
+            body = json_loads(await response.read()) if response.status == 200 else None
+            return response.status, response.headers, body
+    
+    def _reserve_request_slot(self) -> float:
+        """Claim the next send slot under the rate limit; returns seconds to wait before sending"""
+        with self._rate_lock:
+            now = time.monotonic()
+            slot = max(now, self._next_request_at)
+            self._next_request_at = slot + self._request_interval
+            return slot - now
+    
+    def _update_rate_limit(self, status: int, headers):
+        """Adapt the request rate to ProPublica's throttling signals"""
+        retry_after = self._retry_after(headers)
+        remaining = headers.get('X-RateLimit-Remaining')
+        
+        with self._rate_lock:
+            if status == 429 or (remaining is not None and remaining.strip() == '0'):
+                # Halve the rate and hold every caller until the server's window reopens
+                self._request_interval = min(self._request_interval * 2, 1.0 / self.MIN_REQUEST_RATE)
+                if retry_after is not None:
+                    self._next_request_at = max(self._next_request_at, time.monotonic() + retry_after)
+            elif status < 500:
+                # Recover gradually toward the configured rate
+                self._request_interval = max(self._request_interval * 0.9, 1.0 / self.MAX_REQUEST_RATE)
+    
+    def _backoff_delay(self, attempt: int, headers=None) -> float:
+        """Retry-After if the server sent one, otherwise exponential backoff with jitter"""
+        retry_after = self._retry_after(headers) if headers is not None else None
+        if retry_after is not None:
+            return min(retry_after, self.MAX_BACKOFF)
+        return min(2 ** attempt + random.random(), self.MAX_BACKOFF)
+    
+    @staticmethod
+    def _retry_after(headers) -> Optional[float]:
+        """Retry-After in seconds (only the delta-seconds form is used)"""
+        value = headers.get('Retry-After')
+        try:
+            return max(0.0, float(value)) if value is not None else None
+        except ValueError:
+            return None
+    
+    def _http_cache_key(self, url: str, params: Dict = None) -> str:
+        """Cache key for a GET request: the full URL with sorted query parameters"""
+        if params:
+            return f"{url}?{urlencode(sorted(params.items()))}"
+        return url
+    
+    def _http_cache_path(self, key: str) -> Path:
+        return self.http_cache_dir / f"{hashlib.sha1(key.encode()).hexdigest()}.json"
+    
+    def _cached_response(self, key: str) -> Optional[Dict]:
+        """Cached response entry from memory, falling back to disk"""
+        with self._http_cache_lock:
+            entry = self._http_cache.get(key)
+            if entry is not None:
+                self._http_cache.move_to_end(key)
+                return entry
+        
+        path = self._http_cache_path(key)
+        try:
+            with open(path, 'rb') as f:
+                entry = json_loads(f.read())
+        except (OSError, ValueError):
+            return None
+        
+        self._remember_response(key, entry)
+        return entry
+    
+    def _store_response(self, key: str, headers, body: Dict):
+        """Cache a 200 response if the server gave us a validator to revalidate it with"""
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+        
+        entry = {'etag': etag, 'last_modified': last_modified, 'body': body}
+        self._remember_response(key, entry)
+        
+        path = self._http_cache_path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(json_dumps(entry))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug(f"Could not write HTTP cache entry for {key}: {e}")
+    
+    def _remember_response(self, key: str, entry: Dict):
+        with self._http_cache_lock:
+            self._http_cache[key] = entry
+            self._http_cache.move_to_end(key)
+            while len(self._http_cache) > self.HTTP_CACHE_SIZE:
+                self._http_cache.popitem(last=False)
+    
+    @staticmethod
+    def _conditional_headers(entry: Optional[Dict]) -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since headers for revalidating a cached entry"""
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+    
+    def _cached_nonprofit(self, ein: str) -> Optional[Nonprofit]:
+        """Copy of a recently fetched Nonprofit (callers mutate scores and rankings)"""
+        with self._nonprofit_cache_lock:
+            cached = self._nonprofit_cache.get(ein)
+            if cached is None:
+                return None
+            
+            fetched_at, nonprofit = cached
+            if time.time() - fetched_at > self.NONPROFIT_CACHE_TTL:
+                del self._nonprofit_cache[ein]
+                self.data_version += 1
+                return None
+            self._nonprofit_cache.move_to_end(ein)
+        return copy.deepcopy(nonprofit)
+    
+    def _cache_nonprofit(self, nonprofit: Nonprofit) -> Nonprofit:
+        entry = (time.time(), copy.deepcopy(nonprofit))
+        with self._nonprofit_cache_lock:
+            if nonprofit.ein in self._nonprofit_cache:
+                self.data_version += 1
+            self._nonprofit_cache[nonprofit.ein] = entry
+            self._nonprofit_cache.move_to_end(nonprofit.ein)
+            while len(self._nonprofit_cache) > self.NONPROFIT_CACHE_SIZE:
+                self._nonprofit_cache.popitem(last=False)
+                self.data_version += 1
+        return nonprofit
     
     def search_by_zip(self, zip_code: str, radius_miles: int = 25) -> List[Dict[str, Any]]:
         """
@@ -51,20 +432,9 @@ class IRS990Collector:
                 'state': self._get_state_from_zip(zip_code)
             }
             
-            response = self.session.get(search_url, params=params)
-            if response.status_code == 200:
-                data = response.json()
-                organizations = data.get('organizations', [])
-                
-                for org in organizations:
-                    results.append({
-                        'ein': org.get('ein'),
-                        'name': org.get('name'),
-                        'city': org.get('city'),
-                        'state': org.get('state'),
-                        'ntee_code': org.get('ntee_code'),
-                        'subsection_code': org.get('subsection_code')
-                    })
+            data = self._get_json(search_url, params=params)
+            if data:
+                results = self._parse_search_results(data)
                     
             logger.info(f"Found {len(results)} nonprofits in ZIP {zip_code}")
             
@@ -73,58 +443,158 @@ class IRS990Collector:
         
         return results
     
+    async def asearch_by_zip(self, zip_code: str, radius_miles: int = 25) -> List[Dict[str, Any]]:
+        """
+        Async version of search_by_zip
+        """
+        results = []
+        
+        try:
+            search_url = f"{self.PROPUBLICA_API}/search.json"
+            params = {
+                'q': f'zip:{zip_code}',
+                'state': self._get_state_from_zip(zip_code)
+            }
+            
+            data = await self._aget_json(search_url, params=params)
+            if data:
+                results = self._parse_search_results(data)
+            
+            logger.info(f"Found {len(results)} nonprofits in ZIP {zip_code}")
+            
+        except Exception as e:
+            logger.error(f"Error searching ProPublica API: {e}")
+        
+        return results
+    
+    def _parse_search_results(self, data: Dict) -> List[Dict[str, Any]]:
+        """
+        Basic nonprofit info from a ProPublica search response
+        """
+        return [
+            {
+                'ein': org.get('ein'),
+                'name': org.get('name'),
+                'city': org.get('city'),
+                'state': org.get('state'),
+                'ntee_code': org.get('ntee_code'),
+                'subsection_code': org.get('subsection_code')
+            }
+            for org in data.get('organizations', [])
+        ]
+    
     def get_990_data(self, ein: str, years: List[int] = None) -> List[FinancialData]:
         """
         Retrieve 990 form data for a specific EIN
         """
-        if years is None:
-            current_year = datetime.now().year
-            years = list(range(current_year - 3, current_year))
+        return self._assemble_financials(ein, self._default_years() if years is None else years, self._get_filings(ein))
+    
+    async def aget_990_data(self, ein: str, years: List[int] = None) -> List[FinancialData]:
+        """
+        Async version of get_990_data
+        """
+        return self._assemble_financials(ein, self._default_years() if years is None else years, await self._aget_filings(ein))
+    
+    @staticmethod
+    def _default_years() -> List[int]:
+        """The last three complete tax years"""
+        current_year = datetime.now().year
+        return list(range(current_year - 3, current_year))
+    
+    def _assemble_financials(self, ein: str, years: List[int],
+                             filings: Dict[int, Optional[Dict]]) -> List[FinancialData]:
+        """
+        FinancialData for each year, oldest first (the order Nonprofit.financial_history
+        keeps): ProPublica filings parsed in one batch, with raw 990 XML as the
+        fallback for years ProPublica lacks
+        """
+        years = sorted(years)
+        found_years = [year for year in years if filings.get(year)]
+        parsed = dict(zip(
+            found_years,
+            self._parse_propublica_filings([filings[year] for year in found_years], found_years)
+        ))
         
         financial_data = []
-        
         for year in years:
-            try:
-                # Try ProPublica API first
-                data = self._get_propublica_990(ein, year)
-                if data:
-                    financial_data.append(data)
-                    continue
-                
-                # Fallback to direct 990 XML parsing
-                data = self._parse_990_xml(ein, year)
-                if data:
-                    financial_data.append(data)
-                    
-            except Exception as e:
-                logger.warning(f"Failed to get 990 data for EIN {ein}, year {year}: {e}")
+            data = parsed.get(year)
+            if data is None:
+                try:
+                    # Fallback to direct 990 XML parsing
+                    data = self._parse_990_xml(ein, year)
+                except Exception as e:
+                    logger.warning(f"Failed to get 990 data for EIN {ein}, year {year}: {e}")
+            if data:
+                financial_data.append(data)
         
         return financial_data
     
-    def _get_propublica_990(self, ein: str, year: int) -> Optional[FinancialData]:
+    def _get_filings(self, ein: str) -> Dict[int, Dict]:
         """
-        Get 990 data from ProPublica API
+        Filings by tax year for an EIN: the indexed copy if fresh, otherwise
+        one ProPublica organization fetch (every year comes from that record)
         """
+        filings = self._indexed_filings(ein)
+        if filings is not None:
+            return filings
+        
         try:
             url = f"{self.PROPUBLICA_API}/organizations/{ein}.json"
-            response = self.session.get(url)
+            data = self._get_json(url)
+            if data is not None:
+                return self._index_filings(ein, data.get('organization', {}))
             
-            if response.status_code != 200:
-                return None
-            
-            data = response.json()
-            org = data.get('organization', {})
-            
-            # Find filing for specific year
-            filings = org.get('filings_with_data', [])
-            for filing in filings:
-                if filing.get('tax_prd_yr') == year:
-                    return self._parse_propublica_filing(filing, year)
+        except Exception as e:
+            logger.warning(f"Failed to get 990 data for EIN {ein}: {e}")
+        
+        return {}
+    
+    async def _aget_filings(self, ein: str) -> Dict[int, Dict]:
+        """
+        Async version of _get_filings
+        """
+        filings = self._indexed_filings(ein)
+        if filings is not None:
+            return filings
+        
+        try:
+            url = f"{self.PROPUBLICA_API}/organizations/{ein}.json"
+            data = await self._aget_json(url)
+            if data is not None:
+                return self._index_filings(ein, data.get('organization', {}))
             
         except Exception as e:
-            logger.debug(f"ProPublica API error for EIN {ein}: {e}")
+            logger.warning(f"Failed to get 990 data for EIN {ein}: {e}")
         
-        return None
+        return {}
+    
+    def _index_filings(self, ein: str, org: Dict) -> Dict[int, Dict]:
+        """
+        Index an organization record's filings by tax year (first filing per
+        year wins) and remember the index for later per-year lookups
+        """
+        filings = {}
+        for filing in org.get('filings_with_data', []):
+            filings.setdefault(filing.get('tax_prd_yr'), filing)
+        
+        with self._filings_lock:
+            self._filings_by_year[ein] = (time.time(), filings)
+            self._filings_by_year.move_to_end(ein)
+            while len(self._filings_by_year) > self.FILINGS_CACHE_SIZE:
+                self._filings_by_year.popitem(last=False)
+        return filings
+    
+    def _indexed_filings(self, ein: str) -> Optional[Dict[int, Dict]]:
+        """Filings index for an EIN, unless missing or older than NONPROFIT_CACHE_TTL"""
+        with self._filings_lock:
+            indexed = self._filings_by_year.get(ein)
+            if indexed is None:
+                return None
+            if time.time() - indexed[0] > self.NONPROFIT_CACHE_TTL:
+                del self._filings_by_year[ein]
+                return None
+            self._filings_by_year.move_to_end(ein)
+        return indexed[1]
     
     def _parse_propublica_filing(self, filing: Dict, year: int) -> FinancialData:
         """
@@ -143,6 +613,13 @@ class IRS990Collector:
             source=DataSource.IRS_990
         )
     
+    def _parse_propublica_filings(self, filings: List[Dict], years: List[int]) -> List[FinancialData]:
+        """
+        Parse the filings for several years of one EIN (at most a handful, so
+        plain dict lookups beat building a DataFrame)
+        """
+        return [self._parse_propublica_filing(filing, year) for filing, year in zip(filings, years)]
+    
     def _parse_990_xml(self, ein: str, year: int) -> Optional[FinancialData]:
         """
         Parse raw 990 XML from IRS
@@ -156,72 +633,117 @@ class IRS990Collector:
         """
         Get comprehensive nonprofit details from IRS data
         """
+        cached = self._cached_nonprofit(ein)
+        if cached is not None:
+            return cached
+        
         try:
             # Get basic info from ProPublica
             url = f"{self.PROPUBLICA_API}/organizations/{ein}.json"
-            response = self.session.get(url)
-            
-            if response.status_code != 200:
+            data = self._get_json(url)
+            if data is None:
                 return None
             
-            data = response.json()
             org = data.get('organization', {})
+            nonprofit = self._build_nonprofit(ein, org)
             
-            # Create Address object
-            address = Address(
-                street=org.get('address', ''),
-                city=org.get('city', ''),
-                state=org.get('state', ''),
-                zip_code=org.get('zipcode', '')
+            # Financial history comes from the same organization record
+            nonprofit.financial_history = self._assemble_financials(
+                ein, self._default_years(), self._index_filings(ein, org)
             )
+            nonprofit.data_sources.append(DataSource.IRS_990)
             
-            # Create Nonprofit object
-            nonprofit = Nonprofit(
-                ein=ein,
-                name=org.get('name', ''),
-                address=address,
-                mission_statement=org.get('mission', '') or '',
-                ntee_code=org.get('ntee_code'),
-                year_founded=org.get('ruling_date')[:4] if org.get('ruling_date') else None,
-                status=self._map_status(org.get('organization_status'))
-            )
+            return self._cache_nonprofit(nonprofit)
+            
+        except Exception as e:
+            logger.error(f"Error getting nonprofit details for EIN {ein}: {e}")
+            return None
+    
+    async def aget_nonprofit_details(self, ein: str) -> Optional[Nonprofit]:
+        """
+        Async version of get_nonprofit_details
+        """
+        cached = self._cached_nonprofit(ein)
+        if cached is not None:
+            return cached
+        
+        try:
+            url = f"{self.PROPUBLICA_API}/organizations/{ein}.json"
+            data = await self._aget_json(url)
+            if data is None:
+                return None
+            
+            org = data.get('organization', {})
+            nonprofit = self._build_nonprofit(ein, org)
             
-            # Add financial history
-            nonprofit.financial_history = self.get_990_data(ein)
+            # Financial history comes from the same organization record
+            nonprofit.financial_history = self._assemble_financials(
+                ein, self._default_years(), self._index_filings(ein, org)
+            )
             nonprofit.data_sources.append(DataSource.IRS_990)
             
-            return nonprofit
+            return self._cache_nonprofit(nonprofit)
             
         except Exception as e:
             logger.error(f"Error getting nonprofit details for EIN {ein}: {e}")
             return None
     
+    async def aget_nonprofit_details_bulk(self, eins: List[str]) -> Dict[str, Optional[Nonprofit]]:
+        """
+        Fetch details for many EINs concurrently (at most BULK_CONCURRENCY in flight)
+        Returns {ein: Nonprofit or None}, in the order given
+        """
+        semaphore = asyncio.Semaphore(self.BULK_CONCURRENCY)
+        
+        async def one(ein: str) -> Optional[Nonprofit]:
+            async with semaphore:
+                return await self.aget_nonprofit_details(ein)
+        
+        results = await asyncio.gather(*(one(ein) for ein in eins), return_exceptions=True)
+        
+        details = {}
+        for ein, result in zip(eins, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error getting nonprofit details for EIN {ein}: {result}")
+                result = None
+            details[ein] = result
+        return details
+    
+    def _build_nonprofit(self, ein: str, org: Dict) -> Nonprofit:
+        """
+        Nonprofit (without financial history) from a ProPublica organization record
+        """
+        # Create Address object
+        address = Address(
+            street=org.get('address', ''),
+            city=org.get('city', ''),
+            state=org.get('state', ''),
+            zip_code=org.get('zipcode', '')
+        )
+
+        # Create Nonprofit object
+        return Nonprofit(
+            ein=ein,
+            name=org.get('name', ''),
+            address=address,
+            mission_statement=org.get('mission', '') or '',
+            ntee_code=org.get('ntee_code'),
+            year_founded=org.get('ruling_date')[:4] if org.get('ruling_date') else None,
+            status=self._map_status(org.get('organization_status'))
+        )
+
     def _map_status(self, status_code: str) -> NonprofitStatus:
         """
         Map IRS status codes to our NonprofitStatus enum
         """
-        status_map = {
-            '01': NonprofitStatus.ACTIVE,
-            '02': NonprofitStatus.SUSPENDED,
-            '03': NonprofitStatus.INACTIVE,
-        }
-        return status_map.get(status_code, NonprofitStatus.UNKNOWN)
+        return STATUS_BY_CODE.get(status_code, NonprofitStatus.UNKNOWN)
     
-    def _get_state_from_zip(self, zip_code: str) -> str:
+    @staticmethod
+    def _get_state_from_zip(zip_code: str) -> str:
         """
-        Get state abbreviation from ZIP code
-        Simple mapping - would use proper ZIP code database in production
+        Get state abbreviation from ZIP code ('' if unknown)
         """
-        # Simplified ZIP to state mapping
         zip_prefix = zip_code[:3]
-        
-        # This is a simplified example - full implementation would use complete mapping
-        zip_state_map = {
-            '100': 'NY', '101': 'NY', '102': 'NY',  # New York
-            '900': 'CA', '901': 'CA', '902': 'CA',  # California
-            '600': 'IL', '601': 'IL', '602': 'IL',  # Illinois
-            '750': 'TX', '751': 'TX', '752': 'TX',  # Texas
-            '331': 'FL', '332': 'FL', '333': 'FL',  # Florida
-        }
-        
-        return zip_state_map.get(zip_prefix, '')
\ No newline at end of file
+        if len(zip_prefix) != 3 or not zip_prefix.isdigit():
+            return ''
+        return STATES[ZIP3_STATE[int(zip_prefix)]]
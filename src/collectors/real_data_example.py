@@ -3,61 +3,196 @@ Example of fetching REAL nonprofit data - this works immediately!
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import asyncio
+import importlib.util
+import os
+import time
+from collections import OrderedDict
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Any, Dict, List
 
+try:
+    import aiohttp
+except ImportError:  # falls back to blocking _SESSION calls in worker threads
+    aiohttp = None
 
-def get_real_nonprofits_by_zip(zip_code: str):
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+try:
+    import orjson
+except ImportError:  # stdlib json parses the responses
+    orjson = None
+
+
+# ProPublica API - completely free and open
+PROPUBLICA_API = "https://projects.propublica.org/nonprofits/api/v2"
+
+# Concurrent connections shared by all fetches in one session
+MAX_CONNECTIONS = 16
+
+REQUEST_TIMEOUT = 10
+
+# Compressed transfer; brotli only when a decoder is installed for urllib3 and aiohttp to use
+ACCEPT_ENCODING = 'gzip, deflate, br' if (
+    importlib.util.find_spec('brotli') or importlib.util.find_spec('brotlicffi')
+) else 'gzip, deflate'
+
+# ProPublica data changes slowly, so responses are reused for a day
+CACHE_TTL = 86400
+JSON_CACHE_SIZE = 4096
+
+# On-disk response cache for the blocking session (PROPUBLICA_CACHE_PATH='' disables it)
+PROPUBLICA_CACHE_PATH = os.getenv('PROPUBLICA_CACHE_PATH', './data/propublica_cache.sqlite')
+
+
+def json_loads(data: bytes) -> Any:
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _make_session() -> requests.Session:
+    """Keep-alive session for the blocking calls, so repeated lookups reuse one TLS connection"""
+    if requests_cache and PROPUBLICA_CACHE_PATH:
+        Path(PROPUBLICA_CACHE_PATH).parent.mkdir(parents=True, exist_ok=True)
+        session = requests_cache.CachedSession(
+            PROPUBLICA_CACHE_PATH,
+            backend='sqlite',
+            expire_after=CACHE_TTL,
+            allowable_methods=('GET',)
+        )
+    else:
+        session = requests.Session()
+    session.headers['Accept-Encoding'] = ACCEPT_ENCODING
+    session.mount("https://", HTTPAdapter(
+        pool_connections=50,
+        pool_maxsize=50,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+    ))
+    return session
+
+
+_SESSION = _make_session()
+
+# Parsed responses by (kind, *key) -> (fetched_at, data); LRU with CACHE_TTL expiry
+_json_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+
+def _client_session():
+    """One keep-alive session for a batch of fetches (None without aiohttp)"""
+    if aiohttp is None:
+        return nullcontext(None)
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=MAX_CONNECTIONS),
+        headers={'Accept-Encoding': ACCEPT_ENCODING}
+    )
+
+
+async def _fetch_json(session, url: str, params: Dict = None) -> Dict:
+    if session is None:
+        response = await asyncio.to_thread(_SESSION.get, url, params=params, timeout=REQUEST_TIMEOUT)
+        return json_loads(response.content)
+    async with session.get(url, params=params) as response:
+        return json_loads(await response.read())
+
+
+async def _fetch_cached(session, key: tuple, url: str, params: Dict = None) -> Dict:
+    """_fetch_json, served from _json_cache while the entry is younger than CACHE_TTL (key must cover params)"""
+    cached = _json_cache.get(key)
+    if cached and time.monotonic() - cached[0] < CACHE_TTL:
+        _json_cache.move_to_end(key)
+        return cached[1]
+    
+    data = await _fetch_json(session, url, params)
+    _json_cache[key] = (time.monotonic(), data)
+    _json_cache.move_to_end(key)
+    if len(_json_cache) > JSON_CACHE_SIZE:
+        _json_cache.popitem(last=False)
+    return data
+
+
+async def _fetch_org_detail(session, ein) -> Dict:
+    return await _fetch_cached(session, ('organization', ein), f"{PROPUBLICA_API}/organizations/{ein}.json")
+
+
+async def aget_real_nonprofits_by_zip(zip_code: str, session=None) -> List[Dict]:
     """
     Get REAL nonprofit data from ProPublica - NO API KEY NEEDED
+    The detail lookups for the top results are fetched concurrently
     """
-    # ProPublica API - completely free and open
-    base_url = "https://projects.propublica.org/nonprofits/api/v2"
+    if session is None and aiohttp is not None:
+        async with _client_session() as session:
+            return await aget_real_nonprofits_by_zip(zip_code, session)
     
     # Search by ZIP code (real data!)
-    search_url = f"{base_url}/search.json"
+    search_url = f"{PROPUBLICA_API}/search.json"
     params = {
         'q': zip_code,
         'ntee[id]': '3'  # Health organizations (similar to Red Cross)
     }
     
-    response = requests.get(search_url)
-    data = response.json()
+    data = await _fetch_cached(session, ('search', zip_code, params['ntee[id]']), search_url, params)
     
     # Get real organizations
-    organizations = data.get('organizations', [])
+    organizations = data.get('organizations', [])[:5]  # Top 5
     
-    results = []
-    for org in organizations[:5]:  # Top 5
-        # Get detailed data for each org
-        ein = org['ein']
-        detail_url = f"{base_url}/organizations/{ein}.json"
-        detail_resp = requests.get(detail_url)
-        detail_data = detail_resp.json()
-        
-        org_info = detail_data['organization']
-        
-        # Extract REAL financial data
-        latest_filing = None
-        if 'filings_with_data' in org_info:
-            filings = org_info['filings_with_data']
-            if filings:
-                latest_filing = filings[0]  # Most recent
-        
-        results.append({
-            'name': org_info['name'],
-            'ein': ein,
-            'city': org_info.get('city'),
-            'state': org_info.get('state'),
-            'ntee_code': org_info.get('ntee_code'),
-            'mission': org_info.get('mission'),
-            'ruling_year': org_info.get('ruling_date', '')[:4],
-            'revenue': latest_filing.get('totrevenue') if latest_filing else None,
-            'expenses': latest_filing.get('totfuncexpns') if latest_filing else None,
-            'assets': latest_filing.get('totassetsend') if latest_filing else None,
-            'url': f"https://projects.propublica.org/nonprofits/organizations/{ein}"
-        })
+    # Get detailed data for each org
+    details = await asyncio.gather(*(
+        _fetch_org_detail(session, org['ein'])
+        for org in organizations
+    ))
     
-    return results
+    return [
+        _summarize_organization(org['ein'], detail_data['organization'])
+        for org, detail_data in zip(organizations, details)
+    ]
+
+
+def get_real_nonprofits_by_zip(zip_code: str) -> List[Dict]:
+    """
+    Blocking wrapper around aget_real_nonprofits_by_zip
+    """
+    return asyncio.run(aget_real_nonprofits_by_zip(zip_code))
+
+
+async def get_many_zips(zip_codes: List[str]) -> Dict[str, List[Dict]]:
+    """
+    Nonprofits for several ZIP codes, sharing one session so connections
+    are reused across every search and detail fetch
+    """
+    async with _client_session() as session:
+        results = await asyncio.gather(*(
+            aget_real_nonprofits_by_zip(zip_code, session) for zip_code in zip_codes
+        ))
+    return dict(zip(zip_codes, results))
+
+
+def _summarize_organization(ein, org_info: Dict) -> Dict:
+    # Extract REAL financial data
+    latest_filing = None
+    if 'filings_with_data' in org_info:
+        filings = org_info['filings_with_data']
+        if filings:
+            latest_filing = filings[0]  # Most recent
+    
+    return {
+        'name': org_info['name'],
+        'ein': ein,
+        'city': org_info.get('city'),
+        'state': org_info.get('state'),
+        'ntee_code': org_info.get('ntee_code'),
+        'mission': org_info.get('mission'),
+        'ruling_year': org_info.get('ruling_date', '')[:4],
+        'revenue': latest_filing.get('totrevenue') if latest_filing else None,
+        'expenses': latest_filing.get('totfuncexpns') if latest_filing else None,
+        'assets': latest_filing.get('totassetsend') if latest_filing else None,
+        'url': f"https://projects.propublica.org/nonprofits/organizations/{ein}"
+    }
 
 
 def get_charity_navigator_data(ein: str):
@@ -74,9 +209,9 @@ def get_charity_navigator_data(ein: str):
         'app_key': api_key
     }
     
-    response = requests.get(url, headers=headers)
+    response = _SESSION.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
     if response.status_code == 200:
-        return response.json()
+        return json_loads(response.content)
     return None
 
 
@@ -1,17 +1,222 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+import codecs
+import importlib.util
 from urllib.parse import urlparse, urljoin
 import logging
-from typing import Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
+import os
 import time
 import re
+import threading
+from html import unescape
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+try:
+    from lxml import etree
+except ImportError:  # pages are parsed whole with html.parser
+    etree = None
+
+try:
+    import hyperscan
+except ImportError:  # page features are probed with one re.search each
+    hyperscan = None
 
 from src.models.nonprofit import Nonprofit, DataSource
 
 
 logger = logging.getLogger(__name__)
 
+# Fetched pages are reused for a week across runs (SCRAPER_CACHE_PATH='' disables it)
+PAGE_CACHE_TTL = 7 * 86400
+SCRAPER_CACHE_PATH = os.getenv('SCRAPER_CACHE_PATH', './data/scraper_cache.sqlite')
+
+# Compressed transfer; brotli only when a decoder is installed for urllib3 to use
+ACCEPT_ENCODING = 'gzip, deflate, br' if (
+    importlib.util.find_spec('brotli') or importlib.util.find_spec('brotlicffi')
+) else 'gzip, deflate'
+
+# Sites scraped concurrently by scrape_many
+SCRAPE_WORKERS = 16
+
+# libxml2-backed tree building when lxml is installed, else the pure-Python parser
+HTML_PARSER = 'lxml' if etree is not None else 'html.parser'
+
+# Requests a host may receive back to back before per-host spacing applies
+HOST_BURST = 2
+# Consecutive failures after which a host is skipped for HOST_COOLDOWN seconds
+HOST_FAILURE_LIMIT = 3
+HOST_COOLDOWN = 300
+
+# Parsed pages kept per scraper, so URLs shared between nonprofits are fetched once
+PAGE_MEMO_SIZE = 2000
+
+# Response bytes fed to the streaming parser at a time
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Patterns used by the extractors, compiled once per process
+_MISSION_PATTERNS = [
+    {'class': re.compile('mission', re.I)},
+    {'id': re.compile('mission', re.I)},
+    {'class': re.compile('about', re.I)},
+]
+_PROGRAM_RE = re.compile('(program|service)', re.I)
+_LEADER_SECTION_RE = re.compile('(leader|board|staff|team)', re.I)
+_PERSON_RE = re.compile('(person|member|staff)', re.I)
+_ROLE_RE = re.compile('(title|position|role)', re.I)
+# Contact patterns run over the raw page bytes, not a re-serialized tree
+_EMAIL_RE = re.compile(rb'[\w\.-]+@[\w\.-]+\.\w+')
+_PHONE_RE = re.compile(rb'[\(]?\d{3}[\)]?[-\s]?\d{3}[-\s]?\d{4}')
+_NEWS_RE = re.compile('(news|blog|update|announce)', re.I)
+_DATE_RE = re.compile('date', re.I)
+_SOCIAL_PATTERNS = {
+    'facebook': rb'facebook\.com/[\w\.-]+',
+    'twitter': rb'twitter\.com/[\w\.-]+',
+    'linkedin': rb'linkedin\.com/[\w\.-/]+',
+    'instagram': rb'instagram\.com/[\w\.-]+',
+    'youtube': rb'youtube\.com/[\w\.-]+'
+}
+# <a href> values naming any of the platforms above, one named group per platform
+_SOCIAL_LINK_RE = re.compile(
+    rb'<a\s(?:[^>]*?\s)?href\s*=\s*["\']?(?P<href>[^"\'\s>]*?(?:'
+    + b'|'.join(b'(?P<%s>%s)' % (platform.encode(), pattern) for platform, pattern in _SOCIAL_PATTERNS.items())
+    + rb')[^"\'\s>]*)',
+    re.I
+)
+_ABOUT_TEXT_RE = re.compile(r'^about', re.I)
+_ABOUT_HREF_RE = re.compile(r'/about', re.I)
+
+# class/id values of the sections any extractor looks inside; the streaming
+# parser keeps only these (plus nav, meta description, addresses and About links)
+_RELEVANT_SECTION_RE = re.compile(
+    'mission|about|program|service|leader|board|staff|team|news|blog|update|announce', re.I
+)
+_CHARSET_RE = re.compile(r'charset=["\']?([\w-]+)', re.I)
+# <meta charset> or http-equiv Content-Type charset, looked for in the first
+# META_CHARSET_WINDOW bytes as browsers do
+_META_CHARSET_RE = re.compile(rb'<meta\s[^>]*?charset\s*=\s*["\']?([\w-]+)', re.I)
+META_CHARSET_WINDOW = 1024
+
+# Keywords an extractor's section patterns need; a page without them in its
+# bytes cannot yield anything for that extractor, so its tree walk is skipped
+_PAGE_FEATURES = {
+    'programs': rb'program|service',
+    'leadership': rb'leader|board|staff|team',
+    'news': rb'news|blog|update|announce',
+}
+_PAGE_FEATURE_NAMES = tuple(_PAGE_FEATURES)
+_PAGE_FEATURE_RES = {name: re.compile(pattern, re.I) for name, pattern in _PAGE_FEATURES.items()}
+
+
+def _compile_feature_database():
+    """All feature patterns in one Hyperscan database (None without hyperscan)"""
+    if hyperscan is None:
+        return None
+    try:
+        database = hyperscan.Database()
+        database.compile(
+            expressions=list(_PAGE_FEATURES.values()),
+            ids=list(range(len(_PAGE_FEATURES))),
+            elements=len(_PAGE_FEATURES),
+            flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(_PAGE_FEATURES)
+        )
+        return database
+    except Exception as e:
+        logger.warning(f"Hyperscan database compile failed, using re: {e}")
+        return None
+
+
+_FEATURE_DATABASE = _compile_feature_database()
+# Hyperscan scratch space is per scanning thread
+_feature_scratch = threading.local()
+
+
+def _page_features(html: bytes) -> Set[str]:
+    """Names of the _PAGE_FEATURES present in a page, from one pass over its bytes"""
+    if _FEATURE_DATABASE is None:
+        return {name for name, pattern in _PAGE_FEATURE_RES.items() if pattern.search(html)}
+    
+    scratch = getattr(_feature_scratch, 'scratch', None)
+    if scratch is None:
+        scratch = _feature_scratch.scratch = hyperscan.Scratch(_FEATURE_DATABASE)
+    
+    found = set()
+    _FEATURE_DATABASE.scan(
+        html,
+        match_event_handler=lambda id, start, end, flags, context: found.add(_PAGE_FEATURE_NAMES[id]),
+        scratch=scratch
+    )
+    return found
+
+
+def _is_relevant_element(elem) -> bool:
+    """Whether an element (judged on its tag and attributes) is kept by the streaming parser"""
+    tag = elem.tag
+    if tag in ('div', 'section', 'p'):
+        if _RELEVANT_SECTION_RE.search(elem.get('class', '')) or _RELEVANT_SECTION_RE.search(elem.get('id', '')):
+            return True
+    if tag in ('address', 'div'):
+        return 'PostalAddress' in elem.get('itemtype', '')
+    if tag == 'meta':
+        return elem.get('name') == 'description'
+    if tag == 'a':
+        return bool(_ABOUT_HREF_RE.search(elem.get('href', '')))
+    return tag == 'nav'
+
+
+def _response_encoding(response, head: bytes) -> str:
+    """
+    Charset from the Content-Type header, else from a <meta> declaration in
+    the start of the page (`head`); UTF-8 when neither names a known one
+    """
+    header = _CHARSET_RE.search(response.headers.get('Content-Type', ''))
+    meta = _META_CHARSET_RE.search(head[:META_CHARSET_WINDOW])
+    for name in (header and header.group(1), meta and meta.group(1).decode('ascii')):
+        if name:
+            try:
+                return codecs.lookup(name).name
+            except LookupError:
+                pass
+    return 'utf-8'
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: refills `rate` tokens per second up to `capacity`.
+    Callers reserve a token and sleep outside the lock until it is due.
+    """
+    
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def consume(self):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+    
+    def slow_down(self, factor: float = 0.5):
+        with self.lock:
+            self.rate *= factor
+
 
 class NonprofitWebScraper:
     """
@@ -20,11 +225,55 @@ class NonprofitWebScraper:
     """
     
     def __init__(self, delay: float = 2.0):
+        # Average seconds between requests to one host (bursts of HOST_BURST allowed)
         self.delay = delay
-        self.session = requests.Session()
+        if requests_cache and SCRAPER_CACHE_PATH:
+            Path(SCRAPER_CACHE_PATH).parent.mkdir(parents=True, exist_ok=True)
+            self.session = requests_cache.CachedSession(
+                SCRAPER_CACHE_PATH,
+                backend='sqlite',
+                expire_after=PAGE_CACHE_TTL,
+                allowable_methods=('GET',)
+            )
+        else:
+            self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (compatible; NonprofitAnalyzer/1.0; Red Cross Partner Finder)'
+            'User-Agent': 'Mozilla/5.0 (compatible; NonprofitAnalyzer/1.0; Red Cross Partner Finder)',
+            'Accept-Encoding': ACCEPT_ENCODING
         })
+        # Pool connections so follow-up pages on the same host skip the TLS handshake
+        adapter = HTTPAdapter(
+            pool_connections=50,
+            pool_maxsize=50,
+            # Retry-After is honoured between retries; the last response is
+            # returned rather than raised so throttling is visible to _download_page
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504],
+                              raise_on_status=False)
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        
+        # Per-host rate limiting and failure tracking, so concurrent scrapes stay
+        # polite to each site while different hosts proceed in parallel
+        self._host_buckets: Dict[str, TokenBucket] = {}
+        self._host_failures: Dict[str, int] = {}
+        self._host_blocked_until: Dict[str, float] = {}
+        self._host_lock = threading.Lock()
+        # Hosts whose response Content-Encoding has been logged
+        self._encoding_logged: Set[str] = set()
+        
+        # Normalized URL -> (tree, raw HTML) of pages fetched by this scraper, LRU
+        self._page_cache: "OrderedDict[str, Tuple[BeautifulSoup, bytes]]" = OrderedDict()
+        self._page_cache_lock = threading.Lock()
+        self._page_fetch_locks: Dict[str, threading.Lock] = {}
+    
+    def scrape_many(self, nonprofits: List[Nonprofit]) -> Dict[str, Dict[str, Any]]:
+        """
+        Scrape several nonprofit websites concurrently, keyed by EIN
+        """
+        with ThreadPoolExecutor(max_workers=SCRAPE_WORKERS) as executor:
+            results = executor.map(self.scrape_nonprofit_website, nonprofits)
+            return {nonprofit.ein: data for nonprofit, data in zip(nonprofits, results)}
     
     def scrape_nonprofit_website(self, nonprofit: Nonprofit) -> Dict[str, Any]:
         """
@@ -39,27 +288,28 @@ class NonprofitWebScraper:
             url = self._normalize_url(nonprofit.website)
             
             # Get main page
-            main_page = self._fetch_page(url)
-            if not main_page:
+            page = self._fetch_page(url)
+            if page is None:
                 return {}
+            main_page, main_html = page
+            features = _page_features(main_html)
             
             # Extract data from main page
             data = {
                 'mission': self._extract_mission(main_page, url),
-                'programs': self._extract_programs(main_page, url),
-                'leadership': self._extract_leadership(main_page, url),
-                'contact': self._extract_contact(main_page),
-                'news': self._extract_recent_news(main_page, url),
-                'social_media': self._extract_social_links(main_page)
+                'programs': self._extract_programs(main_page, url) if 'programs' in features else [],
+                'leadership': self._extract_leadership(main_page, url) if 'leadership' in features else [],
+                'contact': self._extract_contact(main_page, main_html),
+                'news': self._extract_recent_news(main_page, url) if 'news' in features else [],
+                'social_media': self._extract_social_links(main_html)
             }
             
             # Try to find and parse About page
             about_url = self._find_about_page(main_page, url)
             if about_url:
-                time.sleep(self.delay)
                 about_page = self._fetch_page(about_url)
-                if about_page:
-                    self._update_data_from_about(data, about_page, about_url)
+                if about_page is not None:
+                    self._update_data_from_about(data, about_page[0], about_url)
             
             # Update nonprofit object
             if data['mission'] and not nonprofit.mission_statement:
@@ -67,7 +317,7 @@ class NonprofitWebScraper:
             
             if data['programs']:
                 nonprofit.programs.extend(data['programs'])
-                nonprofit.programs = list(set(nonprofit.programs))  # Remove duplicates
+                nonprofit.programs = list(dict.fromkeys(nonprofit.programs))  # Remove duplicates, keeping order
             
             if data['leadership']:
                 nonprofit.leadership.extend(data['leadership'])
@@ -87,18 +337,170 @@ class NonprofitWebScraper:
             logger.error(f"Error scraping website for {nonprofit.name}: {e}")
             return {}
     
-    def _fetch_page(self, url: str) -> Optional[BeautifulSoup]:
+    def _fetch_page(self, url: str) -> Optional[Tuple[BeautifulSoup, bytes]]:
         """
-        Fetch and parse a web page
+        Fetch and parse a web page, returning the tree and the raw HTML
         """
+        key = self._normalize_url(url)
+        with self._page_cache_lock:
+            page = self._page_cache.get(key)
+            if page is not None:
+                self._page_cache.move_to_end(key)
+                return page
+            # Concurrent requests for the same page wait for one download
+            fetch_lock = self._page_fetch_locks.setdefault(key, threading.Lock())
+        
+        with fetch_lock:
+            with self._page_cache_lock:
+                page = self._page_cache.get(key)
+            if page is None:
+                page = self._download_page(url)
+            
+            with self._page_cache_lock:
+                if page is not None:
+                    self._page_cache[key] = page
+                    if len(self._page_cache) > PAGE_MEMO_SIZE:
+                        self._page_cache.popitem(last=False)
+                self._page_fetch_locks.pop(key, None)
+        return page
+    
+    def _download_page(self, url: str) -> Optional[Tuple[BeautifulSoup, bytes]]:
+        host = urlparse(url).netloc
+        if not self._host_available(host):
+            logger.debug(f"Skipping {url}: {host} is failing")
+            return None
+        
         try:
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            return BeautifulSoup(response.content, 'html.parser')
+            self._wait_for_host(host)
+            with self.session.get(url, timeout=10, stream=True) as response:
+                if response.status_code == 429 or response.status_code >= 500:
+                    self._record_host_failure(host, throttled=response.status_code == 429)
+                response.raise_for_status()
+                if host not in self._encoding_logged:
+                    self._encoding_logged.add(host)
+                    logger.debug(f"{host} Content-Encoding: {response.headers.get('Content-Encoding', 'identity')}")
+                
+                if etree is None:
+                    page = BeautifulSoup(response.content, HTML_PARSER), response.content
+                else:
+                    page = self._parse_page_streaming(response)
+            self._record_host_success(host)
+            return page
+        except requests.exceptions.HTTPError as e:
+            # 429/5xx were recorded above; other statuses say nothing about host health
+            logger.debug(f"Failed to fetch {url}: {e}")
+            return None
+        except requests.exceptions.RequestException as e:
+            self._record_host_failure(host)
+            logger.debug(f"Failed to fetch {url}: {e}")
+            return None
         except Exception as e:
             logger.debug(f"Failed to fetch {url}: {e}")
             return None
     
+    def _parse_page_streaming(self, response) -> Tuple[BeautifulSoup, bytes]:
+        """
+        Feed the response through an lxml pull parser in chunks and keep only
+        the elements the extractors look at. Everything else is discarded as
+        soon as it is closed, so no full tree is built for large pages; the
+        returned BeautifulSoup holds just the kept fragments, in page order.
+        """
+        parser = None
+        chunks = []
+        fragments = []
+        # Open elements, True where the element is kept; the kept (or <a>)
+        # ancestors of an element must not be cleared before they close
+        open_elements = []
+        kept_open = 0
+        links_open = 0
+        
+        def consume():
+            nonlocal kept_open, links_open
+            for event, elem in parser.read_events():
+                if event == 'start':
+                    kept = _is_relevant_element(elem)
+                    open_elements.append(kept)
+                    kept_open += kept
+                    links_open += elem.tag == 'a'
+                    continue
+                
+                kept = open_elements.pop() if open_elements else False
+                kept_open -= kept
+                if elem.tag == 'a':
+                    # Link text is only complete once the element closes
+                    links_open -= 1
+                    kept = kept or bool(_ABOUT_TEXT_RE.search(''.join(elem.itertext())))
+                
+                if kept_open:
+                    continue  # Part of an enclosing fragment
+                if kept:
+                    fragments.append(etree.tostring(elem, with_tail=False))
+                if links_open:
+                    continue  # An enclosing <a> may still be kept for its text
+                
+                # Free the finished subtree and the siblings before it
+                elem.clear(keep_tail=True)
+                parent = elem.getparent()
+                if parent is not None:
+                    while elem.getprevious() is not None:
+                        del parent[0]
+        
+        def start_parser():
+            # The encoding is fixed once the page start has been seen
+            nonlocal parser
+            head = b''.join(chunks)
+            parser = etree.HTMLPullParser(events=('start', 'end'), encoding=_response_encoding(response, head))
+            parser.feed(head)
+            consume()
+        
+        for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+            chunks.append(chunk)
+            if parser is not None:
+                parser.feed(chunk)
+                consume()
+            elif sum(map(len, chunks)) >= META_CHARSET_WINDOW:
+                start_parser()
+        if parser is None:
+            start_parser()
+        parser.close()
+        consume()
+        
+        return BeautifulSoup(b''.join(fragments), HTML_PARSER), b''.join(chunks)
+    
+    def _wait_for_host(self, host: str):
+        """
+        Take a token from the host's bucket, sleeping only when it is exhausted
+        """
+        if self.delay <= 0:
+            return
+        with self._host_lock:
+            bucket = self._host_buckets.get(host)
+            if bucket is None:
+                bucket = self._host_buckets[host] = TokenBucket(1.0 / self.delay, HOST_BURST)
+        bucket.consume()
+    
+    def _host_available(self, host: str) -> bool:
+        with self._host_lock:
+            return self._host_blocked_until.get(host, 0.0) <= time.monotonic()
+    
+    def _record_host_success(self, host: str):
+        with self._host_lock:
+            self._host_failures.pop(host, None)
+    
+    def _record_host_failure(self, host: str, throttled: bool = False):
+        """
+        Halve the host's request rate when it throttles us, and stop requesting
+        from it for a while after HOST_FAILURE_LIMIT failures in a row
+        """
+        with self._host_lock:
+            if throttled and host in self._host_buckets:
+                self._host_buckets[host].slow_down()
+            failures = self._host_failures.get(host, 0) + 1
+            self._host_failures[host] = failures
+            if failures >= HOST_FAILURE_LIMIT:
+                self._host_blocked_until[host] = time.monotonic() + HOST_COOLDOWN
+                self._host_failures.pop(host)
+    
     def _normalize_url(self, url: str) -> str:
         """
         Normalize URL to ensure proper format
@@ -111,30 +513,21 @@ class NonprofitWebScraper:
         """
         Extract mission statement from website
         """
-        mission = ""
-        
-        # Look for common mission statement patterns
-        mission_patterns = [
-            {'class': re.compile('mission', re.I)},
-            {'id': re.compile('mission', re.I)},
-            {'class': re.compile('about', re.I)},
-        ]
-        
-        for pattern in mission_patterns:
+        # Look for common mission statement patterns; the first usable
+        # section is returned without searching for the rest
+        for pattern in _MISSION_PATTERNS:
             element = soup.find(['div', 'section', 'p'], pattern)
             if element:
                 text = element.get_text(strip=True)
                 if len(text) > 50 and len(text) < 2000:
-                    mission = text
-                    break
+                    return text
         
         # Look for mission in meta tags
-        if not mission:
-            meta_desc = soup.find('meta', {'name': 'description'})
-            if meta_desc and meta_desc.get('content'):
-                mission = meta_desc['content']
+        meta_desc = soup.find('meta', {'name': 'description'})
+        if meta_desc and meta_desc.get('content'):
+            return meta_desc['content']
         
-        return mission
+        return ""
     
     def _extract_programs(self, soup: BeautifulSoup, base_url: str) -> List[str]:
         """
@@ -144,7 +537,7 @@ class NonprofitWebScraper:
         
         # Look for programs/services sections
         program_sections = soup.find_all(['div', 'section'], 
-                                        class_=re.compile('(program|service)', re.I))
+                                        class_=_PROGRAM_RE)
         
         for section in program_sections[:5]:  # Limit to avoid too much noise
             # Look for list items or headers
@@ -157,13 +550,13 @@ class NonprofitWebScraper:
         # Also check navigation menu for program pages
         nav = soup.find('nav')
         if nav:
-            links = nav.find_all('a', href=re.compile('(program|service)', re.I))
+            links = nav.find_all('a', href=_PROGRAM_RE)
             for link in links[:10]:
                 text = link.get_text(strip=True)
                 if text and len(text) < 50:
                     programs.append(text)
         
-        return list(set(programs))  # Remove duplicates
+        return list(dict.fromkeys(programs))  # Remove duplicates, keeping page order
     
     def _extract_leadership(self, soup: BeautifulSoup, base_url: str) -> List[Dict[str, str]]:
         """
@@ -173,15 +566,15 @@ class NonprofitWebScraper:
         
         # Look for leadership sections
         leader_sections = soup.find_all(['div', 'section'], 
-                                       class_=re.compile('(leader|board|staff|team)', re.I))
+                                       class_=_LEADER_SECTION_RE)
         
         for section in leader_sections[:3]:
             # Look for person cards or lists
-            people = section.find_all(['div', 'li'], class_=re.compile('(person|member|staff)', re.I))
+            people = section.find_all(['div', 'li'], class_=_PERSON_RE)
             
             for person in people[:20]:
                 name_elem = person.find(['h3', 'h4', 'strong', 'b'])
-                title_elem = person.find(['p', 'span'], class_=re.compile('(title|position|role)', re.I))
+                title_elem = person.find(['p', 'span'], class_=_ROLE_RE)
                 
                 if name_elem:
                     leader = {
@@ -193,27 +586,26 @@ class NonprofitWebScraper:
         
         return leadership
     
-    def _extract_contact(self, soup: BeautifulSoup) -> Dict[str, str]:
+    def _extract_contact(self, soup: BeautifulSoup, html: bytes) -> Dict[str, str]:
         """
         Extract contact information
         """
         contact = {}
         
         # Email
-        email_pattern = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
-        email_matches = email_pattern.findall(str(soup))
+        email_matches = _EMAIL_RE.findall(html)
         if email_matches:
             # Filter out common non-contact emails
             for email in email_matches:
+                email = email.decode()
                 if not any(x in email.lower() for x in ['example', 'domain', 'email']):
                     contact['email'] = email
                     break
         
         # Phone
-        phone_pattern = re.compile(r'[\(]?\d{3}[\)]?[-\s]?\d{3}[-\s]?\d{4}')
-        phone_matches = phone_pattern.findall(str(soup))
+        phone_matches = _PHONE_RE.findall(html)
         if phone_matches:
-            contact['phone'] = phone_matches[0]
+            contact['phone'] = phone_matches[0].decode()
         
         # Address - look for address tags or schema.org markup
         address_elem = soup.find(['address', 'div'], {'itemtype': 'http://schema.org/PostalAddress'})
@@ -230,14 +622,14 @@ class NonprofitWebScraper:
         
         # Look for news/blog sections
         news_sections = soup.find_all(['div', 'section'], 
-                                     class_=re.compile('(news|blog|update|announce)', re.I))
+                                     class_=_NEWS_RE)
         
         for section in news_sections[:2]:
             articles = section.find_all(['article', 'div'], limit=5)
             
             for article in articles:
                 title_elem = article.find(['h2', 'h3', 'h4'])
-                date_elem = article.find(['time', 'span'], class_=re.compile('date', re.I))
+                date_elem = article.find(['time', 'span'], class_=_DATE_RE)
                 
                 if title_elem:
                     news_item = {
@@ -255,27 +647,18 @@ class NonprofitWebScraper:
         
         return news
     
-    def _extract_social_links(self, soup: BeautifulSoup) -> Dict[str, str]:
+    def _extract_social_links(self, html: bytes) -> Dict[str, str]:
         """
-        Extract social media links
+        Extract social media links, first link per platform in page order
         """
         social = {}
         
-        social_patterns = {
-            'facebook': re.compile(r'facebook\.com/[\w\.-]+', re.I),
-            'twitter': re.compile(r'twitter\.com/[\w\.-]+', re.I),
-            'linkedin': re.compile(r'linkedin\.com/[\w\.-/]+', re.I),
-            'instagram': re.compile(r'instagram\.com/[\w\.-]+', re.I),
-            'youtube': re.compile(r'youtube\.com/[\w\.-]+', re.I)
-        }
-        
-        all_links = soup.find_all('a', href=True)
-        
-        for link in all_links:
-            href = link['href']
-            for platform, pattern in social_patterns.items():
-                if platform not in social and pattern.search(href):
-                    social[platform] = href
+        for match in _SOCIAL_LINK_RE.finditer(html):
+            platform = next(name for name in _SOCIAL_PATTERNS if match.group(name))
+            if platform not in social:
+                social[platform] = unescape(match.group('href').decode(errors='replace'))
+                if len(social) == len(_SOCIAL_PATTERNS):
+                    break
         
         return social
     
@@ -283,7 +666,7 @@ class NonprofitWebScraper:
         """
         Find the About page URL
         """
-        about_links = soup.find_all('a', text=re.compile(r'^about', re.I))
+        about_links = soup.find_all('a', text=_ABOUT_TEXT_RE)
         
         for link in about_links:
             href = link.get('href')
@@ -291,9 +674,9 @@ class NonprofitWebScraper:
                 return urljoin(base_url, href)
         
         # Try href pattern
-        about_links = soup.find_all('a', href=re.compile(r'/about', re.I))
-        if about_links:
-            return urljoin(base_url, about_links[0]['href'])
+        about_link = soup.find('a', href=_ABOUT_HREF_RE)
+        if about_link:
+            return urljoin(base_url, about_link['href'])
         
         return None
     
@@ -313,4 +696,5 @@ class NonprofitWebScraper:
             existing_names = {l['name'] for l in data.get('leadership', [])}
             for leader in leadership:
                 if leader['name'] not in existing_names:
+                    existing_names.add(leader['name'])
                     data['leadership'].append(leader)
\ No newline at end of file
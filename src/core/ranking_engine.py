@@ -1,13 +1,19 @@
 import numpy as np
-from typing import List, Dict, Optional, Tuple
+from typing import TYPE_CHECKING, List, Dict, Optional, Tuple, Any, Callable
 import logging
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
 from dataclasses import dataclass
-import pandas as pd
+from datetime import datetime
 
-from src.models.nonprofit import Nonprofit
+from src.models.nonprofit import Nonprofit, MissionAlignment, PartnershipROI, ntee_category_label
 from src.analyzers.mission_alignment import MissionAlignmentAnalyzer
 from src.analyzers.roi_calculator import PartnershipROICalculator
 
+if TYPE_CHECKING:
+    import pandas as pd  # imported in generate_ranking_report, the only user
+
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +28,40 @@ class RankingCriteria:
     data_quality_weight: float = 0.10
 
 
+# Analyzer results kept per engine, for each of mission alignment and ROI
+ANALYSIS_CACHE_SIZE = 10000
+
+# Columns of the score matrix built by rank_nonprofits, matching the criteria weights
+SCORE_COMPONENTS = ('mission', 'roi', 'stability', 'capacity', 'data_quality')
+
+
+@dataclass
+class _RankingState:
+    """A ranking kept by NonprofitRankingEngine so it can be updated in place"""
+    nonprofits: List[Nonprofit]  # input order; row i of components
+    components: np.ndarray  # (N, 5) criterion scores, SCORE_COMPONENTS columns
+    scores: List[float]  # overall score per row
+    rows: Dict[str, int]  # EIN -> row
+    keys: List[Tuple[float, int]]  # (-score, row) in rank order
+    ranked: List[Nonprofit]  # rank order
+
+
+# Engine used by rank_in_process, built on first use in each worker process
+_process_engine = None
+
+
+def rank_in_process(nonprofits: List[Nonprofit], criteria: RankingCriteria) -> List[Nonprofit]:
+    """
+    ProcessPoolExecutor target for rank_nonprofits
+    """
+    global _process_engine
+    if _process_engine is None:
+        _process_engine = NonprofitRankingEngine(criteria)
+    _process_engine.criteria = criteria
+    
+    return _process_engine.rank_nonprofits(nonprofits)
+
+
 class NonprofitRankingEngine:
     """
     Ranks nonprofits based on multiple criteria for Red Cross partnership potential
@@ -31,6 +71,34 @@ class NonprofitRankingEngine:
         self.criteria = criteria or RankingCriteria()
         self.mission_analyzer = MissionAlignmentAnalyzer()
         self.roi_calculator = PartnershipROICalculator()
+        
+        # Analyzer results by (EIN, last_updated), LRU; re-ranking the same
+        # records (e.g. while tuning weights) skips both analyzers
+        self._alignment_cache: "OrderedDict[Tuple[str, datetime], MissionAlignment]" = OrderedDict()
+        self._roi_cache: "OrderedDict[Tuple[str, datetime], PartnershipROI]" = OrderedDict()
+        self._analysis_cache_lock = threading.Lock()
+        
+        # Last rank_nonprofits result, for incremental re-ranking
+        self._last_ranking: Optional[_RankingState] = None
+        self._ranking_lock = threading.Lock()
+    
+    @property
+    def criteria(self) -> RankingCriteria:
+        return self._criteria
+    
+    @criteria.setter
+    def criteria(self, criteria: RankingCriteria):
+        # The weight vector (SCORE_COMPONENTS order) is built once per
+        # criteria assignment, not per score; assign a new RankingCriteria
+        # to change weights rather than editing one in place
+        self._criteria = criteria
+        self._weights = np.array([
+            criteria.mission_weight,
+            criteria.roi_weight,
+            criteria.stability_weight,
+            criteria.capacity_weight,
+            criteria.data_quality_weight
+        ])
     
     def rank_nonprofits(self, nonprofits: List[Nonprofit], 
                        zip_code: str = None) -> List[Nonprofit]:
@@ -40,74 +108,205 @@ class NonprofitRankingEngine:
         if not nonprofits:
             return []
         
-        # Analyze and score each nonprofit
-        scored_nonprofits = []
-        for nonprofit in nonprofits:
-            try:
-                # Calculate mission alignment
-                nonprofit.mission_alignment = self.mission_analyzer.analyze_alignment(nonprofit)
-                
-                # Calculate ROI
-                nonprofit.partnership_roi = self.roi_calculator.calculate_roi(nonprofit)
-                
-                # Calculate overall score
-                overall_score = self._calculate_overall_score(nonprofit)
-                nonprofit.overall_score = overall_score
-                
-                scored_nonprofits.append(nonprofit)
-                
-            except Exception as e:
-                logger.error(f"Error scoring nonprofit {nonprofit.name}: {e}")
-                nonprofit.overall_score = 0
-                scored_nonprofits.append(nonprofit)
+        components = self._score_matrix(nonprofits)
+        with self._ranking_lock:
+            return self._assign_ranks(list(nonprofits), components)
+    
+    def _score_matrix(self, nonprofits: List[Nonprofit], cached: bool = True) -> np.ndarray:
+        """
+        Analyze every nonprofit and return its criterion scores as the rows
+        of an (N, 5) matrix, columns in SCORE_COMPONENTS order
+        """
+        self._attach_analyses(nonprofits, cached)
+        return self._score_components(nonprofits)
+    
+    def _attach_analyses(self, nonprofits: List[Nonprofit], cached: bool = True):
+        """
+        Scoring phase one: set mission_alignment and partnership_roi on every
+        nonprofit. Each analyzer runs once over the whole list (unchanged
+        records come from the cache unless `cached` is False); if a batch
+        fails, records are analyzed one at a time so a bad record is isolated,
+        and one whose analysis fails is left with None.
+        """
+        alignments = self._analyze_batch(
+            self._alignment_cache, nonprofits, self.mission_analyzer.analyze_alignment_batch,
+            cached, "mission alignment"
+        )
+        rois = self._analyze_batch(
+            self._roi_cache, nonprofits, self.roi_calculator.calculate_roi_batch,
+            cached, "ROI calculation"
+        )
+        
+        for nonprofit, alignment, roi in zip(nonprofits, alignments, rois):
+            # Calculate mission alignment
+            nonprofit.mission_alignment = alignment or self._analyze_one(
+                self.mission_analyzer.analyze_alignment, nonprofit, "Mission alignment"
+            )
+            
+            # Calculate ROI
+            nonprofit.partnership_roi = roi or self._analyze_one(
+                self.roi_calculator.calculate_roi, nonprofit, "ROI calculation"
+            )
+    
+    def update_weights(self, criteria: RankingCriteria) -> List[Nonprofit]:
+        """
+        Switch to new criteria and re-rank the last rank_nonprofits result.
+        Only the weighted sum and the sort are redone; no analyzer is called.
+        """
+        with self._ranking_lock:
+            self.criteria = criteria
+            if self._last_ranking is None:
+                return []
+            return self._assign_ranks(self._last_ranking.nonprofits, self._last_ranking.components)
+    
+    def update_nonprofit(self, nonprofit: Nonprofit) -> List[Nonprofit]:
+        """
+        Re-score one nonprofit from the last rank_nonprofits result (matched by
+        EIN) and move it to its new place; only the rankings between its old
+        and new positions change
+        """
+        with self._ranking_lock:
+            state = self._last_ranking
+            row = state.rows.get(nonprofit.ein) if state else None
+            if row is None:
+                raise KeyError(f"{nonprofit.ein} is not in the last ranking")
+            
+            self._attach_analyses([nonprofit], cached=False)
+            state.components[row] = self._score_components([nonprofit])[0]
+            state.nonprofits[row] = nonprofit
+            nonprofit.overall_score = float((state.components[row] * self._weights).sum())
+            
+            # Take the old sort key out and insert the new one; keys are
+            # (-score, row), so the order matches a full stable re-sort
+            old_position = bisect_left(state.keys, (-state.scores[row], row))
+            del state.keys[old_position]
+            del state.ranked[old_position]
+            state.scores[row] = nonprofit.overall_score
+            new_position = bisect_left(state.keys, (-nonprofit.overall_score, row))
+            state.keys.insert(new_position, (-nonprofit.overall_score, row))
+            state.ranked.insert(new_position, nonprofit)
+            
+            for position in range(min(old_position, new_position), max(old_position, new_position) + 1):
+                state.ranked[position].ranking = position + 1
+            return list(state.ranked)
+    
+    def _analyze_cached(self, cache: OrderedDict, nonprofits: List[Nonprofit],
+                        analyze_batch: Callable[[List[Nonprofit]], list]) -> list:
+        """
+        analyze_batch results for each nonprofit, served from cache where the
+        record is unchanged since it was analyzed; only the misses go to
+        analyze_batch, in one call
+        """
+        keys = [(nonprofit.ein, nonprofit.last_updated) for nonprofit in nonprofits]
+        with self._analysis_cache_lock:
+            results = [cache.get(key) for key in keys]
+            for key, result in zip(keys, results):
+                if result is not None:
+                    cache.move_to_end(key)
         
-        # Sort by score (highest first)
-        scored_nonprofits.sort(key=lambda x: x.overall_score, reverse=True)
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            fresh = analyze_batch([nonprofits[i] for i in missing])
+            with self._analysis_cache_lock:
+                for i, result in zip(missing, fresh):
+                    results[i] = cache[keys[i]] = result
+                while len(cache) > ANALYSIS_CACHE_SIZE:
+                    cache.popitem(last=False)
         
-        # Assign rankings
-        for rank, nonprofit in enumerate(scored_nonprofits, 1):
+        return results
+    
+    def _analyze_batch(self, cache: OrderedDict, nonprofits: List[Nonprofit],
+                       analyze_batch: Callable[[List[Nonprofit]], list],
+                       cached: bool, what: str) -> list:
+        """analyze_batch over the list (through _analyze_cached if cached), or all None if it fails"""
+        try:
+            if cached:
+                return self._analyze_cached(cache, nonprofits, analyze_batch)
+            return analyze_batch(nonprofits)
+        except Exception as e:
+            logger.error(f"Batch {what} failed, scoring individually: {e}")
+            return [None] * len(nonprofits)
+    
+    @staticmethod
+    def _analyze_one(analyze: Callable[[Nonprofit], Any], nonprofit: Nonprofit, what: str):
+        """analyze(nonprofit), or None if it fails"""
+        try:
+            return analyze(nonprofit)
+        except Exception as e:
+            logger.error(f"{what} failed for {nonprofit.name}: {e}")
+            return None
+    
+    def _assign_ranks(self, nonprofits: List[Nonprofit], components: np.ndarray) -> List[Nonprofit]:
+        """
+        Weight the score matrix, set overall_score and ranking on every
+        nonprofit, and keep the result for update_weights/update_nonprofit.
+        Call with _ranking_lock held.
+        """
+        # Weighted overall scores for every row at once; a row-wise sum rather
+        # than a BLAS matrix-vector product, so one re-scored row rounds the same
+        overall_scores = (components * self._weights).sum(axis=1)
+        
+        # Sort by score (highest first); stable, so ties keep their input order
+        order = np.argsort(-overall_scores, kind='stable').tolist()
+        
+        scored_nonprofits = []
+        overall_scores = overall_scores.tolist()
+        for rank, index in enumerate(order, 1):
+            nonprofit = nonprofits[index]
+            nonprofit.overall_score = overall_scores[index]
             nonprofit.ranking = rank
+            scored_nonprofits.append(nonprofit)
+        
+        self._last_ranking = _RankingState(
+            nonprofits=nonprofits,
+            components=components,
+            scores=overall_scores,
+            rows={nonprofit.ein: row for row, nonprofit in enumerate(nonprofits)},
+            keys=[(-overall_scores[index], index) for index in order],
+            ranked=list(scored_nonprofits)
+        )
         
         return scored_nonprofits
     
-    def _calculate_overall_score(self, nonprofit: Nonprofit) -> float:
+    def _score_components(self, nonprofits: List[Nonprofit]) -> np.ndarray:
         """
-        Calculate weighted overall score
+        Scoring phase two: criterion scores of analyzed nonprofits as an
+        (N, 5) matrix, columns in SCORE_COMPONENTS order, each 0-1. Only
+        numbers are read here, so there is no per-record error handling;
+        anything missing or unscorable counts as 0.
         """
-        scores = {}
+        stabilities, capacities = self._financial_scores(nonprofits)
         
         # Mission alignment score
-        if nonprofit.mission_alignment:
-            scores['mission'] = nonprofit.mission_alignment.score
-        else:
-            scores['mission'] = 0
+        mission = np.array([
+            nonprofit.mission_alignment.score if nonprofit.mission_alignment else 0.0
+            for nonprofit in nonprofits
+        ], dtype=np.float64)
         
         # ROI score (normalize to 0-1)
-        if nonprofit.partnership_roi:
-            roi_ratio = nonprofit.partnership_roi.estimated_value / 100000  # Normalize by $100k
-            scores['roi'] = min(1.0, roi_ratio)
-        else:
-            scores['roi'] = 0
+        roi_value = np.array([
+            nonprofit.partnership_roi.estimated_value if nonprofit.partnership_roi else 0.0
+            for nonprofit in nonprofits
+        ], dtype=np.float64)
+        roi = np.minimum(roi_value / 100000, 1.0)  # Normalize by $100k
         
-        # Stability score
-        scores['stability'] = nonprofit.calculate_stability_score()
+        data_quality = np.array([nonprofit.data_quality_score for nonprofit in nonprofits], dtype=np.float64)
         
-        # Capacity score
-        scores['capacity'] = self._calculate_capacity_score(nonprofit)
+        components = np.column_stack((mission, roi, stabilities, capacities, data_quality))
+        np.nan_to_num(components, copy=False)
         
-        # Data quality score
-        scores['data_quality'] = nonprofit.data_quality_score
+        # Kept for explain_ranking, compare_nonprofits and the report
+        for nonprofit, stability, capacity in zip(nonprofits, components[:, 2].tolist(), components[:, 3].tolist()):
+            nonprofit.stability_score = stability
+            nonprofit.capacity_score = capacity
         
-        # Apply weights
-        weighted_score = (
-            scores['mission'] * self.criteria.mission_weight +
-            scores['roi'] * self.criteria.roi_weight +
-            scores['stability'] * self.criteria.stability_weight +
-            scores['capacity'] * self.criteria.capacity_weight +
-            scores['data_quality'] * self.criteria.data_quality_weight
-        )
-        
-        return weighted_score
+        return components
+    
+    def _calculate_overall_score(self, nonprofit: Nonprofit) -> float:
+        """
+        Calculate weighted overall score
+        """
+        return float((self._score_components([nonprofit])[0] * self._weights).sum())
     
     def _calculate_capacity_score(self, nonprofit: Nonprofit) -> float:
         """
@@ -133,55 +332,207 @@ class NonprofitRankingEngine:
             
             # Growth indicator
             if len(nonprofit.financial_history) >= 3:
-                revenues = [f.total_revenue for f in nonprofit.financial_history[-3:]]
-                if all(revenues[i] <= revenues[i+1] for i in range(len(revenues)-1)):
+                oldest, middle, newest = nonprofit.financial_history[-3:]
+                if oldest.total_revenue <= middle.total_revenue <= newest.total_revenue:
                     score += 0.1  # Consistent growth
         
         return min(1.0, score)
     
+    def _financial_scores(self, nonprofits: List[Nonprofit]) -> Tuple[List[float], List[float]]:
+        """
+        Stability and capacity scores, vectorized over the list; if that
+        fails, scored one record at a time, with NaN for records that fail
+        """
+        try:
+            return self._financial_scores_batch(nonprofits)
+        except Exception as e:
+            logger.error(f"Batch financial scoring failed, scoring individually: {e}")
+        
+        stabilities, capacities = [], []
+        for nonprofit in nonprofits:
+            try:
+                stability = nonprofit.calculate_stability_score()
+                capacity = self._calculate_capacity_score(nonprofit)
+            except Exception as e:
+                logger.error(f"Financial scoring failed for {nonprofit.name}: {e}")
+                stability = capacity = np.nan
+            stabilities.append(stability)
+            capacities.append(capacity)
+        return stabilities, capacities
+    
+    def _financial_scores_batch(self, nonprofits: List[Nonprofit]) -> Tuple[List[float], List[float]]:
+        """
+        Nonprofit.calculate_stability_score and _calculate_capacity_score for
+        a whole list, with each threshold ladder evaluated as np.select over
+        arrays of the latest filings. Bonuses are added in the same order as
+        the scalar versions, so the results are identical.
+        """
+        count = len(nonprofits)
+        filings = np.fromiter((len(n.financial_history) for n in nonprofits), dtype=np.int64, count=count)
+        
+        # Latest filing's revenue, assets, liabilities and program expense
+        # ratio, and the last three revenues (zero where there is no filing)
+        latest_fields = np.zeros((count, 4))
+        recent_revenues = np.zeros((count, 3))
+        for row, nonprofit in enumerate(nonprofits):
+            latest = nonprofit.get_latest_financials()
+            if latest:
+                latest_fields[row] = (latest.total_revenue, latest.total_assets,
+                                      latest.total_liabilities, latest.program_expense_ratio)
+                if filings[row] >= 3:
+                    recent_revenues[row] = [f.total_revenue for f in nonprofit.financial_history[-3:]]
+        revenue, assets, liabilities, efficiency = latest_fields.T
+        
+        # Stability: revenue, asset to liability ratio, program expense ratio
+        with np.errstate(divide='ignore', invalid='ignore'):
+            asset_ratio = assets / liabilities
+        stability = (
+            np.where(revenue > 0, 0.3, 0.0) +
+            np.where(liabilities > 0, np.select([asset_ratio > 2, asset_ratio > 1], [0.3, 0.2], 0.0), 0.0) +
+            efficiency * 0.4
+        )
+        stability = np.where(filings < 2, 0.5, np.minimum(stability, 1.0))
+        
+        # Capacity: size, efficiency and consistent growth bonuses on a 0.5 base
+        growing = (
+            (filings >= 3) &
+            (recent_revenues[:, 0] <= recent_revenues[:, 1]) &
+            (recent_revenues[:, 1] <= recent_revenues[:, 2])
+        )
+        capacity = (
+            0.5 +
+            np.select([revenue > 5000000, revenue > 1000000, revenue > 100000], [0.2, 0.15, 0.1], 0.0) +
+            np.select([efficiency > 0.8, efficiency > 0.7], [0.2, 0.1], 0.0) +
+            np.where(growing, 0.1, 0.0)
+        )
+        capacity = np.minimum(capacity, 1.0)
+        
+        return stability.tolist(), capacity.tolist()
+    
+    def _stored_stability(self, nonprofit: Nonprofit, latest=None) -> float:
+        """Stability score recorded when the nonprofit was scored, else computed now"""
+        if nonprofit.stability_score is not None:
+            return nonprofit.stability_score
+        return nonprofit.calculate_stability_score(latest)
+    
+    def _stored_capacity(self, nonprofit: Nonprofit) -> float:
+        """Capacity score recorded when the nonprofit was scored, else computed now"""
+        if nonprofit.capacity_score is not None:
+            return nonprofit.capacity_score
+        return self._calculate_capacity_score(nonprofit)
+    
     def get_top_partners(self, nonprofits: List[Nonprofit], 
                         top_n: int = 10,
                         min_score: float = 0.5) -> List[Nonprofit]:
         """
         Get top N nonprofits that meet minimum score threshold
+        Every nonprofit gets its overall_score, but only the top N are found
+        (np.partition), put in order and given a ranking
         """
-        ranked = self.rank_nonprofits(nonprofits)
+        if not nonprofits or top_n <= 0:
+            return []
+        
+        components = self._score_matrix(nonprofits)
+        overall_scores = (components * self._weights).sum(axis=1)
+        for nonprofit, overall_score in zip(nonprofits, overall_scores.tolist()):
+            nonprofit.overall_score = overall_score
         
         # Filter by minimum score
-        qualified = [np for np in ranked if np.overall_score >= min_score]
+        qualified = np.flatnonzero(overall_scores >= min_score)
+        
+        # Cut to the top N, keeping everything tied with the Nth score so the
+        # input-order tie-break below matches a full stable sort
+        if len(qualified) > top_n:
+            cutoff = -np.partition(-overall_scores[qualified], top_n - 1)[top_n - 1]
+            qualified = qualified[overall_scores[qualified] >= cutoff]
+        
+        # Highest score first, ties in input order
+        order = qualified[np.lexsort((qualified, -overall_scores[qualified]))][:top_n]
+        
+        top = []
+        for rank, index in enumerate(order.tolist(), 1):
+            nonprofits[index].ranking = rank
+            top.append(nonprofits[index])
+        return top
+    
+    def rank_within_category(self, nonprofits: List[Nonprofit]) -> Dict[Optional[str], List[Nonprofit]]:
+        """
+        Rank nonprofits against others in the same NTEE category (major group
+        and decile, e.g. "B20"). Returns each category's ranked list, keyed by
+        category (None for nonprofits without a usable NTEE code), with
+        ranking set to the position within the category.
+        """
+        if not nonprofits:
+            return {}
+        
+        components = self._score_matrix(nonprofits)
+        overall_scores = (components * self._weights).sum(axis=1)
+        categories = np.fromiter((n.ntee_category for n in nonprofits), dtype=np.int16, count=len(nonprofits))
+        
+        # By category, then highest score first; lexsort is stable, so ties
+        # keep their input order
+        order = np.lexsort((-overall_scores, categories))
+        sorted_categories = categories[order]
+        boundaries = np.flatnonzero(sorted_categories[1:] != sorted_categories[:-1]) + 1
         
-        # Return top N
-        return qualified[:top_n]
+        overall_scores = overall_scores.tolist()
+        ranked = {}
+        for group in np.split(order, boundaries):
+            members = ranked[ntee_category_label(int(categories[group[0]]))] = []
+            for rank, index in enumerate(group.tolist(), 1):
+                nonprofit = nonprofits[index]
+                nonprofit.overall_score = overall_scores[index]
+                nonprofit.ranking = rank
+                members.append(nonprofit)
+        return ranked
     
-    def generate_ranking_report(self, nonprofits: List[Nonprofit]) -> pd.DataFrame:
+    def generate_ranking_report(self, nonprofits: List[Nonprofit]) -> "pd.DataFrame":
         """
         Generate detailed ranking report as DataFrame
         """
-        data = []
-        
-        for np in nonprofits:
-            row = {
-                'Rank': np.ranking,
-                'Name': np.name,
-                'EIN': np.ein,
-                'Overall Score': f"{np.overall_score:.1%}" if np.overall_score else "0%",
-                'Mission Alignment': f"{np.mission_alignment.score:.1%}" if np.mission_alignment else "N/A",
-                'ROI Potential': f"${np.partnership_roi.estimated_value:,.0f}" if np.partnership_roi else "N/A",
-                'Stability': f"{np.calculate_stability_score():.1%}",
-                'Programs': len(np.programs),
-                'Annual Revenue': f"${np.get_latest_financials().total_revenue:,.0f}" if np.get_latest_financials() else "N/A",
-                'Efficiency': f"{np.get_latest_financials().program_expense_ratio:.1%}" if np.get_latest_financials() else "N/A"
-            }
-            data.append(row)
-        
-        df = pd.DataFrame(data)
-        return df
+        # Imported here so ranking alone never loads pandas
+        import pandas as pd
+        
+        # Raw values column by column (NaN where missing), formatted a whole
+        # column at a time below
+        latest = [nonprofit.get_latest_financials() for nonprofit in nonprofits]
+        overall = np.array([nonprofit.overall_score or 0.0 for nonprofit in nonprofits], dtype=np.float64)
+        mission = np.array([
+            nonprofit.mission_alignment.score if nonprofit.mission_alignment else np.nan
+            for nonprofit in nonprofits
+        ], dtype=np.float64)
+        roi = pd.Series([
+            nonprofit.partnership_roi.estimated_value if nonprofit.partnership_roi else np.nan
+            for nonprofit in nonprofits
+        ], dtype=np.float64)
+        stability = np.array([self._stored_stability(nonprofit) for nonprofit in nonprofits], dtype=np.float64)
+        revenue = pd.Series([f.total_revenue if f else np.nan for f in latest], dtype=np.float64)
+        efficiency = np.array([f.program_expense_ratio if f else np.nan for f in latest], dtype=np.float64)
+        
+        return pd.DataFrame({
+            'Rank': [nonprofit.ranking for nonprofit in nonprofits],
+            'Name': [nonprofit.name for nonprofit in nonprofits],
+            'EIN': [nonprofit.ein for nonprofit in nonprofits],
+            'Overall Score': np.where(overall != 0, self._percent(overall), "0%"),
+            'Mission Alignment': np.where(np.isnan(mission), "N/A", self._percent(mission)),
+            'ROI Potential': np.where(roi.isna(), "N/A", roi.map('${:,.0f}'.format)),
+            'Stability': self._percent(stability),
+            'Programs': [len(nonprofit.programs) for nonprofit in nonprofits],
+            'Annual Revenue': np.where(revenue.isna(), "N/A", revenue.map('${:,.0f}'.format)),
+            'Efficiency': np.where(np.isnan(efficiency), "N/A", self._percent(efficiency))
+        })
+    
+    @staticmethod
+    def _percent(values: np.ndarray) -> np.ndarray:
+        """Ratios as percentage strings with one decimal place, the same as the :.1% format"""
+        return np.char.mod('%.1f%%', values * 100)
     
     def explain_ranking(self, nonprofit: Nonprofit) -> str:
         """
         Generate detailed explanation for a nonprofit's ranking
         """
         explanation = []
+        latest_financials = nonprofit.get_latest_financials()
         
         # Header
         explanation.append(f"**{nonprofit.name}** - Rank #{nonprofit.ranking}")
@@ -202,7 +553,7 @@ class NonprofitRankingEngine:
         
         # Financial stability
         explanation.append("**Financial Stability**")
-        stability_score = nonprofit.calculate_stability_score()
+        stability_score = self._stored_stability(nonprofit, latest_financials)
         if stability_score > 0.7:
             explanation.append(f"Strong financial stability ({stability_score:.1%})")
         elif stability_score > 0.5:
@@ -210,7 +561,6 @@ class NonprofitRankingEngine:
         else:
             explanation.append(f"Limited financial data available ({stability_score:.1%})")
         
-        latest_financials = nonprofit.get_latest_financials()
         if latest_financials:
             explanation.append(f"- Revenue: ${latest_financials.total_revenue:,.0f}")
             explanation.append(f"- Program efficiency: {latest_financials.program_expense_ratio:.1%}")
@@ -218,7 +568,7 @@ class NonprofitRankingEngine:
         
         # Organizational capacity
         explanation.append("**Organizational Capacity**")
-        capacity_score = self._calculate_capacity_score(nonprofit)
+        capacity_score = self._stored_capacity(nonprofit)
         if capacity_score > 0.7:
             explanation.append(f"Strong organizational capacity ({capacity_score:.1%})")
         elif capacity_score > 0.5:
@@ -229,7 +579,7 @@ class NonprofitRankingEngine:
         if nonprofit.programs:
             explanation.append(f"- {len(nonprofit.programs)} active programs")
         if nonprofit.social_media:
-            total_reach = sum(sm.followers for sm in nonprofit.social_media)
+            total_reach = nonprofit.total_followers
             explanation.append(f"- Social media reach: {total_reach:,} followers")
         explanation.append("")
         
@@ -251,7 +601,7 @@ class NonprofitRankingEngine:
                 'overall_score': nonprofit1.overall_score,
                 'mission_alignment': nonprofit1.mission_alignment.score if nonprofit1.mission_alignment else 0,
                 'roi_potential': nonprofit1.partnership_roi.estimated_value if nonprofit1.partnership_roi else 0,
-                'stability': nonprofit1.calculate_stability_score(),
+                'stability': self._stored_stability(nonprofit1),
                 'programs': len(nonprofit1.programs)
             },
             'nonprofit2': {
@@ -260,18 +610,37 @@ class NonprofitRankingEngine:
                 'overall_score': nonprofit2.overall_score,
                 'mission_alignment': nonprofit2.mission_alignment.score if nonprofit2.mission_alignment else 0,
                 'roi_potential': nonprofit2.partnership_roi.estimated_value if nonprofit2.partnership_roi else 0,
-                'stability': nonprofit2.calculate_stability_score(),
+                'stability': self._stored_stability(nonprofit2),
                 'programs': len(nonprofit2.programs)
             },
             'recommendation': ''
         }
         
-        # Generate recommendation
-        if nonprofit1.overall_score > nonprofit2.overall_score:
-            diff = (nonprofit1.overall_score - nonprofit2.overall_score) / nonprofit2.overall_score * 100
-            comparison['recommendation'] = f"{nonprofit1.name} scores {diff:.0f}% higher overall"
+        # Generate recommendation; an unscored nonprofit counts as 0, and a
+        # percentage is only given against a non-zero score
+        score1 = nonprofit1.overall_score or 0.0
+        score2 = nonprofit2.overall_score or 0.0
+        if score1 > score2:
+            leader, score, other_score = nonprofit1, score1, score2
+        else:
+            leader, score, other_score = nonprofit2, score2, score1
+        if other_score > 0:
+            diff = (score - other_score) / other_score * 100
+            comparison['recommendation'] = f"{leader.name} scores {diff:.0f}% higher overall"
+        elif score > 0:
+            comparison['recommendation'] = f"{leader.name} scores higher overall"
         else:
-            diff = (nonprofit2.overall_score - nonprofit1.overall_score) / nonprofit1.overall_score * 100
-            comparison['recommendation'] = f"{nonprofit2.name} scores {diff:.0f}% higher overall"
+            comparison['recommendation'] = "Neither nonprofit has an overall score yet"
         
-        return comparison
\ No newline at end of file
+        return comparison
+    
+    def compare_matrix(self, nonprofits: List[Nonprofit]) -> np.ndarray:
+        """
+        Pairwise comparison of overall scores: entry [i, j] is how much higher
+        (in percent, negative if lower) nonprofit i scores than nonprofit j,
+        the figure compare_nonprofits reports. NaN where j has no score.
+        """
+        scores = np.array([nonprofit.overall_score or 0.0 for nonprofit in nonprofits], dtype=np.float64)
+        base = scores[np.newaxis, :]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(base > 0, (scores[:, np.newaxis] - base) / base * 100, np.nan)
\ No newline at end of file
@@ -1,7 +1,50 @@
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Callable, Union
 from enum import Enum
+from operator import attrgetter
+
+
+# Characters of mission text shown before "..." in list views
+MISSION_PREVIEW_LENGTH = 200
+
+# Records built in bulk get __slots__ instead of a per-instance __dict__
+# (dataclass slots need Python 3.10)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+def intern_text(value):
+    """
+    sys.intern for the short codes and names repeated across thousands of
+    records, so they share one string object; anything but a str passes through
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+# ntee_category for nonprofits without a usable NTEE code
+NTEE_UNCATEGORIZED = -1
+
+
+def ntee_category_code(ntee_code: Optional[str]) -> int:
+    """
+    NTEE major group letter and two-digit decile ("B20", "B20Z" -> B20)
+    packed into a small int, letter index * 100 + decile, so codes sort in
+    NTEE order and fit an int16; NTEE_UNCATEGORIZED if missing or malformed
+    """
+    if type(ntee_code) is not str or len(ntee_code) < 3:
+        return NTEE_UNCATEGORIZED
+    letter, decile = ntee_code[0].upper(), ntee_code[1:3]
+    if not ('A' <= letter <= 'Z' and decile.isascii() and decile.isdigit()):
+        return NTEE_UNCATEGORIZED
+    return (ord(letter) - ord('A')) * 100 + int(decile)
+
+
+def ntee_category_label(category: int) -> Optional[str]:
+    """Inverse of ntee_category_code: 120 -> "B20", None for NTEE_UNCATEGORIZED"""
+    if category < 0:
+        return None
+    return f"{chr(ord('A') + category // 100)}{category % 100:02d}"
 
 
 class DataSource(Enum):
@@ -20,7 +63,7 @@ class NonprofitStatus(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Address:
     street: str
     city: str
@@ -29,9 +72,14 @@ class Address:
     country: str = "USA"
     latitude: Optional[float] = None
     longitude: Optional[float] = None
+    
+    def __post_init__(self):
+        self.city = intern_text(self.city)
+        self.state = intern_text(self.state)
+        self.country = intern_text(self.country)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class FinancialData:
     year: int
     total_revenue: float
@@ -44,21 +92,22 @@ class FinancialData:
     fundraising_expenses: float
     source: DataSource = DataSource.IRS_990
     
-    @property
-    def program_expense_ratio(self) -> float:
-        if self.total_expenses > 0:
-            return self.program_expenses / self.total_expenses
-        return 0.0
+    # Derived from the amounts above once, when the record is built (not
+    # cached_property: slotted instances have no __dict__ to cache in)
+    program_expense_ratio: float = field(init=False, compare=False)
+    overhead_ratio: float = field(init=False, compare=False)
     
-    @property
-    def overhead_ratio(self) -> float:
+    def __post_init__(self):
         if self.total_expenses > 0:
+            self.program_expense_ratio = self.program_expenses / self.total_expenses
             overhead = self.administrative_expenses + self.fundraising_expenses
-            return overhead / self.total_expenses
-        return 0.0
+            self.overhead_ratio = overhead / self.total_expenses
+        else:
+            self.program_expense_ratio = 0.0
+            self.overhead_ratio = 0.0
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class SocialMediaPresence:
     platform: str
     handle: str
@@ -67,6 +116,30 @@ class SocialMediaPresence:
     last_post_date: Optional[datetime] = None
     verified: bool = False
     sentiment_score: Optional[float] = None
+    
+    def __post_init__(self):
+        self.platform = intern_text(self.platform)
+
+
+def lazy_text(name: str) -> property:
+    """
+    Text attribute that may be assigned a zero-argument renderer instead of
+    a string; the renderer runs on first read and its result is kept.
+    Lets analyzers skip formatting explanations nobody looks at.
+    """
+    slot = f"_{name}"
+    
+    def getter(self):
+        value = self.__dict__[slot]
+        if callable(value):
+            value = value()
+            self.__dict__[slot] = value
+        return value
+    
+    def setter(self, value):
+        self.__dict__[slot] = value
+    
+    return property(getter, setter)
 
 
 @dataclass
@@ -74,7 +147,7 @@ class MissionAlignment:
     score: float  # 0.0 to 1.0
     matched_keywords: List[str]
     service_overlap: Dict[str, float]
-    explanation: str
+    explanation: Union[str, Callable[[], str]]  # rendered lazily, see lazy_text
     confidence: float
 
 
@@ -85,10 +158,15 @@ class PartnershipROI:
     impact_multiplier: float
     cost_savings: float
     reach_expansion: int
-    explanation: str
+    explanation: Union[str, Callable[[], str]]  # rendered lazily, see lazy_text
 
 
-@dataclass
+# Installed after the dataclass decorator so the property is not taken as a field default
+MissionAlignment.explanation = lazy_text('explanation')
+PartnershipROI.explanation = lazy_text('explanation')
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Nonprofit:
     ein: str  # Employer Identification Number
     name: str
@@ -102,7 +180,7 @@ class Nonprofit:
     ntee_code: Optional[str] = None  # National Taxonomy of Exempt Entities
     
     # Data from various sources
-    financial_history: List[FinancialData] = field(default_factory=list)
+    financial_history: List[FinancialData] = field(default_factory=list)  # sorted by year, oldest first
     social_media: List[SocialMediaPresence] = field(default_factory=list)
     programs: List[str] = field(default_factory=list)
     leadership: List[Dict[str, str]] = field(default_factory=list)
@@ -112,25 +190,80 @@ class Nonprofit:
     partnership_roi: Optional[PartnershipROI] = None
     overall_score: Optional[float] = None
     ranking: Optional[int] = None
+    stability_score: Optional[float] = None  # criterion scores behind overall_score
+    capacity_score: Optional[float] = None
     
     # Metadata
     last_updated: datetime = field(default_factory=datetime.now)
     data_sources: List[DataSource] = field(default_factory=list)
     data_quality_score: float = 0.0
     
+    # Memoized (input, result) pairs for mission_preview, total_followers,
+    # ntee_category and calculate_stability_score
+    _mission_preview: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _ntee_category: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _stability_score: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _total_followers: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.ntee_code = intern_text(self.ntee_code)
+        self.financial_history.sort(key=attrgetter('year'))
+    
+    @property
+    def mission_preview(self) -> Optional[str]:
+        """Mission truncated for list views; recomputed only when the mission text changes"""
+        mission = self.mission_statement
+        cached = self._mission_preview
+        if cached is None or cached[0] is not mission:
+            if mission and len(mission) > MISSION_PREVIEW_LENGTH:
+                preview = mission[:MISSION_PREVIEW_LENGTH] + "..."
+            else:
+                preview = mission
+            cached = self._mission_preview = (mission, preview)
+        return cached[1]
+    
+    @property
+    def total_followers(self) -> int:
+        """Followers across all social media accounts; recomputed when social_media is replaced or grows"""
+        accounts = self.social_media
+        cached = self._total_followers
+        if cached is None or cached[0] is not accounts or cached[1] != len(accounts):
+            total = sum(account.followers for account in accounts)
+            cached = self._total_followers = (accounts, len(accounts), total)
+        return cached[2]
+    
+    @property
+    def ntee_category(self) -> int:
+        """ntee_category_code of ntee_code, for bucketing with numpy; recomputed only when ntee_code changes"""
+        code = self.ntee_code
+        cached = self._ntee_category
+        if cached is None or cached[0] is not code:
+            cached = self._ntee_category = (code, ntee_category_code(code))
+        return cached[1]
+    
+    def add_financials(self, *financials: FinancialData):
+        """Add filings to financial_history, keeping it in year order"""
+        self.financial_history.extend(financials)
+        self.financial_history.sort(key=attrgetter('year'))
+        self._stability_score = None
+    
     def get_latest_financials(self) -> Optional[FinancialData]:
-        if self.financial_history:
-            return max(self.financial_history, key=lambda x: x.year)
-        return None
+        # financial_history is kept oldest-first, so the latest filing is last
+        return self.financial_history[-1] if self.financial_history else None
     
-    def calculate_stability_score(self) -> float:
+    def calculate_stability_score(self, latest: Optional[FinancialData] = None) -> float:
+        # Callers that already looked up the latest financials can pass them in
         if len(self.financial_history) < 2:
             return 0.5
         
-        latest = self.get_latest_financials()
+        latest = latest or self.get_latest_financials()
         if not latest:
             return 0.5
         
+        cached = self._stability_score
+        if cached is not None and cached[0] is latest:
+            return cached[1]
+        
         score = 0.0
         
         # Revenue stability
@@ -148,4 +281,6 @@ class Nonprofit:
         # Program expense ratio
         score += latest.program_expense_ratio * 0.4
         
-        return min(score, 1.0)
\ No newline at end of file
+        score = min(score, 1.0)
+        self._stability_score = (latest, score)
+        return score
\ No newline at end of file
@@ -0,0 +1,10 @@
+"""
+WSGI entry point for the real-data Flask app
+
+    gunicorn -k gevent -w 4 --worker-connections 1000 -b 0.0.0.0:5000 wsgi:application
+
+Don't pass --preload: each worker should import the app itself so its
+pooled requests.Session is created after the fork, not shared across workers.
+"""
+
+from real_data_app import app as application